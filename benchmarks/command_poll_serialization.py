@@ -0,0 +1,94 @@
+"""
+Command poll response serialization benchmark
+
+Compares the per-poll CPU cost of producing a FIFO poll response body:
+- response model path: build a dict per command, validate it through
+  FIFOCommandPollingResponse and encode it the way FastAPI does for a
+  declared response_model
+- pre-serialized path: join each command's cached wire payload bytes
+  (serialized once at submit time) with build_polling_response_body
+
+Usage:
+    python -m benchmarks.command_poll_serialization
+    python -m benchmarks.command_poll_serialization --batch-sizes 1 50 --polls 5000
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from public_tunnel.models.command import Command
+from public_tunnel.models.session import FIFOCommandPollingResponse
+from public_tunnel.routers.fifo_command_polling import build_polling_response_body
+
+SESSION_ID = "bench-session"
+CLIENT_ID = "bench-client"
+
+
+def build_via_response_model(commands: List[Command]) -> bytes:
+    """Serialize a poll response through the declared response model"""
+    command_dicts = [
+        {
+            "command_id": command.command_id,
+            "content": command.content,
+            "target_client": command.target_client,
+            "session_id": command.session_id,
+            "priority": command.priority.value,
+            "delivery_count": command.delivery_count
+        }
+        for command in commands
+    ]
+    response = FIFOCommandPollingResponse(
+        session_id=SESSION_ID,
+        client_id=CLIENT_ID,
+        command=command_dicts[0],
+        commands=command_dicts,
+        queue_position=0,
+        total_queue_size=0
+    )
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_via_wire_payload(commands: List[Command]) -> bytes:
+    """Serialize a poll response from cached wire payloads"""
+    return build_polling_response_body(SESSION_ID, CLIENT_ID, commands, 0)
+
+
+def measure(build_response: Callable[[List[Command]], bytes], commands: List[Command], poll_count: int) -> float:
+    """Return microseconds spent per poll response"""
+    started_at = time.perf_counter()
+    for _ in range(poll_count):
+        build_response(commands)
+    return (time.perf_counter() - started_at) / poll_count * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--polls", type=int, default=20_000, help="Poll responses built per measurement")
+    args = parser.parse_args()
+    
+    print(f"{'batch':>6} {'response model us':>18} {'pre-serialized us':>18} {'speedup':>8}")
+    for batch_size in args.batch_sizes:
+        commands = [
+            Command(
+                command_id=f"cmd-{index:08d}",
+                content=f"ls -la /var/log/app-{index} | grep 'ERROR' | tail -n 20",
+                target_client=CLIENT_ID,
+                session_id=SESSION_ID
+            )
+            for index in range(batch_size)
+        ]
+        assert json.loads(build_via_response_model(commands)) == json.loads(build_via_wire_payload(commands))
+        
+        poll_count = max(1, args.polls // batch_size)
+        model_us = measure(build_via_response_model, commands, poll_count)
+        wire_us = measure(build_via_wire_payload, commands, poll_count)
+        print(f"{batch_size:>6} {model_us:>18.1f} {wire_us:>18.1f} {model_us / wire_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Command queue event loop lag benchmark
+
+Runs many concurrent long-polling clients (default 10,000) on one asyncio
+event loop, as a uvicorn worker would, while commands are submitted at a
+fixed rate, and measures how late the event loop wakes up a probe task
+(event loop lag) for:
+
+- threaded: InMemoryCommandQueueManager with threading locks. Submissions
+  come from worker threads (like sync endpoints or background workers) that
+  keep the session lock for --hold-us microseconds after submitting (time.sleep
+  releases the GIL, modelling I/O done under the lock); every poll that
+  contends for the lock blocks the entire event loop while it waits.
+- asyncio: AsyncioCommandQueueManager. Submissions run as tasks on the
+  loop, there is no lock to wait for, and waiting polls park on
+  asyncio.Condition.
+
+Limitation: the --hold-us sleep is artificial. The queue code itself is
+pure Python and never keeps the lock while the GIL is released, so most of
+the threaded variant's lag at --hold-us > 0 comes from that sleep, not
+from the manager. The --hold-us 0 row shows what remains without it
+(GIL switching between the loop and the submitter threads). Both are
+reported by default.
+
+Usage:
+    python -m benchmarks.command_queue_event_loop_lag
+    python -m benchmarks.command_queue_event_loop_lag --pollers 10000 --submit-rate 2000 --hold-us 0 200
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import threading
+import time
+from typing import List
+
+from public_tunnel.services.asyncio_command_queue_manager import AsyncioCommandQueueManager
+from public_tunnel.services.command_queue_manager import CommandQueueManager, InMemoryCommandQueueManager
+
+# Interval of the lag probe
+PROBE_INTERVAL_SECONDS = 0.005
+# Granularity of the asyncio submitter's rate limiting
+SUBMIT_TICK_SECONDS = 0.01
+# Long-poll wait of each poll request
+POLL_WAIT_SECONDS = 30.0
+SESSION_ID = "bench-session"
+UNBOUNDED_QUEUE_LIMITS = dict(max_commands_per_client=None, max_commands_per_session=None, max_queued_bytes=None)
+
+
+async def poll_until_stopped(manager: CommandQueueManager, client_id: str, delivered: List[int],
+                             stop_event: threading.Event) -> None:
+    """Long-poll like a client: wait, take a batch, acknowledge it"""
+    # Checked in addition to task cancellation, which asyncio.wait_for may
+    # swallow when the waiter resolves at the same time
+    while not stop_event.is_set():
+        if not await manager.wait_for_command(SESSION_ID, client_id, POLL_WAIT_SECONDS):
+            continue
+        commands, _ = manager.get_next_commands_with_queue_info(SESSION_ID, client_id, 10)
+        for command in commands:
+            manager.acknowledge_command(SESSION_ID, command.command_id)
+        delivered[0] += len(commands)
+
+
+async def probe_event_loop_lag(lag_samples: List[float]) -> None:
+    """Record how much later than requested each sleep returns"""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected_at = loop.time() + PROBE_INTERVAL_SECONDS
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        lag_samples.append(loop.time() - expected_at)
+
+
+def submit_from_threads(manager: CommandQueueManager, client_ids: List[str], submit_rate: float,
+                        thread_count: int, hold_seconds: float,
+                        stop_event: threading.Event) -> List[threading.Thread]:
+    """Start worker threads submitting commands at submit_rate in total"""
+    interval_seconds = thread_count / submit_rate
+    session_lock = manager._get_session_lock(SESSION_ID)
+    
+    def submitter() -> None:
+        next_submit_at = time.perf_counter()
+        while not stop_event.is_set():
+            with session_lock:
+                manager.submit_command_to_target_client(SESSION_ID, random.choice(client_ids), "echo bench")
+                time.sleep(hold_seconds)
+            next_submit_at += interval_seconds
+            time.sleep(max(0.0, next_submit_at - time.perf_counter()))
+    
+    threads = [threading.Thread(target=submitter, daemon=True) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+async def submit_from_loop(manager: CommandQueueManager, client_ids: List[str], submit_rate: float) -> None:
+    """Submit commands at submit_rate from a task on the event loop"""
+    commands_per_tick = max(1, round(submit_rate * SUBMIT_TICK_SECONDS))
+    while True:
+        for _ in range(commands_per_tick):
+            manager.submit_command_to_target_client(SESSION_ID, random.choice(client_ids), "echo bench")
+        await asyncio.sleep(SUBMIT_TICK_SECONDS)
+
+
+async def run_variant(variant: str, args: argparse.Namespace, hold_us: float = 0.0) -> dict:
+    """Run one manager variant and return lag statistics"""
+    if variant == "threaded":
+        manager = InMemoryCommandQueueManager(**UNBOUNDED_QUEUE_LIMITS)
+    else:
+        manager = AsyncioCommandQueueManager(**UNBOUNDED_QUEUE_LIMITS)
+    
+    client_ids = [f"bench-client-{index}" for index in range(args.pollers)]
+    delivered = [0]
+    lag_samples: List[float] = []
+    
+    stop_event = threading.Event()
+    
+    tasks = [
+        asyncio.create_task(poll_until_stopped(manager, client_id, delivered, stop_event))
+        for client_id in client_ids
+    ]
+    # Let every poller park before measuring
+    await asyncio.sleep(1.0)
+    tasks.append(asyncio.create_task(probe_event_loop_lag(lag_samples)))
+    
+    submitter_threads = []
+    if variant == "threaded":
+        submitter_threads = submit_from_threads(
+            manager, client_ids, args.submit_rate, args.submit_threads, hold_us / 1_000_000, stop_event
+        )
+    else:
+        tasks.append(asyncio.create_task(submit_from_loop(manager, client_ids, args.submit_rate)))
+    
+    await asyncio.sleep(args.duration)
+    
+    stop_event.set()
+    for thread in submitter_threads:
+        thread.join()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    
+    lag_milliseconds = sorted(sample * 1000 for sample in lag_samples)
+    return {
+        "p50": statistics.median(lag_milliseconds),
+        "p99": lag_milliseconds[int(len(lag_milliseconds) * 0.99) - 1],
+        "max": lag_milliseconds[-1],
+        "delivered_per_second": delivered[0] / args.duration,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pollers", type=int, default=10_000, help="Concurrent long-polling clients")
+    parser.add_argument("--submit-rate", type=float, default=2_000.0, help="Submitted commands per second")
+    parser.add_argument("--submit-threads", type=int, default=4, help="Submitter threads (threaded variant)")
+    parser.add_argument(
+        "--hold-us", type=float, nargs="+", default=[0.0, 200.0],
+        help="Microseconds each critical section holds its lock (threaded variant, 0: queue code only)"
+    )
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement")
+    args = parser.parse_args()
+    
+    print(f"{'variant':>9} {'hold us':>7} {'lag p50 ms':>11} {'lag p99 ms':>11} {'lag max ms':>11} {'delivered/s':>12}")
+    runs = [("threaded", hold_us) for hold_us in args.hold_us] + [("asyncio", 0.0)]
+    for variant, hold_us in runs:
+        stats = asyncio.run(run_variant(variant, args, hold_us))
+        print(
+            f"{variant:>9} {hold_us:>7.0f} {stats['p50']:>11.2f} {stats['p99']:>11.2f} {stats['max']:>11.2f} "
+            f"{stats['delivered_per_second']:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
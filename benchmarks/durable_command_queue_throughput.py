@@ -0,0 +1,129 @@
+"""
+Durable command queue submit throughput benchmark
+
+Compares concurrent command submission throughput of:
+- the in-memory CommandQueueManager (no durability)
+- DurableCommandQueueManager with group commit (one fsync per batch)
+- DurableCommandQueueManager fsyncing every record inline
+
+Each submitter drives its own session, so the difference between the two
+durable variants is the cost of fsync per record versus fsync per batch of
+concurrently submitted records.
+
+Modes:
+- event-loop (default): submitters are coroutines on one asyncio loop that
+  await wait_until_durable, as the submit endpoints do in the server
+- threads: submitters are threads blocking in wait_until_durable_blocking
+
+Usage:
+    python -m benchmarks.durable_command_queue_throughput
+    python -m benchmarks.durable_command_queue_throughput --submitters 1 8 32 --duration 2 --mode threads
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+from public_tunnel.services.command_queue_manager import CommandQueueManager, InMemoryCommandQueueManager
+from public_tunnel.services.durable_command_queue_manager import DurableCommandQueueManager
+
+# Submitters never dequeue, so the default queue limits would reject them within a second
+UNBOUNDED_QUEUE_LIMITS = dict(max_commands_per_client=None, max_commands_per_session=None, max_queued_bytes=None)
+
+
+def run_workload(manager: CommandQueueManager, submitter_count: int, duration_seconds: float) -> float:
+    """Run concurrent submitter threads and return submitted commands per second"""
+    stop_event = threading.Event()
+    submission_counts: List[int] = [0] * submitter_count
+    
+    def submitter(submitter_index: int) -> None:
+        session_id = f"bench-session-{submitter_index}"
+        client_id = f"bench-client-{submitter_index}"
+        submissions = 0
+        while not stop_event.is_set():
+            command = manager.submit_command_to_target_client(session_id, client_id, "echo bench")
+            manager.wait_until_durable_blocking([command])
+            submissions += 1
+        submission_counts[submitter_index] = submissions
+    
+    submitters = [threading.Thread(target=submitter, args=(index,)) for index in range(submitter_count)]
+    started_at = time.perf_counter()
+    for thread in submitters:
+        thread.start()
+    time.sleep(duration_seconds)
+    stop_event.set()
+    for thread in submitters:
+        thread.join()
+    elapsed = time.perf_counter() - started_at
+    
+    return sum(submission_counts) / elapsed
+
+
+async def run_event_loop_workload(manager: CommandQueueManager, submitter_count: int, duration_seconds: float) -> float:
+    """Run concurrent submitter coroutines on this event loop and return submitted commands per second"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration_seconds
+    
+    async def submitter(submitter_index: int) -> int:
+        session_id = f"bench-session-{submitter_index}"
+        client_id = f"bench-client-{submitter_index}"
+        submissions = 0
+        while loop.time() < deadline:
+            command = manager.submit_command_to_target_client(session_id, client_id, "echo bench")
+            await manager.wait_until_durable([command])
+            submissions += 1
+            if submissions % 100 == 0:
+                # The in-memory manager never suspends; let the other submitters run
+                await asyncio.sleep(0)
+        return submissions
+    
+    started_at = time.perf_counter()
+    submission_counts = await asyncio.gather(*(submitter(index) for index in range(submitter_count)))
+    elapsed = time.perf_counter() - started_at
+    
+    return sum(submission_counts) / elapsed
+
+
+def measure(manager_factory: Callable[[str], CommandQueueManager], submitter_count: int, duration_seconds: float,
+            mode: str) -> float:
+    """Measure one manager variant against a fresh write-ahead log directory"""
+    with tempfile.TemporaryDirectory() as log_directory:
+        manager = manager_factory(os.path.join(log_directory, "command-queue.wal"))
+        try:
+            if mode == "threads":
+                return run_workload(manager, submitter_count, duration_seconds)
+            return asyncio.run(run_event_loop_workload(manager, submitter_count, duration_seconds))
+        finally:
+            manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submitters", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--duration", type=float, default=1.0, help="Seconds per measurement")
+    parser.add_argument("--mode", choices=["event-loop", "threads"], default="event-loop")
+    args = parser.parse_args()
+    
+    variants = {
+        "in-memory": lambda log_path: InMemoryCommandQueueManager(**UNBOUNDED_QUEUE_LIMITS),
+        "wal group commit": lambda log_path: DurableCommandQueueManager(log_path, **UNBOUNDED_QUEUE_LIMITS),
+        "wal fsync/record": lambda log_path: DurableCommandQueueManager(
+            log_path, group_commit=False, **UNBOUNDED_QUEUE_LIMITS
+        ),
+    }
+    
+    header = f"{'submitters':>10}" + "".join(f" {name + ' ops/s':>22}" for name in variants)
+    print(header)
+    for submitter_count in args.submitters:
+        row = f"{submitter_count:>10}"
+        for manager_factory in variants.values():
+            row += f" {measure(manager_factory, submitter_count, args.duration, args.mode):>22,.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
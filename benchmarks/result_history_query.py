@@ -0,0 +1,83 @@
+"""
+Session command history query benchmark
+
+Measures the latency of listing one session's command history as the total
+number of retained results in the process grows:
+- full scan: walk every stored result and keep the session's (the previous
+  get_command_ids_by_session implementation)
+- session index: InMemoryExecutionResultManager.get_command_ids_by_session
+  and query_command_ids(client_id=...) served from the secondary indexes
+
+Every session holds the same number of results, so an indexed query should
+cost the same at every total result count.
+
+Usage:
+    python -m benchmarks.result_history_query
+    python -m benchmarks.result_history_query --totals 10000 1000000 --results-per-session 50
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from public_tunnel.models.execution_result import ExecutionResultStatus
+from public_tunnel.models.sortable_id import generate_sortable_id
+from public_tunnel.services.execution_result_manager import InMemoryExecutionResultManager
+
+CLIENTS_PER_SESSION = 5
+
+
+def fill_results(manager: InMemoryExecutionResultManager, total_results: int, results_per_session: int) -> None:
+    """Store total_results results spread over sessions of results_per_session each"""
+    for result_index in range(total_results):
+        session_index = result_index // results_per_session
+        manager.create_and_store_result(
+            command_id=generate_sortable_id(),
+            session_id=f"bench-session-{session_index}",
+            client_id=f"bench-client-{result_index % CLIENTS_PER_SESSION}",
+            execution_status=ExecutionResultStatus.COMPLETED
+        )
+
+
+def scan_command_ids_by_session(manager: InMemoryExecutionResultManager, session_id: str) -> List[str]:
+    """History query without an index: walk every stored result"""
+    return [
+        command_id
+        for command_id, result in manager._results.items()
+        if result.session_id == session_id
+    ]
+
+
+def measure(query: Callable[[], List[str]], query_count: int) -> float:
+    """Return microseconds spent per history query"""
+    started_at = time.perf_counter()
+    for _ in range(query_count):
+        query()
+    return (time.perf_counter() - started_at) / query_count * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--totals", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--results-per-session", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=2_000, help="Indexed queries per measurement")
+    args = parser.parse_args()
+    
+    print(f"{'total results':>14} {'full scan us':>13} {'session index us':>17} {'client index us':>16}")
+    for total_results in args.totals:
+        manager = InMemoryExecutionResultManager(max_results=total_results, max_result_bytes=1 << 40)
+        fill_results(manager, total_results, args.results_per_session)
+        session_id = "bench-session-0"
+        assert scan_command_ids_by_session(manager, session_id) == manager.get_command_ids_by_session(session_id)
+        
+        scan_us = measure(lambda: scan_command_ids_by_session(manager, session_id), max(1, args.queries // 200))
+        session_index_us = measure(lambda: manager.get_command_ids_by_session(session_id), args.queries)
+        client_index_us = measure(
+            lambda: manager.query_command_ids(session_id, client_id="bench-client-0"),
+            args.queries
+        )
+        print(f"{total_results:>14,} {scan_us:>13.1f} {session_index_us:>17.1f} {client_index_us:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Finished result query serialization benchmark
+
+Compares the per-query CPU cost of producing the body of
+GET /api/sessions/{session_id}/results/{command_id} for a finished result:
+- response model path: build UnifiedResultQueryResponse with
+  to_unified_response() and encode it the way FastAPI does for a declared
+  response_model (what every query paid before)
+- cached path: ExecutionResult.get_serialized_response(), which serializes a
+  finished result once and returns the cached bytes and ETag afterwards
+
+Usage:
+    python -m benchmarks.result_query_serialization
+    python -m benchmarks.result_query_serialization --content-sizes 100 100000 --queries 5000
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from public_tunnel.models.execution_result import ExecutionResult, ExecutionResultStatus
+
+SESSION_ID = "bench-session"
+CLIENT_ID = "bench-client"
+
+
+def build_via_response_model(result: ExecutionResult) -> bytes:
+    """Serialize a result query response through the declared response model"""
+    response = result.to_unified_response()
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_via_cached_response(result: ExecutionResult) -> bytes:
+    """Serialize a result query response from the per-result cache"""
+    return result.get_serialized_response()[0]
+
+
+def measure(build_response: Callable[[ExecutionResult], bytes], result: ExecutionResult, query_count: int) -> float:
+    """Return microseconds spent per query response"""
+    started_at = time.perf_counter()
+    for _ in range(query_count):
+        build_response(result)
+    return (time.perf_counter() - started_at) / query_count * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--content-sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=20_000, help="Query responses built per measurement")
+    args = parser.parse_args()
+    
+    print(f"{'content bytes':>14} {'response model us':>18} {'cached us':>10} {'speedup':>8}")
+    for content_size in args.content_sizes:
+        result = ExecutionResult(
+            command_id="cmd-00000001",
+            session_id=SESSION_ID,
+            client_id=CLIENT_ID,
+            execution_status=ExecutionResultStatus.COMPLETED
+        )
+        result.result_content = "x" * content_size
+        assert json.loads(build_via_response_model(result)) == json.loads(build_via_cached_response(result))
+        
+        query_count = max(1, args.queries * 100 // max(content_size, 100))
+        model_us = measure(build_via_response_model, result, query_count)
+        cached_us = measure(build_via_cached_response, result, query_count)
+        print(f"{content_size:>14} {model_us:>18.1f} {cached_us:>10.2f} {model_us / cached_us:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
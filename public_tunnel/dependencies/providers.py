@@ -105,13 +105,35 @@ def get_command_queue_manager():
     Returns:
         CommandQueueManager: Command queue management service instance
         
-    Note: US-006 implementation - manages targeted command queues
+    Note: US-006 implementation - manages targeted command queues.
+    Set PUBLIC_TUNNEL_COMMAND_QUEUE_WAL_PATH to journal queues to a
+    write-ahead log so queued commands survive restarts.
+    Queue limits can be set with PUBLIC_TUNNEL_MAX_COMMANDS_PER_CLIENT,
+    PUBLIC_TUNNEL_MAX_COMMANDS_PER_SESSION and PUBLIC_TUNNEL_MAX_QUEUED_COMMAND_BYTES.
     """
     from public_tunnel.services.command_queue_manager import InMemoryCommandQueueManager
+    from public_tunnel.services.durable_command_queue_manager import DurableCommandQueueManager
+    import os
     
     # Global singleton instance for development/testing
     if not hasattr(get_command_queue_manager, '_instance'):
-        get_command_queue_manager._instance = InMemoryCommandQueueManager()
+        queue_limits = {}
+        for limit_name, environment_variable in (
+            ("max_commands_per_client", "PUBLIC_TUNNEL_MAX_COMMANDS_PER_CLIENT"),
+            ("max_commands_per_session", "PUBLIC_TUNNEL_MAX_COMMANDS_PER_SESSION"),
+            ("max_queued_bytes", "PUBLIC_TUNNEL_MAX_QUEUED_COMMAND_BYTES"),
+        ):
+            if os.getenv(environment_variable):
+                queue_limits[limit_name] = int(os.getenv(environment_variable))
+        
+        write_ahead_log_path = os.getenv("PUBLIC_TUNNEL_COMMAND_QUEUE_WAL_PATH")
+        if write_ahead_log_path:
+            get_command_queue_manager._instance = DurableCommandQueueManager(
+                log_path=write_ahead_log_path,
+                **queue_limits
+            )
+        else:
+            get_command_queue_manager._instance = InMemoryCommandQueueManager(**queue_limits)
     
     return get_command_queue_manager._instance
 
@@ -182,17 +204,140 @@ def get_execution_result_manager():
     Returns:
         ExecutionResultManager: Execution result management service instance
         
-    Note: US-021 implementation - manages unified result storage and query
+    Note: US-021 implementation - manages unified result storage and query.
+    Retention can be set with PUBLIC_TUNNEL_MAX_RESULTS, PUBLIC_TUNNEL_MAX_RESULT_BYTES
+    and PUBLIC_TUNNEL_RESULT_TTL_SECONDS. Result bodies larger than
+    PUBLIC_TUNNEL_RESULT_SPILL_THRESHOLD_BYTES (default 1 MiB) are written to
+    PUBLIC_TUNNEL_RESULT_SPILL_DIR (default: a new temporary directory).
     """
     from public_tunnel.services.execution_result_manager import InMemoryExecutionResultManager
+    from public_tunnel.services.result_body_store import DiskResultBodyStore
+    import os
     
     # Global singleton instance for development/testing
     if not hasattr(get_execution_result_manager, '_instance'):
-        get_execution_result_manager._instance = InMemoryExecutionResultManager()
+        retention_limits = {}
+        for limit_name, environment_variable, limit_type in (
+            ("max_results", "PUBLIC_TUNNEL_MAX_RESULTS", int),
+            ("max_result_bytes", "PUBLIC_TUNNEL_MAX_RESULT_BYTES", int),
+            ("result_ttl_seconds", "PUBLIC_TUNNEL_RESULT_TTL_SECONDS", float),
+        ):
+            if os.getenv(environment_variable):
+                retention_limits[limit_name] = limit_type(os.getenv(environment_variable))
+        
+        body_store_options = {}
+        if os.getenv("PUBLIC_TUNNEL_RESULT_SPILL_THRESHOLD_BYTES"):
+            body_store_options["spill_threshold_bytes"] = int(os.getenv("PUBLIC_TUNNEL_RESULT_SPILL_THRESHOLD_BYTES"))
+        result_body_store = DiskResultBodyStore(
+            directory=os.getenv("PUBLIC_TUNNEL_RESULT_SPILL_DIR"),
+            **body_store_options
+        )
+        get_execution_result_manager._instance = InMemoryExecutionResultManager(
+            result_body_store=result_body_store,
+            **retention_limits
+        )
     
     return get_execution_result_manager._instance
 
 
+def get_command_expiry_scheduler():
+    """Provide unified Command Expiry Scheduler service
+    
+    Returns the same CommandExpiryScheduler instance across all routers.
+    Bound to the shared command queue manager and execution result manager;
+    commands restored by a durable queue manager are scheduled on creation.
+    
+    Returns:
+        CommandExpiryScheduler: Command timeout enforcement service instance
+        
+    Note: Enforces timeout_seconds of submitted commands
+    """
+    from public_tunnel.services.command_expiry_scheduler import CommandExpiryScheduler
+    
+    # Global singleton instance for development/testing
+    if not hasattr(get_command_expiry_scheduler, '_instance'):
+        command_queue_manager = get_command_queue_manager()
+        scheduler = CommandExpiryScheduler(
+            command_queue_manager=command_queue_manager,
+            execution_result_manager=get_execution_result_manager()
+        )
+        for command in command_queue_manager.get_expiring_commands():
+            scheduler.schedule_command_expiry(command)
+        get_command_expiry_scheduler._instance = scheduler
+    
+    return get_command_expiry_scheduler._instance
+
+
+def get_idempotency_key_index():
+    """Provide unified Idempotency Key Index service
+    
+    Returns the same IdempotencyKeyIndex instance across all routers.
+    Can be easily overridden in conftest.py for testing.
+    
+    Returns:
+        IdempotencyKeyIndex: Submission deduplication service instance
+        
+    Note: Limits can be set with PUBLIC_TUNNEL_IDEMPOTENCY_KEY_TTL_SECONDS,
+    PUBLIC_TUNNEL_MAX_IDEMPOTENCY_KEYS and PUBLIC_TUNNEL_MAX_IDEMPOTENCY_KEY_BYTES.
+    """
+    from public_tunnel.services.idempotency_key_index import IdempotencyKeyIndex
+    import os
+    
+    # Global singleton instance for development/testing
+    if not hasattr(get_idempotency_key_index, '_instance'):
+        index_limits = {}
+        for limit_name, environment_variable, limit_type in (
+            ("ttl_seconds", "PUBLIC_TUNNEL_IDEMPOTENCY_KEY_TTL_SECONDS", float),
+            ("max_entries", "PUBLIC_TUNNEL_MAX_IDEMPOTENCY_KEYS", int),
+            ("max_bytes", "PUBLIC_TUNNEL_MAX_IDEMPOTENCY_KEY_BYTES", int),
+        ):
+            if os.getenv(environment_variable):
+                index_limits[limit_name] = limit_type(os.getenv(environment_variable))
+        get_idempotency_key_index._instance = IdempotencyKeyIndex(**index_limits)
+    
+    return get_idempotency_key_index._instance
+
+
+def get_auto_async_wait_seconds():
+    """Provide the auto async initial wait threshold
+    
+    How long submit-auto-async holds the request open for the command
+    result before switching to async mode.
+    Can be easily overridden in conftest.py for testing.
+    
+    Returns:
+        float: Wait threshold in seconds
+        
+    Note: Can be set with PUBLIC_TUNNEL_AUTO_ASYNC_WAIT_SECONDS (default 1.0)
+    """
+    import os
+    
+    if not hasattr(get_auto_async_wait_seconds, '_instance'):
+        get_auto_async_wait_seconds._instance = float(os.getenv('PUBLIC_TUNNEL_AUTO_ASYNC_WAIT_SECONDS', '1.0'))
+    
+    return get_auto_async_wait_seconds._instance
+
+
+def get_auto_async_wait_policy():
+    """Provide unified Auto Async Wait Policy service
+    
+    Returns the same AutoAsyncWaitPolicy instance across all routers.
+    Can be easily overridden in conftest.py for testing.
+    
+    Returns:
+        AutoAsyncWaitPolicy: Latency based initial wait selection
+        
+    Note: The chosen wait never exceeds get_auto_async_wait_seconds()
+    """
+    from public_tunnel.services.auto_async_wait_policy import AutoAsyncWaitPolicy
+    
+    # Global singleton instance for development/testing
+    if not hasattr(get_auto_async_wait_policy, '_instance'):
+        get_auto_async_wait_policy._instance = AutoAsyncWaitPolicy()
+    
+    return get_auto_async_wait_policy._instance
+
+
 def get_file_manager():
     """Provide unified File Manager service
     
@@ -267,6 +412,10 @@ SessionManagerDep = Annotated[object, Depends(get_session_manager)]
 ClientPresenceTrackerDep = Annotated[object, Depends(get_client_presence_tracker)]
 OfflineStatusManagerDep = Annotated[object, Depends(get_offline_status_manager)]
 ExecutionResultManagerDep = Annotated[object, Depends(get_execution_result_manager)]
+CommandExpirySchedulerDep = Annotated[object, Depends(get_command_expiry_scheduler)]
+IdempotencyKeyIndexDep = Annotated[object, Depends(get_idempotency_key_index)]
+AutoAsyncWaitSecondsDep = Annotated[float, Depends(get_auto_async_wait_seconds)]
+AutoAsyncWaitPolicyDep = Annotated[object, Depends(get_auto_async_wait_policy)]
 FileManagerDep = Annotated[object, Depends(get_file_manager)]
 SessionFileAccessValidatorDep = Annotated['InMemorySessionFileAccessValidator', Depends(get_session_file_access_validator)]
 AdminTokenValidatorDep = Annotated['AdminTokenValidator', Depends(get_admin_token_validator)]
\ No newline at end of file
@@ -1,3 +1,6 @@
+from contextlib import asynccontextmanager
+import asyncio
+
 from fastapi import FastAPI
 from public_tunnel.routers import client_poll_commands
 from public_tunnel.routers import track_client_presence
@@ -8,6 +11,8 @@ from public_tunnel.routers import submit_commands_to_target_clients
 from public_tunnel.routers import query_command_execution_status
 from public_tunnel.routers import fifo_command_polling
 from public_tunnel.routers import client_single_command_retrieval
+from public_tunnel.routers import command_delivery_acknowledgement
+from public_tunnel.routers import cancel_queued_command
 from public_tunnel.routers import unified_result_query_mechanism
 from public_tunnel.routers import client_execution_error_reporting
 from public_tunnel.routers import upload_files_to_session
@@ -18,11 +23,39 @@ from public_tunnel.routers import client_result_file_upload
 from public_tunnel.routers import auto_async_command_submission
 from public_tunnel.routers import session_command_history_query
 from public_tunnel.routers import list_all_sessions_for_admin
+from public_tunnel.routers import idempotency_key_stats_for_admin
+from public_tunnel.routers import result_retention_stats_for_admin
+from public_tunnel.routers import command_output_streaming
+from public_tunnel.dependencies.providers import (
+    get_command_expiry_scheduler,
+    get_command_queue_manager,
+    get_execution_result_manager
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background command maintenance (timeouts, lease expiry) while serving"""
+    command_expiry_task = asyncio.create_task(get_command_expiry_scheduler().run())
+    try:
+        yield
+    finally:
+        command_expiry_task.cancel()
+        try:
+            await command_expiry_task
+        except asyncio.CancelledError:
+            pass
+        # Flush journaled delivery / acknowledgement records still buffered
+        get_command_queue_manager().close()
+        # Spilled result bodies belong to in-memory results that end with the process
+        get_execution_result_manager().close()
+
 
 app = FastAPI(
     title="Public Tunnel API",
     description="A network tunneling solution for AI assistants",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Register routers
@@ -44,6 +77,12 @@ app.include_router(fifo_command_polling.router)
 # US-009: Client Single Command Retrieval router  
 app.include_router(client_single_command_retrieval.router)
 
+# Command delivery acknowledgement (at-least-once delivery leases)
+app.include_router(command_delivery_acknowledgement.router)
+
+# Cancellation of queued / delayed commands
+app.include_router(cancel_queued_command.router)
+
 # US-021: Unified Result Query Mechanism router
 app.include_router(unified_result_query_mechanism.router)
 
@@ -70,6 +109,15 @@ app.include_router(session_command_history_query.router)
 # US-001: Admin Session List Query router
 app.include_router(list_all_sessions_for_admin.router)
 
+# Idempotency key index stats (admin)
+app.include_router(idempotency_key_stats_for_admin.router)
+
+# Result retention stats (admin)
+app.include_router(result_retention_stats_for_admin.router)
+
+# Incremental output of running commands
+app.include_router(command_output_streaming.router)
+
 
 
 @app.get("/")
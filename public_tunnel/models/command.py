@@ -4,10 +4,11 @@ Command - 指令資料結構
 基於 OOA 設計的指令資料和狀態管理
 """
 
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List
 from datetime import datetime
 from enum import Enum
+import json
 
 
 class CommandExecutionStatus(str, Enum):
@@ -16,13 +17,34 @@ class CommandExecutionStatus(str, Enum):
     RUNNING = "running" 
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"  # 派送前被取消
+
+
+class CommandPriority(str, Enum):
+    """指令優先等級列舉（同一等級內維持 FIFO）"""
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+    URGENT = "urgent"
 
 
 class SubmitCommandToTargetClientRequest(BaseModel):
     """提交指令給目標 Client 的請求模型"""
     command_content: str
     target_client_id: str
-    timeout_seconds: Optional[int] = None
+    timeout_seconds: Optional[int] = Field(default=None, gt=0)  # 逾時未完成則標記為失敗
+    priority: CommandPriority = CommandPriority.NORMAL
+    not_before: Optional[datetime] = None  # 延遲派送：此時間點前 Client 看不到此指令
+    delay_seconds: Optional[int] = Field(default=None, gt=0)  # 延遲派送：提交後幾秒才釋放
+    
+    def get_release_timestamp(self) -> Optional[float]:
+        """取得指令釋放給 Client 的時間點（epoch 秒），兩者皆指定時取較晚者"""
+        release_timestamps = []
+        if self.not_before is not None:
+            release_timestamps.append(self.not_before.timestamp())
+        if self.delay_seconds is not None:
+            release_timestamps.append(datetime.now().timestamp() + self.delay_seconds)
+        return max(release_timestamps) if release_timestamps else None
 
 
 class CommandSubmissionToTargetResponse(BaseModel):
@@ -32,6 +54,50 @@ class CommandSubmissionToTargetResponse(BaseModel):
     submission_timestamp: datetime
     target_client_id: str
     estimated_completion_time: Optional[datetime] = None
+    queue_depth: int = 0  # 提交後目標 Client 佇列中等待的指令數
+    queue_position: Optional[int] = None  # 前面還有幾個指令會先派送（0 表示下一個）
+    not_before: Optional[datetime] = None  # 延遲指令釋放給 Client 的時間點
+
+
+class IdempotencyKeyIndexStatsResponse(BaseModel):
+    """Idempotency-Key 索引的容量與淘汰統計"""
+    entries: int  # 目前記住的 key 數量
+    max_entries: int
+    held_bytes: int  # 估計佔用的記憶體
+    max_bytes: int
+    ttl_seconds: int
+    replayed_count: int  # 重試時直接回傳原回應的次數
+    expired_count: int  # 超過 TTL 被淘汰的 key 數量
+    evicted_count: int  # 超過容量被淘汰的 key 數量
+
+
+class BulkCommandSubmissionRequest(BaseModel):
+    """批次 / 廣播提交指令的請求模型
+
+    - commands: 明確指定的 (target_client_id, command_content) 清單
+    - broadcast_command_content: 廣播給 session 中所有在線 Client 的指令
+    """
+    commands: List[SubmitCommandToTargetClientRequest] = []
+    broadcast_command_content: Optional[str] = None
+    broadcast_priority: CommandPriority = CommandPriority.NORMAL
+    timeout_seconds: Optional[int] = Field(default=None, gt=0)  # 未個別指定 timeout 的指令使用此值
+
+
+class BulkCommandRejection(BaseModel):
+    """批次提交中被拒絕的單筆指令"""
+    target_client_id: str
+    error_code: str  # CLIENT_NOT_FOUND / CLIENT_OFFLINE / QUEUE_FULL
+    error_message: str
+    retry_after_seconds: Optional[int] = None  # QUEUE_FULL 時建議的重試等待秒數
+
+
+class BulkCommandSubmissionResponse(BaseModel):
+    """批次 / 廣播提交指令的回應模型"""
+    session_id: str
+    submitted_commands: List[CommandSubmissionToTargetResponse]
+    rejected_commands: List[BulkCommandRejection]
+    total_submitted: int
+    total_rejected: int
 
 
 class CommandExecutionStatusResponse(BaseModel):
@@ -43,6 +109,8 @@ class CommandExecutionStatusResponse(BaseModel):
     completed_at: Optional[datetime] = None
     result_summary: Optional[str] = None
     error_message: Optional[str] = None
+    queue_position: Optional[int] = None  # 等待中的指令前面還有幾個指令（0 表示下一個）
+    estimated_completion_time: Optional[datetime] = None  # 依 Client 平均執行時間估計
 
 
 class ClientCommandRetrievalResponse(BaseModel):
@@ -50,10 +118,28 @@ class ClientCommandRetrievalResponse(BaseModel):
     session_id: str
     client_id: str
     command: Optional[dict] = None  # 單一指令，格式與現有相容
+    commands: List[dict] = []  # 批次取得的指令（依 FIFO 順序，最多 max_commands 筆）
     has_more_commands: bool = False  # 是否還有更多指令
     queue_size: int = 0  # 剩餘佇列大小
 
 
+class CommandAcknowledgementResponse(BaseModel):
+    """Client 確認已收到指令的回應模型（確認後不再重新派送）"""
+    command_id: str
+    session_id: str
+    client_id: str
+    acknowledged: bool
+    acknowledged_at: datetime
+
+
+class CommandCancellationResponse(BaseModel):
+    """取消尚未派送指令的回應模型"""
+    command_id: str
+    session_id: str
+    execution_status: CommandExecutionStatus
+    cancelled_at: datetime
+
+
 class NonExistentClientErrorResponse(BaseModel):
     """US-013: 不存在 Client 錯誤回應模型"""
     error_code: str = "CLIENT_NOT_FOUND"
@@ -68,6 +154,9 @@ class AutoAsyncCommandResponse(BaseModel):
     command_id: str
     async_mode: bool  # True if switched to async, False if immediate response
     result: Optional[str] = None  # Immediate result if async_mode=False
+    execution_status: Optional[CommandExecutionStatus] = None  # 等待期間完成時的最終狀態
+    error_message: Optional[str] = None  # 等待期間執行失敗時的錯誤訊息
+    wait_seconds: Optional[float] = None  # 依延遲分佈選定的初始等待秒數
     submission_timestamp: datetime
     target_client_id: str
 
@@ -75,12 +164,45 @@ class AutoAsyncCommandResponse(BaseModel):
 class Command:
     """指令資料結構 - 基於 OOA 設計"""
     
-    def __init__(self, command_id: str, content: str, target_client: str, session_id: str):
+    def __init__(self, command_id: str, content: str, target_client: str, session_id: str,
+                 priority: CommandPriority = CommandPriority.NORMAL,
+                 timeout_seconds: Optional[int] = None,
+                 not_before: Optional[float] = None):
         self.command_id = command_id
         self.content = content
         self.target_client = target_client
         self.session_id = session_id
+        self.priority = priority
         self.timestamp = datetime.now().timestamp()
+        self.delivery_count = 0  # 已派送次數（逾時未確認會重新派送）
+        self.timeout_seconds = timeout_seconds
+        self.not_before = not_before  # 延遲派送：此時間點（epoch 秒）前 Client 看不到此指令
+        self.queue_sequence = 0  # 在所屬優先等級佇列中的序號（由 ClientCommandQueue 指定）
+        self.journal_sequence = 0  # 提交紀錄在 write-ahead log 中的序號（持久化佇列使用）
+        # 派送格式於提交時序列化一次，每次 polling 直接沿用 bytes
+        self.wire_payload_prefix = self._serialize_wire_payload_prefix()
+    
+    @property
+    def expires_at(self) -> Optional[float]:
+        """取得逾時時間點（epoch 秒），未設定 timeout 則為 None；延遲指令從釋放時間起算"""
+        if self.timeout_seconds is None:
+            return None
+        if self.not_before is not None and self.not_before > self.timestamp:
+            return self.not_before + self.timeout_seconds
+        return self.timestamp + self.timeout_seconds
+    
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """檢查指令是否已逾時"""
+        expires_at = self.expires_at
+        if expires_at is None:
+            return False
+        return (now if now is not None else datetime.now().timestamp()) >= expires_at
+    
+    def is_delayed(self, now: Optional[float] = None) -> bool:
+        """檢查指令是否仍在延遲中（尚未到 not_before）"""
+        if self.not_before is None:
+            return False
+        return (now if now is not None else datetime.now().timestamp()) < self.not_before
     
     def get_target_client(self) -> str:
         """取得目標 Client"""
@@ -90,6 +212,21 @@ class Command:
         """取得指令年齡（秒）"""
         return int(datetime.now().timestamp() - self.timestamp)
     
+    def _serialize_wire_payload_prefix(self) -> bytes:
+        """序列化派送格式中不會改變的欄位（到 delivery_count 之前的 JSON 前綴）"""
+        payload = json.dumps({
+            "command_id": self.command_id,
+            "content": self.content,
+            "target_client": self.target_client,
+            "session_id": self.session_id,
+            "priority": self.priority.value
+        }, ensure_ascii=False, separators=(",", ":"))
+        return payload[:-1].encode("utf-8") + b","
+    
+    def to_wire_payload(self) -> bytes:
+        """取得派送給 Client 的 JSON bytes（只有 delivery_count 於派送時附加）"""
+        return self.wire_payload_prefix + b'"delivery_count":%d}' % self.delivery_count
+    
     def to_json(self) -> dict:
         """序列化為 JSON"""
         return {
@@ -97,5 +234,8 @@ class Command:
             "content": self.content,
             "target_client": self.target_client,
             "session_id": self.session_id,
-            "timestamp": self.timestamp
+            "priority": self.priority.value,
+            "timestamp": self.timestamp,
+            "timeout_seconds": self.timeout_seconds,
+            "not_before": self.not_before
         }
\ No newline at end of file
@@ -4,10 +4,12 @@ ExecutionResult - 執行結果資料結構
 基於 OOA 設計的執行結果資料
 """
 
-from pydantic import BaseModel
-from typing import Optional, List, TYPE_CHECKING
+from pydantic import BaseModel, Field
+from typing import Optional, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 from enum import Enum
+import bisect
+import hashlib
 
 if TYPE_CHECKING:
     from public_tunnel.models.file import ClientResultFileUploadRequest, ClientResultFileUploadResponse
@@ -19,6 +21,7 @@ class ExecutionResultStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"  # 派送前被取消
 
 
 class UnifiedResultQueryResponse(BaseModel):
@@ -33,6 +36,70 @@ class UnifiedResultQueryResponse(BaseModel):
     result_content: Optional[str] = None
     error_message: Optional[str] = None
     file_references: Optional[List[str]] = None  # 附件檔案ID列表
+    result_content_truncated: bool = False  # result_content 只是預覽，完整內容已寫入磁碟
+    result_content_size: Optional[int] = None  # 完整內容的位元組數（寫入磁碟時）
+    result_content_url: Optional[str] = None  # 串流下載完整內容的路徑
+
+
+class ResultRetentionStatsResponse(BaseModel):
+    """執行結果保留容量與淘汰統計"""
+    results: int  # 目前保留的結果數量
+    finished_results: int  # 已結束、可被淘汰的結果數量
+    max_results: int
+    held_bytes: int  # 估計佔用的記憶體
+    max_bytes: int
+    ttl_seconds: int  # 結束後保留的秒數
+    expired_count: int  # 超過 TTL 被淘汰的結果數量
+    evicted_count: int  # 超過容量被淘汰的結果數量
+    spilled_results: int  # 內容寫入磁碟的結果數量
+    spilled_bytes: int  # 寫入磁碟的內容總位元組數
+
+
+class BatchResultWaitMode(str, Enum):
+    """批次結果查詢的等待模式"""
+    ANY = "any"  # 任一指令結束即回傳
+    ALL = "all"  # 全部指令結束才回傳
+
+
+class BatchResultQueryRequest(BaseModel):
+    """批次結果查詢請求"""
+    command_ids: List[str] = Field(min_length=1, max_length=1000)
+    only_finished: bool = False  # 只回傳已結束（completed / failed / cancelled）的結果
+    wait_mode: Optional[BatchResultWaitMode] = None  # 未指定則立即回傳
+    wait_seconds: float = Field(default=0.0, ge=0.0, le=60.0)  # 等待上限
+
+
+class BatchResultQueryResponse(BaseModel):
+    """批次結果查詢回應"""
+    session_id: str
+    results: List[UnifiedResultQueryResponse]  # 依請求順序排列
+    missing_command_ids: List[str]  # 此 session 中查無結果的指令
+    finished_count: int  # 已結束的指令數量
+    unfinished_count: int  # 尚未結束（pending / running）的指令數量
+
+
+class CommandOutputChunkRequest(BaseModel):
+    """執行中指令的輸出片段回報請求"""
+    data: str  # 新增的輸出內容
+
+
+class CommandOutputChunkResponse(BaseModel):
+    """輸出片段寫入確認"""
+    command_id: str
+    session_id: str
+    offset: int  # 此片段在輸出中的起始位置
+    total_size: int  # 寫入後的輸出總長度（字元數）
+
+
+class CommandOutputResponse(BaseModel):
+    """指令輸出增量查詢回應"""
+    command_id: str
+    session_id: str
+    offset: int  # 本次回傳內容的起始位置
+    next_offset: int  # 下次查詢應帶入的 offset
+    data: str  # offset 之後的新輸出
+    execution_status: ExecutionResultStatus
+    finished: bool  # 指令已結束，之後不會再有新輸出
 
 
 class ExecutionResultSubmissionRequest(BaseModel):
@@ -45,6 +112,36 @@ class ExecutionResultSubmissionRequest(BaseModel):
     file_references: Optional[List[str]] = None
 
 
+class CommandOutputLog:
+    """指令輸出的 append-only 片段記錄
+    
+    offset 以字元計算；記錄每個片段的起始位置，讀取時以二分搜尋定位，
+    只複製 offset 之後的內容。
+    """
+    
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._chunk_offsets: List[int] = []  # 每個片段的起始位置
+        self.total_size = 0
+    
+    def append(self, data: str) -> int:
+        """附加一個輸出片段，回傳其起始位置"""
+        chunk_offset = self.total_size
+        if data:
+            self._chunks.append(data)
+            self._chunk_offsets.append(chunk_offset)
+            self.total_size += len(data)
+        return chunk_offset
+    
+    def read(self, offset: int) -> str:
+        """讀取 offset 之後的所有輸出"""
+        if offset >= self.total_size:
+            return ""
+        chunk_index = bisect.bisect_right(self._chunk_offsets, offset) - 1
+        first_chunk = self._chunks[chunk_index][offset - self._chunk_offsets[chunk_index]:]
+        return first_chunk + "".join(self._chunks[chunk_index + 1:])
+
+
 class ExecutionResult:
     """執行結果資料結構 - 基於 OOA 設計"""
     
@@ -60,6 +157,11 @@ class ExecutionResult:
         self.result_content: Optional[str] = None
         self.error_message: Optional[str] = None
         self.file_references: List[str] = []
+        self.command_prefix: Optional[str] = None  # 指令程式名稱，用於學習各類指令的延遲分佈
+        self.result_content_spilled = False  # 完整內容已寫入磁碟，result_content 只保留預覽
+        self.result_content_size: Optional[int] = None  # 完整內容的位元組數（寫入磁碟時）
+        self._serialized_response: Optional[bytes] = None  # 已結束結果的序列化回應快取
+        self._response_etag: Optional[str] = None
     
     def get_command_id(self) -> str:
         """取得指令ID"""
@@ -71,11 +173,13 @@ class ExecutionResult:
     
     def update_status_to_running(self) -> None:
         """更新狀態為執行中"""
+        self.invalidate_serialized_response()
         self.execution_status = ExecutionResultStatus.RUNNING
         self.started_at = datetime.now()
     
     def complete_with_success(self, result_content: str, file_references: List[str] = None) -> None:
         """完成執行並設定成功結果"""
+        self.invalidate_serialized_response()
         self.execution_status = ExecutionResultStatus.COMPLETED
         self.completed_at = datetime.now()
         self.result_content = result_content
@@ -83,10 +187,39 @@ class ExecutionResult:
     
     def complete_with_failure(self, error_message: str) -> None:
         """完成執行並設定失敗結果"""
+        self.invalidate_serialized_response()
         self.execution_status = ExecutionResultStatus.FAILED
         self.completed_at = datetime.now()
         self.error_message = error_message
     
+    def is_finished(self) -> bool:
+        """是否已結束（completed / failed / cancelled），結束後內容不再改變"""
+        return self.execution_status in (
+            ExecutionResultStatus.COMPLETED,
+            ExecutionResultStatus.FAILED,
+            ExecutionResultStatus.CANCELLED
+        )
+    
+    def get_serialized_response(self) -> Tuple[bytes, str]:
+        """取得統一查詢回應的 JSON bytes 與強 ETag
+        
+        已結束的結果只序列化一次並快取，之後的查詢直接回傳快取內容。
+        """
+        if self._serialized_response is not None:
+            return self._serialized_response, self._response_etag
+        
+        response_body = self.to_unified_response().model_dump_json().encode("utf-8")
+        response_etag = f'"{hashlib.blake2b(response_body, digest_size=16).hexdigest()}"'
+        if self.is_finished():
+            self._serialized_response = response_body
+            self._response_etag = response_etag
+        return response_body, response_etag
+    
+    def invalidate_serialized_response(self) -> None:
+        """內容變更時清除序列化回應快取"""
+        self._serialized_response = None
+        self._response_etag = None
+    
     def to_unified_response(self) -> UnifiedResultQueryResponse:
         """轉換為統一查詢回應格式 - US-021 核心功能"""
         return UnifiedResultQueryResponse(
@@ -99,5 +232,11 @@ class ExecutionResult:
             completed_at=self.completed_at,
             result_content=self.result_content,
             error_message=self.error_message,
-            file_references=self.file_references
+            file_references=self.file_references,
+            result_content_truncated=self.result_content_spilled,
+            result_content_size=self.result_content_size,
+            result_content_url=(
+                f"/api/sessions/{self.session_id}/results/{self.command_id}/content"
+                if self.result_content_spilled else None
+            )
         )
\ No newline at end of file
@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from typing import Optional, List, Tuple
 from datetime import datetime
 from enum import Enum
-import uuid
+from public_tunnel.models.sortable_id import generate_sortable_id
 
 
 class FileUploadRequest(BaseModel):
@@ -129,7 +129,7 @@ class File:
     def __init__(self, file_name: str, content: bytes, session_id: str, 
                  content_type: str = "application/octet-stream", 
                  file_summary: Optional[str] = None):
-        self.file_id = str(uuid.uuid4())
+        self.file_id = generate_sortable_id()
         self.file_name = file_name
         self.content = content
         self.session_id = session_id
@@ -56,8 +56,16 @@ class FIFOCommandPollingResponse(BaseModel):
         default=None,
         description="Single command returned in FIFO order (None if no commands)"
     )
+    commands: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="All commands returned by this poll in FIFO order (up to max_commands)"
+    )
     queue_position: int = Field(
-        description="Position in queue after this command (0 means no more commands)"
+        default=0,
+        description="Deprecated, always 0: polled commands are taken from the head of the queue. "
+                    "Use total_queue_size for the commands left, and the command status endpoint "
+                    "for the position of a command still waiting in the queue",
+        json_schema_extra={"deprecated": True}
     )
     total_queue_size: int = Field(
         description="Total number of commands remaining in queue for this client"
@@ -0,0 +1,126 @@
+"""
+Time-sortable identifiers for commands and files
+
+IDs follow the ULID layout: a 48-bit millisecond timestamp followed by 80
+random bits, encoded as 26 Crockford base32 characters. Because the
+timestamp comes first, string order equals creation order, which lets the
+in-memory indexes answer "commands since X" with a binary search instead
+of a full scan.
+
+IDs generated within the same millisecond increment the random part, so a
+single generator never hands out an ID that sorts before a previous one.
+IDs stay plain strings on the API, so clients that treated them as opaque
+UUID strings keep working.
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+import os
+import threading
+import time
+
+# Crockford base32 (no I, L, O, U) keeps lexicographic order equal to numeric order
+CROCKFORD_BASE32_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+SORTABLE_ID_LENGTH = 26
+TIMESTAMP_CHARACTERS = 10
+
+_RANDOM_BITS = 80
+_MAX_RANDOM_VALUE = (1 << _RANDOM_BITS) - 1
+_MAX_TIMESTAMP_MS = (1 << 48) - 1
+_DECODE_MAP = {character: value for value, character in enumerate(CROCKFORD_BASE32_ALPHABET)}
+
+
+class SortableIdGenerator:
+    """Thread-safe generator of monotonic, time-sortable IDs"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_timestamp_ms = -1
+        self._last_random_value = 0
+    
+    def generate(self) -> str:
+        """
+        Generate the next ID
+        
+        Returns:
+            str: 26-character ID that sorts after every ID this generator returned before
+        """
+        timestamp_ms = time.time_ns() // 1_000_000
+        
+        with self._lock:
+            if timestamp_ms <= self._last_timestamp_ms:
+                # Same millisecond (or clock stepped back): stay on the last timestamp and count up
+                timestamp_ms = self._last_timestamp_ms
+                random_value = self._last_random_value + 1
+                if random_value > _MAX_RANDOM_VALUE:
+                    timestamp_ms += 1
+                    random_value = int.from_bytes(os.urandom(10), "big") >> 1
+            else:
+                # Top bit left clear so thousands of same-millisecond increments cannot overflow
+                random_value = int.from_bytes(os.urandom(10), "big") >> 1
+            
+            self._last_timestamp_ms = timestamp_ms
+            self._last_random_value = random_value
+        
+        return _encode(timestamp_ms, TIMESTAMP_CHARACTERS) + _encode(random_value, SORTABLE_ID_LENGTH - TIMESTAMP_CHARACTERS)
+
+
+_default_generator = SortableIdGenerator()
+
+
+def generate_sortable_id() -> str:
+    """Generate a time-sortable ID from the process-wide generator"""
+    return _default_generator.generate()
+
+
+def is_sortable_id(value: str) -> bool:
+    """Check whether a string has the shape of a generated sortable ID"""
+    return (
+        len(value) == SORTABLE_ID_LENGTH
+        and all(character in _DECODE_MAP for character in value)
+        and value[0] <= "7"  # 48-bit timestamp fits in 10 characters only up to "7"
+    )
+
+
+def get_sortable_id_timestamp(sortable_id: str) -> Optional[datetime]:
+    """
+    Extract the creation time embedded in a sortable ID
+    
+    Returns:
+        datetime: Creation time, or None if the value is not a sortable ID
+    """
+    if not is_sortable_id(sortable_id):
+        return None
+    timestamp_ms = _decode(sortable_id[:TIMESTAMP_CHARACTERS])
+    return datetime.fromtimestamp(timestamp_ms / 1000)
+
+
+def sortable_id_lower_bound(since: Union[datetime, float]) -> str:
+    """
+    Smallest sortable ID that could have been generated at or after a point in time
+    
+    Useful as the start key of a range scan ("everything created since X").
+    
+    Args:
+        since: datetime or Unix timestamp in seconds
+    """
+    timestamp = since.timestamp() if isinstance(since, datetime) else since
+    timestamp_ms = min(max(int(timestamp * 1000), 0), _MAX_TIMESTAMP_MS)
+    return _encode(timestamp_ms, TIMESTAMP_CHARACTERS) + "0" * (SORTABLE_ID_LENGTH - TIMESTAMP_CHARACTERS)
+
+
+def _encode(value: int, length: int) -> str:
+    """Encode an integer as fixed-width Crockford base32"""
+    characters = []
+    for _ in range(length):
+        characters.append(CROCKFORD_BASE32_ALPHABET[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(characters))
+
+
+def _decode(encoded: str) -> int:
+    """Decode fixed-width Crockford base32 into an integer"""
+    value = 0
+    for character in encoded:
+        value = (value << 5) | _DECODE_MAP[character]
+    return value
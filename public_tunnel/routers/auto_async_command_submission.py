@@ -2,23 +2,28 @@
 Auto Async Command Submission - US-008 Implementation
 
 Handles command submission with automatic switching between synchronous and asynchronous responses
-based on execution time thresholds.
+based on execution time thresholds. The command is enqueued for real and the request awaits the
+client's reported result; if none arrives within the threshold the response switches to async mode.
 """
 
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
-import uuid
 from public_tunnel.models.command import (
     SubmitCommandToTargetClientRequest,
     AutoAsyncCommandResponse
 )
+from public_tunnel.models.execution_result import ExecutionResultStatus
+from public_tunnel.services.command_queue_manager import CommandQueueFullError
 from public_tunnel.dependencies.providers import (
     SessionRepositoryDep,
     CommandValidatorDep, 
     CommandQueueManagerDep,
     ClientPresenceTrackerDep,
     OfflineStatusManagerDep,
-    ExecutionResultManagerDep
+    ExecutionResultManagerDep,
+    CommandExpirySchedulerDep,
+    AutoAsyncWaitSecondsDep,
+    AutoAsyncWaitPolicyDep
 )
 
 router: APIRouter = APIRouter(tags=["auto-async-command-submission"])
@@ -38,7 +43,10 @@ async def submit_command_with_auto_async_response(
     command_queue_manager: CommandQueueManagerDep = None,
     presence_tracker: ClientPresenceTrackerDep = None,
     offline_status_manager: OfflineStatusManagerDep = None,
-    execution_result_manager: ExecutionResultManagerDep = None
+    execution_result_manager: ExecutionResultManagerDep = None,
+    command_expiry_scheduler: CommandExpirySchedulerDep = None,
+    wait_threshold_seconds: AutoAsyncWaitSecondsDep = None,
+    auto_async_wait_policy: AutoAsyncWaitPolicyDep = None
 ) -> AutoAsyncCommandResponse:
     """
     Submit command with automatic sync/async response handling.
@@ -48,7 +56,11 @@ async def submit_command_with_auto_async_response(
     - Fast commands (within threshold): Return result immediately
     - Slow commands (exceed threshold): Return command-id for polling
     
-    The response switches automatically based on execution time.
+    The response switches automatically based on execution time: the
+    request awaits the result the client reports through the unified
+    result API. How long it waits is chosen from the latencies learned
+    for the command prefix or client, capped by the configured threshold;
+    commands that are almost always slow switch to async without waiting.
     """
     # US-008: Real implementation of auto async logic
     
@@ -63,70 +75,77 @@ async def submit_command_with_auto_async_response(
         raise HTTPException(status_code=422, detail="Target client is offline")
     
     # Submit command to queue (using existing infrastructure)
-    submitted_command = command_queue_manager.submit_command_to_target_client(
+    submission_timestamp = datetime.now()
+    try:
+        submitted_command = command_queue_manager.submit_command_to_target_client(
+            session_id=session_id,
+            target_client_id=command_request.target_client_id,
+            command_content=command_request.command_content,
+            priority=command_request.priority,
+            timeout_seconds=command_request.timeout_seconds,
+            not_before=command_request.get_release_timestamp()
+        )
+    except CommandQueueFullError as error:
+        raise HTTPException(
+            status_code=429,
+            detail=str(error),
+            headers={"Retry-After": str(error.retry_after_seconds)}
+        )
+    
+    # Get command_id from the submitted command
+    command_id = submitted_command.command_id
+    
+    # Pending result entry: the client's report completes it, and async callers poll it.
+    # Created before the first await, so a result reported meanwhile is not overwritten
+    execution_result_manager.create_and_store_result(
+        command_id=command_id,
         session_id=session_id,
-        target_client_id=command_request.target_client_id,
+        client_id=command_request.target_client_id,
+        execution_status=ExecutionResultStatus.PENDING,
         command_content=command_request.command_content
     )
     
-    # Get command_id from the submitted command
-    command_id = submitted_command.command_id
+    if command_expiry_scheduler:
+        command_expiry_scheduler.schedule_command_expiry(submitted_command)
+    
+    # Persistent queues: confirm only once the submission is on disk
+    await command_queue_manager.wait_until_durable([submitted_command])
     
-    # Auto Async Logic: Wait briefly for fast execution
-    # For simplicity in this implementation, we simulate execution time based on command content
-    wait_threshold_seconds = 1.0  # configurable threshold
+    # Auto Async Logic: choose the initial wait from learned latencies
+    wait_seconds = auto_async_wait_policy.choose_wait_seconds(
+        execution_result_manager.get_turnaround_latencies(
+            session_id,
+            command_request.target_client_id,
+            command_request.command_content
+        ),
+        max_wait_seconds=wait_threshold_seconds
+    )
     
-    # Simulate execution time based on command content
-    # Fast commands (like "echo") complete immediately
-    # Slow commands (containing "sleep") exceed threshold
-    is_fast_command = "sleep" not in command_request.command_content.lower()
+    # The wait is a future resolved by the result manager - no thread, no polling
+    completed_result = await execution_result_manager.wait_for_completion(
+        command_id,
+        timeout_seconds=wait_seconds
+    )
     
-    if is_fast_command:
-        # Fast execution: create and complete result immediately for unified query
-        if execution_result_manager:
-            from public_tunnel.models.execution_result import ExecutionResult, ExecutionResultStatus
-            
-            mock_result = f"Result of: {command_request.command_content}"
-            
-            # Create completed result entry for unified query mechanism
-            completed_result = ExecutionResult(
-                command_id=command_id,
-                execution_status=ExecutionResultStatus.COMPLETED,
-                client_id=command_request.target_client_id,
-                session_id=session_id
-            )
-            completed_result.complete_with_success(mock_result)
-            execution_result_manager.store_result(completed_result)
-        else:
-            mock_result = f"Result of: {command_request.command_content}"
-        
-        return AutoAsyncCommandResponse(
-            command_id=command_id,
-            async_mode=False,
-            result=mock_result,
-            submission_timestamp=datetime.now(),
-            target_client_id=command_request.target_client_id
-        )
-    else:
-        # Slow execution: create pending result entry for later polling
-        if execution_result_manager:
-            # Import here to avoid circular imports
-            from public_tunnel.models.execution_result import ExecutionResult, ExecutionResultStatus
-            
-            # Create pending result entry
-            pending_result = ExecutionResult(
-                command_id=command_id,
-                execution_status=ExecutionResultStatus.PENDING,
-                client_id=command_request.target_client_id,
-                session_id=session_id
-            )
-            execution_result_manager.store_result(pending_result)
-        
-        # Return command-id for polling
+    if completed_result is None:
+        # Slow execution: return command-id for polling
         return AutoAsyncCommandResponse(
             command_id=command_id,
             async_mode=True,
             result=None,
-            submission_timestamp=datetime.now(),
+            wait_seconds=wait_seconds,
+            submission_timestamp=submission_timestamp,
             target_client_id=command_request.target_client_id
-        )
\ No newline at end of file
+        )
+    
+    # Fast execution: return the reported result immediately
+    return AutoAsyncCommandResponse(
+        command_id=command_id,
+        async_mode=False,
+        result=completed_result.result_content,
+        execution_status=completed_result.execution_status.value,
+        error_message=completed_result.error_message,
+        wait_seconds=wait_seconds,
+        submission_timestamp=submission_timestamp,
+        target_client_id=command_request.target_client_id
+    )
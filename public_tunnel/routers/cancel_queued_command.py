@@ -0,0 +1,77 @@
+"""
+Cancel Queued Command Router
+
+Lets the AI assistant withdraw a command that has not reached its client
+yet. The queue manager finds the command through its command_id index and
+tombstones it in place, so cancellation stays O(1) however deep the client
+queue is. The command's result record moves to CANCELLED.
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, HTTPException
+
+from public_tunnel.models.command import CommandCancellationResponse, CommandExecutionStatus
+from public_tunnel.models.execution_result import ExecutionResultStatus
+from public_tunnel.dependencies.providers import CommandQueueManagerDep, ExecutionResultManagerDep
+
+router = APIRouter(tags=["command-cancellation"])
+
+
+@router.delete(
+    "/api/sessions/{session_id}/commands/{command_id}",
+    response_model=CommandCancellationResponse,
+    summary="Cancel a command that has not been delivered yet",
+    description="Removes a queued or delayed command before any client receives it and marks its result as cancelled."
+)
+async def cancel_queued_command(
+    session_id: str,
+    command_id: str,
+    queue_manager: CommandQueueManagerDep,
+    result_manager: ExecutionResultManagerDep
+) -> CommandCancellationResponse:
+    """
+    Cancel a queued or delayed command.
+    
+    Args:
+        session_id: Session identifier
+        command_id: Command to cancel
+        queue_manager: Command queue management service
+        result_manager: Execution result management service
+        
+    Returns:
+        CommandCancellationResponse: Cancellation confirmation
+        
+    Raises:
+        HTTPException: 404 if the command is unknown in this session
+        HTTPException: 409 if the command was already delivered or has finished
+    """
+    if not queue_manager.cancel_command(session_id=session_id, command_id=command_id):
+        if queue_manager.get_held_command(session_id, command_id) is not None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Command '{command_id}' was already delivered to its client and can no longer be cancelled"
+            )
+        
+        result = result_manager.get_result_by_command_id(command_id)
+        if result is None or result.session_id != session_id:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Command '{command_id}' not found in session '{session_id}'"
+            )
+        raise HTTPException(
+            status_code=409,
+            detail=f"Command '{command_id}' is already {result.execution_status.value} and can no longer be cancelled"
+        )
+    
+    result_manager.update_result_status(
+        command_id=command_id,
+        new_status=ExecutionResultStatus.CANCELLED,
+        error_message="Command cancelled before delivery"
+    )
+    
+    return CommandCancellationResponse(
+        command_id=command_id,
+        session_id=session_id,
+        execution_status=CommandExecutionStatus.CANCELLED,
+        cancelled_at=datetime.now()
+    )
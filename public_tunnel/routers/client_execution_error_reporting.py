@@ -6,15 +6,20 @@ This ensures AI can handle errors consistently through unified result query mech
 """
 
 from datetime import datetime
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Header
+from typing import Dict, Any, Optional
 
 from public_tunnel.models.execution_result import (
     ExecutionResultSubmissionRequest,
     ExecutionResultStatus,
     UnifiedResultQueryResponse
 )
-from public_tunnel.dependencies.providers import SessionRepositoryDep, ExecutionResultManagerDep
+from public_tunnel.dependencies.providers import (
+    SessionRepositoryDep,
+    ExecutionResultManagerDep,
+    CommandQueueManagerDep
+)
+from public_tunnel.routers.unified_result_query_mechanism import build_result_query_response
 
 router = APIRouter(tags=["client-execution-error-reporting"])
 
@@ -105,7 +110,8 @@ async def report_command_execution_error(
     command_id: str,
     error_request: ExecutionResultSubmissionRequest,
     session_repo: SessionRepositoryDep,
-    result_manager: ExecutionResultManagerDep
+    result_manager: ExecutionResultManagerDep,
+    queue_manager: CommandQueueManagerDep
 ) -> Dict[str, Any]:
     """
     Client reports command execution error with unified format.
@@ -122,6 +128,7 @@ async def report_command_execution_error(
         error_request: Error details in unified result format
         session_repo: Session repository for data validation
         result_manager: Result manager for unified error storage
+        queue_manager: Command queue manager for delivery acknowledgement
         
     Returns:
         Dict: Error submission confirmation using unified format
@@ -144,6 +151,9 @@ async def report_command_execution_error(
             detail=f"Command ID mismatch: path has '{command_id}', request body has '{error_request.command_id}'"
         )
     
+    # A reported error implies the client received the command
+    queue_manager.acknowledge_command(session_id, command_id)
+    
     # Store execution error result through unified result manager
     execution_result = result_manager.create_and_store_result(
         command_id=command_id,
@@ -166,7 +176,8 @@ async def query_command_execution_error(
     session_id: str,
     command_id: str,
     session_repo: SessionRepositoryDep,
-    result_manager: ExecutionResultManagerDep
+    result_manager: ExecutionResultManagerDep,
+    if_none_match: Optional[str] = Header(None)
 ) -> UnifiedResultQueryResponse:
     """
     Query command execution error through unified result mechanism.
@@ -182,18 +193,20 @@ async def query_command_execution_error(
         command_id: Failed command identifier to query
         session_repo: Session repository for data retrieval
         result_manager: Result manager for unified error query
+        if_none_match: ETag of the version the caller already has
         
     Returns:
         UnifiedResultQueryResponse: Error result in same format as success results
+        (written from cached bytes with an ETag), or 304
         
     Raises:
         HTTPException: 404 if error result not found
         HTTPException: 400 if found result is not an error (execution_status != FAILED)
     """
     # Query error result through unified result mechanism
-    unified_result_response = result_manager.get_unified_response(command_id)
+    error_result = result_manager.get_result_by_command_id(command_id)
     
-    _validate_error_result_exists(unified_result_response, command_id, session_id)
-    _validate_is_actual_error_result(unified_result_response, command_id)
+    _validate_error_result_exists(error_result, command_id, session_id)
+    _validate_is_actual_error_result(error_result, command_id)
     
-    return unified_result_response
\ No newline at end of file
+    return build_result_query_response(error_result, if_none_match)
\ No newline at end of file
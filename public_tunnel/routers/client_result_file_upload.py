@@ -42,7 +42,8 @@ class ClientResultSubmissionWithFilesResponse(BaseModel):
 from public_tunnel.dependencies.providers import (
     SessionRepositoryDep,
     ExecutionResultManagerDep,
-    FileManagerDep
+    FileManagerDep,
+    CommandQueueManagerDep
 )
 
 router = APIRouter(tags=["client-result-file-upload"])
@@ -115,10 +116,10 @@ def _create_execution_result_with_uploaded_file_references(
         client_id=client_id,
         execution_status=submission_request.execution_status,
         result_content=submission_request.result_content,
-        error_message=submission_request.error_message
+        error_message=submission_request.error_message,
+        file_references=uploaded_file_ids
     )
     
-    execution_result.file_references = uploaded_file_ids
     return execution_result
 
 
@@ -134,7 +135,8 @@ async def upload_client_result_with_files(
     request: ClientResultSubmissionWithFilesRequest,
     session_repo: SessionRepositoryDep,
     result_manager: ExecutionResultManagerDep,
-    file_manager: FileManagerDep
+    file_manager: FileManagerDep,
+    queue_manager: CommandQueueManagerDep
 ) -> ClientResultSubmissionWithFilesResponse:
     """
     Client uploads execution result with files and metadata.
@@ -144,6 +146,7 @@ async def upload_client_result_with_files(
     - Each file gets unique file-id, filename, and summary
     - AI can browse and download files selectively through existing file APIs
     - Files are stored with session-based isolation
+    - Reporting a result acknowledges the command's delivery lease
     
     Args:
         session_id: Target session identifier
@@ -152,6 +155,7 @@ async def upload_client_result_with_files(
         session_repo: Session repository for validation
         result_manager: Result manager for execution result storage
         file_manager: File manager for file uploads
+        queue_manager: Command queue manager for delivery acknowledgement
         
     Returns:
         ClientResultSubmissionWithFilesResponse: Upload confirmation with file metadata
@@ -166,6 +170,9 @@ async def upload_client_result_with_files(
             detail=f"Command ID mismatch: path has '{command_id}', request body has '{request.command_id}'"
         )
     
+    # A reported result implies the client received the command
+    queue_manager.acknowledge_command(session_id, command_id)
+    
     uploaded_result_files = []
     uploaded_file_ids = []
     
@@ -3,9 +3,15 @@ US-009: Client Single Command Retrieval Router
 
 Provides a client-focused API for retrieving single commands with execution pace control.
 This is the client-centric implementation of single command polling.
+
+Responses are written from each command's pre-serialized wire payload
+(serialized once at submit time) instead of building and validating the
+response model on every retrieval.
 """
 
-from fastapi import APIRouter, HTTPException
+import json
+from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from public_tunnel.models.command import ClientCommandRetrievalResponse
 from public_tunnel.dependencies.providers import CommandQueueManagerDep
@@ -13,36 +19,59 @@ from public_tunnel.models.command import Command
 
 router = APIRouter(tags=["client-single-command-retrieval"])
 
+# Upper bound for batch retrieval to keep response sizes bounded
+MAX_COMMANDS_PER_RETRIEVAL = 100
+
 
-def build_command_response_data(command: Command) -> dict:
+def build_retrieval_response_body(
+    session_id: str,
+    client_id: str,
+    commands: List[Command],
+    remaining_queue_size: int
+) -> bytes:
     """
-    Build command data dictionary for client response
+    Build ClientCommandRetrievalResponse JSON from pre-serialized command payloads
     
     Args:
-        command: Command domain object
+        session_id: Session identifier
+        client_id: Client identifier
+        commands: Retrieved commands in FIFO order
+        remaining_queue_size: Commands left in the client queue
         
     Returns:
-        Dict containing command data in API response format
+        bytes: Response body in ClientCommandRetrievalResponse format
     """
-    return {
-        "command_id": command.command_id,
-        "content": command.content,
-        "target_client": command.target_client,
-        "session_id": command.session_id
-    }
+    command_payloads = [command.to_wire_payload() for command in commands]
+    
+    return b"".join((
+        b'{"session_id":', json.dumps(session_id, ensure_ascii=False).encode("utf-8"),
+        b',"client_id":', json.dumps(client_id, ensure_ascii=False).encode("utf-8"),
+        b',"command":', command_payloads[0] if command_payloads else b"null",
+        b',"commands":[', b",".join(command_payloads),
+        b'],"has_more_commands":', b"true" if remaining_queue_size > 0 else b"false",
+        b',"queue_size":', str(remaining_queue_size).encode("ascii"),
+        b"}"
+    ))
 
 
 @router.get(
     "/api/sessions/{session_id}/clients/{client_id}/command",
     response_model=ClientCommandRetrievalResponse,
     summary="Client retrieves single command to control execution pace",
-    description="US-009: Returns single command for client, optimized for execution pace control. Command is removed from queue on retrieval."
+    description="US-009: Returns single command for client, optimized for execution pace control. Command is removed from queue on retrieval. "
+                "Optional max_commands retrieves up to that many commands at once."
 )
 async def retrieve_single_command_for_execution_control(
     session_id: str,
     client_id: str,
-    queue_manager: CommandQueueManagerDep
-) -> ClientCommandRetrievalResponse:
+    queue_manager: CommandQueueManagerDep,
+    max_commands: int = Query(
+        default=1,
+        ge=1,
+        le=MAX_COMMANDS_PER_RETRIEVAL,
+        description="Maximum number of commands to retrieve in FIFO order"
+    )
+) -> Response:
     """
     Client retrieves single command to control execution pace.
     
@@ -51,26 +80,26 @@ async def retrieve_single_command_for_execution_control(
     - Command is immediately removed from queue upon retrieval
     - Provides execution pace control through has_more_commands indicator
     - Simplified response format optimized for client consumption
+    - Fast clients may drain a backlog with max_commands > 1; the first
+      command is also exposed as `command` for compatibility
     
     Args:
         session_id: Target session identifier
         client_id: Client identifier requesting command
         queue_manager: Command queue management service
+        max_commands: Maximum number of commands to retrieve
         
     Returns:
-        ClientCommandRetrievalResponse: Single command with execution pace control info
+        Response: ClientCommandRetrievalResponse JSON with command(s) and execution pace control info
     """
-    command, remaining_queue_size = queue_manager.get_next_command_with_queue_info(
+    commands, remaining_queue_size = queue_manager.get_next_commands_with_queue_info(
         session_id=session_id,
-        client_id=client_id
+        client_id=client_id,
+        max_commands=max_commands
     )
     
-    command_dict = build_command_response_data(command) if command else None
-    
-    return ClientCommandRetrievalResponse(
-        session_id=session_id,
-        client_id=client_id,
-        command=command_dict,
-        has_more_commands=remaining_queue_size > 0,
-        queue_size=remaining_queue_size
+    # Fast path: write pre-serialized bytes, skipping response model validation
+    return Response(
+        content=build_retrieval_response_body(session_id, client_id, commands, remaining_queue_size),
+        media_type="application/json"
     )
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Command Delivery Acknowledgement Router
+
+Lets clients confirm receipt of delivered commands. Delivered commands are
+leased for a visibility timeout and re-delivered unless acknowledged here
+(or implicitly by submitting their result), giving at-least-once delivery.
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, HTTPException
+
+from public_tunnel.models.command import CommandAcknowledgementResponse
+from public_tunnel.dependencies.providers import CommandQueueManagerDep
+
+router = APIRouter(tags=["command-delivery-acknowledgement"])
+
+
+@router.post(
+    "/api/sessions/{session_id}/clients/{client_id}/commands/{command_id}/ack",
+    response_model=CommandAcknowledgementResponse,
+    summary="Client acknowledges a delivered command",
+    description="Releases the delivery lease of a command so it will not be re-delivered after the visibility timeout."
+)
+async def acknowledge_delivered_command(
+    session_id: str,
+    client_id: str,
+    command_id: str,
+    queue_manager: CommandQueueManagerDep
+) -> CommandAcknowledgementResponse:
+    """
+    Acknowledge a command previously delivered to this client.
+    
+    Implementation:
+    - Polling leases each delivered command for a visibility timeout
+    - Unacknowledged commands become visible again when the lease expires
+    - Acknowledging releases the lease so the command is never re-delivered
+    
+    Args:
+        session_id: Session identifier
+        client_id: Client that received the command
+        command_id: Delivered command identifier
+        queue_manager: Command queue management service
+        
+    Returns:
+        CommandAcknowledgementResponse: Acknowledgement confirmation
+        
+    Raises:
+        HTTPException: 404 if the command has no active lease for this client
+    """
+    acknowledged = queue_manager.acknowledge_command(
+        session_id=session_id,
+        command_id=command_id,
+        client_id=client_id
+    )
+    
+    if not acknowledged:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Command '{command_id}' has no active delivery to client '{client_id}' in session '{session_id}'"
+        )
+    
+    return CommandAcknowledgementResponse(
+        command_id=command_id,
+        session_id=session_id,
+        client_id=client_id,
+        acknowledged=True,
+        acknowledged_at=datetime.now()
+    )
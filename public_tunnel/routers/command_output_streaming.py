@@ -0,0 +1,158 @@
+"""
+Command Output Streaming Router
+
+Clients append output chunks while a command runs; AI callers read the
+output incrementally by offset instead of polling a RUNNING status blindly.
+A read returns only the output after the caller's offset together with the
+next offset to ask for, so no output is ever downloaded twice. With
+wait_seconds the read is held open until new output arrives or the command
+finishes (long-poll).
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from public_tunnel.models.execution_result import (
+    CommandOutputChunkRequest,
+    CommandOutputChunkResponse,
+    CommandOutputResponse
+)
+from public_tunnel.services.execution_result_manager import TERMINAL_RESULT_STATUSES
+from public_tunnel.dependencies.providers import (
+    ExecutionResultManagerDep,
+    CommandQueueManagerDep
+)
+
+router = APIRouter(tags=["command-output-streaming"])
+
+# Upper bound for output long-poll waiting to keep idle connections bounded
+MAX_OUTPUT_WAIT_SECONDS = 60.0
+
+
+def _get_session_result(result_manager, session_id: str, command_id: str):
+    """Get a command's result, 404 if the session has none for it"""
+    result = result_manager.get_result_by_command_id(command_id)
+    if result is None or result.session_id != session_id:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Execution result not found for command {command_id}"
+        )
+    return result
+
+
+@router.post(
+    "/api/sessions/{session_id}/commands/{command_id}/output",
+    response_model=CommandOutputChunkResponse,
+    summary="Append an output chunk of a running command",
+    description="Clients report output while the command runs. Chunks are appended to the command's output log."
+)
+async def append_command_output_chunk(
+    session_id: str,
+    command_id: str,
+    chunk_request: CommandOutputChunkRequest,
+    result_manager: ExecutionResultManagerDep,
+    queue_manager: CommandQueueManagerDep
+) -> CommandOutputChunkResponse:
+    """
+    Append an output chunk to a running command's output log.
+    
+    The first chunk marks a PENDING result RUNNING, and like a reported
+    result it acknowledges the command's delivery lease.
+    
+    Args:
+        session_id: Target session identifier
+        command_id: Command the output belongs to
+        chunk_request: Output produced since the previous chunk
+        result_manager: Execution result manager holding the output log
+        queue_manager: Command queue manager for delivery acknowledgement
+        
+    Returns:
+        CommandOutputChunkResponse: Offset of the chunk and the new output size
+        
+    Raises:
+        HTTPException: 404 if the session has no result for the command
+        HTTPException: 409 if the command already finished
+    """
+    result = _get_session_result(result_manager, session_id, command_id)
+    if result.execution_status in TERMINAL_RESULT_STATUSES:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Command {command_id} already finished with status '{result.execution_status.value}'"
+        )
+    
+    # Output implies the client received the command
+    queue_manager.acknowledge_command(session_id, command_id)
+    
+    chunk_offset = result_manager.append_command_output(command_id, chunk_request.data)
+    
+    return CommandOutputChunkResponse(
+        command_id=command_id,
+        session_id=session_id,
+        offset=chunk_offset,
+        total_size=result_manager.get_command_output_size(command_id)
+    )
+
+
+@router.get(
+    "/api/sessions/{session_id}/commands/{command_id}/output",
+    response_model=CommandOutputResponse,
+    summary="Read command output after an offset",
+    description="Returns the output after offset and the next offset to read from. "
+                "Optional wait_seconds holds the request open until new output arrives or the command finishes (long-poll)."
+)
+async def read_command_output(
+    session_id: str,
+    command_id: str,
+    result_manager: ExecutionResultManagerDep,
+    offset: int = Query(
+        default=0,
+        ge=0,
+        description="Output already read; pass next_offset of the previous response"
+    ),
+    wait_seconds: float = Query(
+        default=0.0,
+        ge=0.0,
+        le=MAX_OUTPUT_WAIT_SECONDS,
+        description="Seconds to wait for new output when there is none after offset (0 returns immediately)"
+    )
+) -> CommandOutputResponse:
+    """
+    Read a command's output incrementally.
+    
+    Args:
+        session_id: Target session identifier
+        command_id: Command to read output of
+        result_manager: Execution result manager holding the output log
+        offset: Output the caller already has
+        wait_seconds: Maximum seconds to wait for new output
+        
+    Returns:
+        CommandOutputResponse: Output after offset, next offset and whether the command finished
+        
+    Raises:
+        HTTPException: 404 if the session has no result for the command
+        HTTPException: 400 if offset is beyond the output
+    """
+    _get_session_result(result_manager, session_id, command_id)
+    if offset > result_manager.get_command_output_size(command_id):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Offset {offset} is beyond the output of command {command_id}"
+        )
+    
+    if wait_seconds > 0:
+        # Woken by appended output or by the command finishing, no re-read loop
+        await result_manager.wait_for_output(command_id, offset, timeout_seconds=wait_seconds)
+    
+    # Re-read after the wait: the result may have been replaced or evicted meanwhile
+    result = _get_session_result(result_manager, session_id, command_id)
+    output_data = result_manager.read_command_output(command_id, offset)
+    
+    return CommandOutputResponse(
+        command_id=command_id,
+        session_id=session_id,
+        offset=offset,
+        next_offset=offset + len(output_data),
+        data=output_data,
+        execution_status=result.execution_status,
+        finished=result.execution_status in TERMINAL_RESULT_STATUSES
+    )
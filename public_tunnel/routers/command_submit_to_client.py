@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 from public_tunnel.dependencies.providers import OfflineStatusManagerDep
-import uuid
+from public_tunnel.models.sortable_id import generate_sortable_id
 
 router = APIRouter(tags=["command-submission"])
 
@@ -56,7 +56,7 @@ async def submit_command_to_client(
         )
     
     # If client is online, accept the command (simplified implementation)
-    command_id = str(uuid.uuid4())
+    command_id = generate_sortable_id()
     
     return CommandSubmissionResponse(
         command_id=command_id,
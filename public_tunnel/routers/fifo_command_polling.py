@@ -3,10 +3,17 @@ US-007: Command FIFO Queue Management Router
 
 Handles FIFO-ordered command polling from specified sessions.
 Ensures commands are returned in first-in-first-out order with single command per polling.
+Supports long-polling so idle clients do not need to re-poll while their queue is empty.
+
+Responses are written from each command's pre-serialized wire payload
+(serialized once at submit time) instead of building and validating the
+response model on every poll.
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, Dict, Any
+import asyncio
+import json
+from fastapi import APIRouter, Query, Response
+from typing import List
 
 from public_tunnel.models.session import FIFOCommandPollingResponse
 from public_tunnel.dependencies.providers import CommandQueueManagerDep
@@ -14,73 +21,121 @@ from public_tunnel.models.command import Command
 
 router = APIRouter(tags=["fifo-command-polling"])
 
+# Upper bound for long-poll waiting to keep idle connections bounded
+MAX_POLL_WAIT_SECONDS = 60.0
+
+# Upper bound for batch polling to keep response sizes bounded
+MAX_COMMANDS_PER_POLL = 100
+
 
-def convert_command_to_response_format(command: Command) -> Dict[str, Any]:
+def build_polling_response_body(
+    session_id: str,
+    client_id: str,
+    commands: List[Command],
+    remaining_queue_size: int
+) -> bytes:
     """
-    Convert Command domain object to response dictionary format
+    Build FIFOCommandPollingResponse JSON from pre-serialized command payloads
     
     Args:
-        command: Command domain object
+        session_id: Session identifier
+        client_id: Client identifier
+        commands: Commands returned by this poll in FIFO order
+        remaining_queue_size: Commands left in the client queue
         
     Returns:
-        Dict containing command data in API response format
+        bytes: Response body in FIFOCommandPollingResponse format
     """
-    return {
-        "command_id": command.command_id,
-        "content": command.content,
-        "target_client": command.target_client,
-        "session_id": command.session_id
-    }
+    command_payloads = [command.to_wire_payload() for command in commands]
+    
+    # queue_position is deprecated and always 0 (see FIFOCommandPollingResponse)
+    return b"".join((
+        b'{"session_id":', json.dumps(session_id, ensure_ascii=False).encode("utf-8"),
+        b',"client_id":', json.dumps(client_id, ensure_ascii=False).encode("utf-8"),
+        b',"command":', command_payloads[0] if command_payloads else b"null",
+        b',"commands":[', b",".join(command_payloads),
+        b'],"queue_position":0,"total_queue_size":', str(remaining_queue_size).encode("ascii"),
+        b"}"
+    ))
 
 
 @router.get(
     "/api/sessions/{session_id}/clients/{client_id}/commands/poll",
     response_model=FIFOCommandPollingResponse,
     summary="Client polls for commands in FIFO order from specified session",
-    description="US-007: Returns single command in first-in-first-out order. Each polling returns only one command."
+    description="US-007: Returns single command in first-in-first-out order. Each polling returns only one command. "
+                "Optional wait_seconds holds the request open until a command arrives (long-poll). "
+                "Optional max_commands returns up to that many commands in FIFO order."
 )
 async def poll_commands_in_fifo_order_from_session(
     session_id: str,
     client_id: str,
-    queue_manager: CommandQueueManagerDep
-) -> FIFOCommandPollingResponse:
+    queue_manager: CommandQueueManagerDep,
+    wait_seconds: float = Query(
+        default=0.0,
+        ge=0.0,
+        le=MAX_POLL_WAIT_SECONDS,
+        description="Seconds to wait for a command when the queue is empty (0 returns immediately)"
+    ),
+    max_commands: int = Query(
+        default=1,
+        ge=1,
+        le=MAX_COMMANDS_PER_POLL,
+        description="Maximum number of commands to return in FIFO order"
+    )
+) -> Response:
     """
     Client polls for commands from specified session in FIFO order.
     
     US-007 Implementation:
     - Commands are queued in FIFO order
-    - Each polling returns only ONE command
+    - Each polling returns only ONE command by default
     - Commands returned in first-in-first-out sequence
     - Queue position and size information provided
+    - Long-poll: with wait_seconds > 0 an empty queue parks the request until
+      a command is submitted for this client or the wait elapses
+    - Batch: with max_commands > 1 a backlog is drained in FIFO order, the
+      first command is also exposed as `command` for compatibility
     
     Args:
         session_id: Target session identifier
         client_id: Client identifier requesting commands
         queue_manager: Command queue management service
+        wait_seconds: Maximum seconds to wait for a command
+        max_commands: Maximum number of commands to return
         
     Returns:
-        FIFOCommandPollingResponse: Single command in FIFO order with queue info
+        Response: FIFOCommandPollingResponse JSON with command(s) in FIFO order and queue info
     """
-    command, remaining_queue_size = queue_manager.get_next_command_with_queue_info(
+    commands, remaining_queue_size = queue_manager.get_next_commands_with_queue_info(
         session_id=session_id,
-        client_id=client_id
+        client_id=client_id,
+        max_commands=max_commands
     )
     
-    if command:
-        command_dict = convert_command_to_response_format(command)
+    if not commands and wait_seconds > 0:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_seconds
         
-        return FIFOCommandPollingResponse(
-            session_id=session_id,
-            client_id=client_id,
-            command=command_dict,
-            queue_position=0,
-            total_queue_size=remaining_queue_size
-        )
-    else:
-        return FIFOCommandPollingResponse(
-            session_id=session_id,
-            client_id=client_id,
-            command=None,
-            queue_position=0,
-            total_queue_size=0
-        )
\ No newline at end of file
+        # Another poller of the same client may take the command first,
+        # so keep waiting for the remaining time until one is obtained
+        while not commands:
+            remaining_wait = deadline - loop.time()
+            if remaining_wait <= 0:
+                break
+            if not await queue_manager.wait_for_command(session_id, client_id, remaining_wait):
+                break
+            commands, remaining_queue_size = queue_manager.get_next_commands_with_queue_info(
+                session_id=session_id,
+                client_id=client_id,
+                max_commands=max_commands
+            )
+    
+    if not commands:
+        remaining_queue_size = 0
+    
+    # Fast path: write pre-serialized bytes, skipping response model validation
+    return Response(
+        content=build_polling_response_body(session_id, client_id, commands, remaining_queue_size),
+        media_type="application/json"
+    )
\ No newline at end of file
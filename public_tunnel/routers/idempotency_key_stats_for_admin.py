@@ -0,0 +1,46 @@
+"""
+Idempotency key index stats router
+
+Admin endpoint reporting how many Idempotency-Key entries are held, their
+estimated memory and the eviction counters of the bounded index.
+Requires admin token authentication via Authorization header.
+"""
+
+from fastapi import APIRouter, HTTPException, Header
+from typing import Optional
+from public_tunnel.models.command import IdempotencyKeyIndexStatsResponse
+from public_tunnel.dependencies.providers import (
+    IdempotencyKeyIndexDep,
+    AdminTokenValidatorDep
+)
+
+router = APIRouter(tags=["admin"])
+
+
+@router.get("/api/admin/idempotency-keys", response_model=IdempotencyKeyIndexStatsResponse)
+async def get_idempotency_key_index_stats_for_admin(
+    idempotency_key_index: IdempotencyKeyIndexDep,
+    admin_validator: AdminTokenValidatorDep,
+    authorization: Optional[str] = Header(None)
+) -> IdempotencyKeyIndexStatsResponse:
+    """
+    Report size, memory and evictions of the idempotency key index (admin only)
+    
+    Args:
+        idempotency_key_index: Submission deduplication service
+        admin_validator: Admin token validator service
+        authorization: Authorization header containing admin token
+        
+    Returns:
+        IdempotencyKeyIndexStatsResponse: Current entries, limits and counters
+        
+    Raises:
+        HTTPException: 403 if token is invalid/missing
+    """
+    if not admin_validator.is_admin_request(authorization):
+        raise HTTPException(
+            status_code=403,
+            detail="Admin token required for idempotency key stats access"
+        )
+    
+    return IdempotencyKeyIndexStatsResponse(**idempotency_key_index.get_stats())
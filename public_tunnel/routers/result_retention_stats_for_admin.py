@@ -0,0 +1,47 @@
+"""
+Result retention stats router
+
+Admin endpoint reporting how many execution results are retained, their
+estimated memory and the eviction counters of the bounded result store,
+so nodes can be sized from real numbers.
+Requires admin token authentication via Authorization header.
+"""
+
+from fastapi import APIRouter, HTTPException, Header
+from typing import Optional
+from public_tunnel.models.execution_result import ResultRetentionStatsResponse
+from public_tunnel.dependencies.providers import (
+    ExecutionResultManagerDep,
+    AdminTokenValidatorDep
+)
+
+router = APIRouter(tags=["admin"])
+
+
+@router.get("/api/admin/results", response_model=ResultRetentionStatsResponse)
+async def get_result_retention_stats_for_admin(
+    result_manager: ExecutionResultManagerDep,
+    admin_validator: AdminTokenValidatorDep,
+    authorization: Optional[str] = Header(None)
+) -> ResultRetentionStatsResponse:
+    """
+    Report count, memory and evictions of retained execution results (admin only)
+    
+    Args:
+        result_manager: Execution result manager service
+        admin_validator: Admin token validator service
+        authorization: Authorization header containing admin token
+        
+    Returns:
+        ResultRetentionStatsResponse: Current results, limits and counters
+        
+    Raises:
+        HTTPException: 403 if token is invalid/missing
+    """
+    if not admin_validator.is_admin_request(authorization):
+        raise HTTPException(
+            status_code=403,
+            detail="Admin token required for result retention stats access"
+        )
+    
+    return ResultRetentionStatsResponse(**result_manager.get_retention_stats())
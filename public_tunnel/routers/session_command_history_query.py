@@ -5,8 +5,10 @@ Handles command history queries from specific sessions.
 Allows AI assistant to list and review past command operations.
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
 from public_tunnel.models.session import SessionCommandHistoryResponse
+from public_tunnel.models.execution_result import ExecutionResultStatus
 from public_tunnel.dependencies.providers import SessionRepositoryDep, ExecutionResultManagerDep
 
 router = APIRouter(tags=["session-command-history"])
@@ -16,7 +18,19 @@ router = APIRouter(tags=["session-command-history"])
 async def get_session_command_history(
     session_id: str,
     session_repo: SessionRepositoryDep,
-    result_manager: ExecutionResultManagerDep
+    result_manager: ExecutionResultManagerDep,
+    since: Optional[str] = Query(
+        default=None,
+        description="Only list commands created after this command ID"
+    ),
+    client_id: Optional[str] = Query(
+        default=None,
+        description="Only list commands that targeted this client"
+    ),
+    status: Optional[ExecutionResultStatus] = Query(
+        default=None,
+        description="Only list commands whose result has this status"
+    )
 ) -> SessionCommandHistoryResponse:
     """
     Get command history for a specific session
@@ -28,6 +42,9 @@ async def get_session_command_history(
         session_id: The session identifier to query command history for
         session_repo: Session repository for data retrieval
         result_manager: Execution result manager for command history
+        since: Optional command ID; only commands created after it are listed
+        client_id: Optional client filter
+        status: Optional result status filter
         
     Returns:
         SessionCommandHistoryResponse: List of command IDs and session information
@@ -35,8 +52,14 @@ async def get_session_command_history(
     Raises:
         HTTPException: 501 Not Implemented during API skeleton phase
     """
-    # Get all command IDs that have been executed in this session
-    command_ids = result_manager.get_command_ids_by_session(session_id)
+    # Served from the per-session / per-client / per-status indexes, never a scan of all results;
+    # command IDs are time-sortable, so "since" is a range scan over the session index
+    command_ids = result_manager.query_command_ids(
+        session_id,
+        client_id=client_id,
+        status=status,
+        since_command_id=since
+    )
     
     return SessionCommandHistoryResponse(
         session_id=session_id,
@@ -5,12 +5,22 @@ Handles targeted command submission functionality for specific clients within se
 This is the core implementation for US-006: Targeted Client Command Submission.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Header, Response
+from typing import Optional
 from datetime import datetime
 from public_tunnel.models.command import (
     SubmitCommandToTargetClientRequest, 
     CommandSubmissionToTargetResponse,
-    CommandExecutionStatus
+    CommandExecutionStatus,
+    BulkCommandSubmissionRequest,
+    BulkCommandSubmissionResponse,
+    BulkCommandRejection
+)
+from public_tunnel.services.command_queue_manager import CommandQueueFullError
+from public_tunnel.services.idempotency_key_index import (
+    IdempotencyKeyConflictError,
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    compute_request_fingerprint
 )
 from public_tunnel.dependencies.providers import (
     SessionRepositoryDep, 
@@ -18,13 +28,19 @@ from public_tunnel.dependencies.providers import (
     CommandQueueManagerDep,
     ClientPresenceTrackerDep,
     OfflineStatusManagerDep,
-    ExecutionResultManagerDep
+    ExecutionResultManagerDep,
+    CommandExpirySchedulerDep,
+    IdempotencyKeyIndexDep
 )
 
 router: APIRouter = APIRouter(tags=["targeted-command-submission"])
 
 
-@router.post("/api/sessions/{session_id}/commands/submit", response_model=CommandSubmissionToTargetResponse)
+@router.post(
+    "/api/sessions/{session_id}/commands/submit",
+    response_model=CommandSubmissionToTargetResponse,
+    responses={409: {"description": "Idempotency-Key reused for a different request, or original request still in progress"}}
+)
 async def submit_command_to_target_client_in_session(
     session_id: str,
     command_request: SubmitCommandToTargetClientRequest,
@@ -33,7 +49,14 @@ async def submit_command_to_target_client_in_session(
     command_queue_manager: CommandQueueManagerDep,
     client_presence_tracker: ClientPresenceTrackerDep,
     offline_status_manager: OfflineStatusManagerDep,
-    result_manager: ExecutionResultManagerDep
+    result_manager: ExecutionResultManagerDep,
+    command_expiry_scheduler: CommandExpirySchedulerDep,
+    idempotency_key_index: IdempotencyKeyIndexDep,
+    idempotency_key: Optional[str] = Header(
+        default=None,
+        max_length=MAX_IDEMPOTENCY_KEY_LENGTH,
+        description="Retries carrying the same key return the original submission instead of enqueuing again"
+    )
 ) -> CommandSubmissionToTargetResponse:
     """
     Submit command to a specific target client within a session
@@ -46,6 +69,10 @@ async def submit_command_to_target_client_in_session(
     - FIFO queue management ensures fair command processing
     - Rejects commands targeting clients that have not registered via polling
     - Rejects commands targeting offline clients to prevent command loss
+    - Rejects commands over the queue depth / byte limits (backpressure)
+    - Commands with timeout_seconds expire and their result becomes FAILED
+    - Commands with not_before / delay_seconds reach the client only once due
+    - Retries with the same Idempotency-Key replay the original response
     
     Args:
         session_id: The session identifier where the command will be submitted
@@ -55,13 +82,92 @@ async def submit_command_to_target_client_in_session(
         command_queue_manager: Command queue management service
         client_presence_tracker: Client presence tracking service
         offline_status_manager: Offline status management service
+        result_manager: Execution result management service
+        command_expiry_scheduler: Command timeout enforcement service
+        idempotency_key_index: Submission deduplication service
+        idempotency_key: Optional Idempotency-Key header
         
     Returns:
         CommandSubmissionToTargetResponse: Command submission confirmation with details
         
     Raises:
         HTTPException: 404 Not Found when target client has not registered (US-013)
+        HTTPException: 409 Conflict when the Idempotency-Key cannot be used for this request
         HTTPException: 422 Unprocessable Entity when target client is offline (US-014)
+        HTTPException: 429 Too Many Requests with Retry-After when a queue limit is reached
+    """
+    if idempotency_key is None:
+        return await submit_command_and_create_result(
+            session_id, command_request, command_queue_manager, client_presence_tracker,
+            offline_status_manager, result_manager, command_expiry_scheduler
+        )
+    
+    request_fingerprint = compute_request_fingerprint(command_request.model_dump(mode="json", include={
+        "target_client_id",
+        "command_content",
+        "priority",
+        "timeout_seconds",
+        "not_before",
+        "delay_seconds"
+    }))
+    try:
+        recorded_response_body = idempotency_key_index.begin_submission(
+            session_id, idempotency_key, request_fingerprint
+        )
+    except IdempotencyKeyConflictError as error:
+        raise HTTPException(status_code=409, detail=str(error))
+    
+    if recorded_response_body is not None:
+        # Retry of a submission that already went through: replay, do not enqueue again
+        return Response(
+            content=recorded_response_body,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"}
+        )
+    
+    try:
+        submission_response = await submit_command_and_create_result(
+            session_id, command_request, command_queue_manager, client_presence_tracker,
+            offline_status_manager, result_manager, command_expiry_scheduler
+        )
+    except BaseException:
+        # No response was recorded (errors, or the request cancelled while awaiting
+        # durability), so a retry with this key must be processed again, not get 409
+        idempotency_key_index.abandon_submission(session_id, idempotency_key)
+        raise
+    
+    idempotency_key_index.complete_submission(
+        session_id, idempotency_key, submission_response.model_dump_json().encode("utf-8")
+    )
+    return submission_response
+
+
+async def submit_command_and_create_result(
+    session_id: str,
+    command_request: SubmitCommandToTargetClientRequest,
+    command_queue_manager,
+    client_presence_tracker,
+    offline_status_manager,
+    result_manager,
+    command_expiry_scheduler
+) -> CommandSubmissionToTargetResponse:
+    """
+    Validate the target client, enqueue the command durably and create its PENDING result
+    
+    Args:
+        session_id: The session identifier where the command will be submitted
+        command_request: Command details including content and target client
+        command_queue_manager: Command queue management service
+        client_presence_tracker: Client presence tracking service
+        offline_status_manager: Offline status management service
+        result_manager: Execution result management service
+        command_expiry_scheduler: Command timeout enforcement service
+        
+    Returns:
+        CommandSubmissionToTargetResponse: Command submission confirmation with details
+        
+    Raises:
+        HTTPException: 404 / 422 / 429 as described on the endpoint
     """
     # US-013: Non Existent Client Error Handling
     # Check if target client has ever registered (via polling) in this session
@@ -93,26 +199,202 @@ async def submit_command_to_target_client_in_session(
     
     # US-006: Original implementation continues for registered and online clients
     # Submit command to target client's queue using queue manager
-    command = command_queue_manager.submit_command_to_target_client(
-        session_id=session_id,
-        target_client_id=command_request.target_client_id,
-        command_content=command_request.command_content
-    )
+    try:
+        command = command_queue_manager.submit_command_to_target_client(
+            session_id=session_id,
+            target_client_id=command_request.target_client_id,
+            command_content=command_request.command_content,
+            priority=command_request.priority,
+            timeout_seconds=command_request.timeout_seconds,
+            not_before=command_request.get_release_timestamp()
+        )
+    except CommandQueueFullError as error:
+        # Backpressure: tell the submitter when the queue is expected to have room
+        raise HTTPException(
+            status_code=429,
+            detail=str(error),
+            headers={"Retry-After": str(error.retry_after_seconds)}
+        )
     
     # US-021: Create execution result record for unified query mechanism
+    # Created before the first await, so a client that picks the command up
+    # and reports its result meanwhile finds the record instead of racing it
     from public_tunnel.models.execution_result import ExecutionResultStatus
     result_manager.create_and_store_result(
         command_id=command.command_id,
         session_id=session_id,
         client_id=command_request.target_client_id,
-        execution_status=ExecutionResultStatus.PENDING
+        execution_status=ExecutionResultStatus.PENDING,
+        command_content=command_request.command_content
     )
+    command_expiry_scheduler.schedule_command_expiry(command)
+    
+    # Persistent queues: confirm only once the submission is on disk
+    await command_queue_manager.wait_until_durable([command])
     
     # Return response with command information
+    return _build_submission_response(
+        session_id, command, datetime.now(), command_queue_manager, result_manager
+    )
+
+
+@router.post("/api/sessions/{session_id}/commands/submit-bulk", response_model=BulkCommandSubmissionResponse)
+async def submit_commands_in_bulk_to_target_clients_in_session(
+    session_id: str,
+    bulk_request: BulkCommandSubmissionRequest,
+    command_queue_manager: CommandQueueManagerDep,
+    offline_status_manager: OfflineStatusManagerDep,
+    result_manager: ExecutionResultManagerDep,
+    command_expiry_scheduler: CommandExpirySchedulerDep
+) -> BulkCommandSubmissionResponse:
+    """
+    Submit many commands, or broadcast one command, to clients within a session
+    
+    Bulk variant of US-006 for fan-out to large numbers of devices:
+    - Explicit (target_client_id, command_content) pairs, and/or
+    - broadcast_command_content sent to every online client in the session
+    - Targets are validated against one presence snapshot (US-013 / US-014 rules)
+    - Accepted commands are enqueued under one queue lock acquisition
+    - Invalid targets and targets whose queue is full are reported
+      individually instead of failing the batch
+    - timeout_seconds of the request applies to commands without their own
+    - not_before / delay_seconds of each command delay its delivery
+    
+    Args:
+        session_id: The session identifier where the commands will be submitted
+        bulk_request: Explicit command list and/or broadcast command
+        command_queue_manager: Command queue management service
+        offline_status_manager: Offline status management service
+        result_manager: Execution result management service
+        command_expiry_scheduler: Command timeout enforcement service
+        
+    Returns:
+        BulkCommandSubmissionResponse: Submitted command ids and rejected targets
+        
+    Raises:
+        HTTPException: 422 Unprocessable Entity when no command is given
+    """
+    if not bulk_request.commands and bulk_request.broadcast_command_content is None:
+        raise HTTPException(
+            status_code=422,
+            detail="Bulk submission requires 'commands' and/or 'broadcast_command_content'."
+        )
+    
+    # One snapshot of client eligibility for the whole batch
+    eligibility_snapshot = offline_status_manager.get_command_eligibility_snapshot(session_id)
+    
+    target_commands = []
+    rejected_commands = []
+    
+    for command_request in bulk_request.commands:
+        target_client_id = command_request.target_client_id
+        is_eligible = eligibility_snapshot.get(target_client_id)
+        
+        if is_eligible is None:
+            # US-013: Client has never registered via polling
+            rejected_commands.append(BulkCommandRejection(
+                target_client_id=target_client_id,
+                error_code="CLIENT_NOT_FOUND",
+                error_message=f"Client '{target_client_id}' has not registered in session '{session_id}'."
+            ))
+        elif not is_eligible:
+            # US-014: Client is offline
+            rejected_commands.append(BulkCommandRejection(
+                target_client_id=target_client_id,
+                error_code="CLIENT_OFFLINE",
+                error_message=f"Cannot submit command to offline client '{target_client_id}'."
+            ))
+        else:
+            target_commands.append((
+                target_client_id,
+                command_request.command_content,
+                command_request.priority,
+                command_request.timeout_seconds or bulk_request.timeout_seconds,
+                command_request.get_release_timestamp()
+            ))
+    
+    if bulk_request.broadcast_command_content is not None:
+        for client_id, is_eligible in eligibility_snapshot.items():
+            if is_eligible:
+                target_commands.append((
+                    client_id,
+                    bulk_request.broadcast_command_content,
+                    bulk_request.broadcast_priority,
+                    bulk_request.timeout_seconds,
+                    None
+                ))
+    
+    commands, queue_full_rejections = command_queue_manager.submit_commands_to_target_clients(
+        session_id=session_id,
+        target_commands=target_commands
+    )
+    
+    for target_client_id, error in queue_full_rejections:
+        rejected_commands.append(BulkCommandRejection(
+            target_client_id=target_client_id,
+            error_code="QUEUE_FULL",
+            error_message=str(error),
+            retry_after_seconds=error.retry_after_seconds
+        ))
+    
+    # US-021: Create execution result records for unified query mechanism
+    from public_tunnel.models.execution_result import ExecutionResultStatus
+    for command in commands:
+        result_manager.create_and_store_result(
+            command_id=command.command_id,
+            session_id=session_id,
+            client_id=command.target_client,
+            execution_status=ExecutionResultStatus.PENDING,
+            command_content=command.content
+        )
+        command_expiry_scheduler.schedule_command_expiry(command)
+    
+    # Persistent queues: confirm only once the submissions are on disk
+    await command_queue_manager.wait_until_durable(commands)
+    
+    submission_timestamp = datetime.now()
+    submitted_commands = [
+        _build_submission_response(
+            session_id, command, submission_timestamp, command_queue_manager, result_manager
+        )
+        for command in commands
+    ]
+    
+    return BulkCommandSubmissionResponse(
+        session_id=session_id,
+        submitted_commands=submitted_commands,
+        rejected_commands=rejected_commands,
+        total_submitted=len(submitted_commands),
+        total_rejected=len(rejected_commands)
+    )
+
+
+def _build_submission_response(
+    session_id: str,
+    command,
+    submission_timestamp: datetime,
+    command_queue_manager,
+    result_manager
+) -> CommandSubmissionToTargetResponse:
+    """Describe a submitted command, including its queue position and ETA"""
+    queue_position = command_queue_manager.get_command_queue_position(session_id, command.command_id)
+    
     return CommandSubmissionToTargetResponse(
         command_id=command.command_id,
         execution_status=CommandExecutionStatus.PENDING,
-        submission_timestamp=datetime.now(),
-        target_client_id=command_request.target_client_id,
-        estimated_completion_time=None  # Will be estimated after queue processing
-    )
\ No newline at end of file
+        submission_timestamp=submission_timestamp,
+        target_client_id=command.target_client,
+        estimated_completion_time=result_manager.estimate_completion_time(
+            session_id, command.target_client, queue_position
+        ),
+        queue_depth=command_queue_manager.get_queue_size_for_client(session_id, command.target_client),
+        queue_position=queue_position,
+        not_before=_get_release_datetime(command)
+    )
+
+
+def _get_release_datetime(command) -> Optional[datetime]:
+    """Release time of a delayed command for the submission response"""
+    if command.not_before is None:
+        return None
+    return datetime.fromtimestamp(command.not_before)
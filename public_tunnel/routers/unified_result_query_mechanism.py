@@ -3,19 +3,73 @@ US-021: Unified Result Query Mechanism Router
 
 Provides unified query mechanism for all command results with automatic timeout handling.
 This is the server-side implementation of consistent result management.
+Supports long-polling so callers do not need to re-query until a result is final.
+Large result bodies are kept on disk; queries return a preview and the full
+body is streamed from the content endpoint. Many results can be fetched,
+and waited for, in one batch request.
+
+Finished results never change, so their serialized response is cached on
+the result together with a strong ETag: repeated queries write the cached
+bytes, and a matching If-None-Match is answered with 304.
 """
 
-from fastapi import APIRouter, HTTPException
+import json
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Response, Header
+from fastapi.responses import FileResponse
 
-from public_tunnel.models.execution_result import UnifiedResultQueryResponse, ExecutionResultSubmissionRequest
-from public_tunnel.dependencies.providers import SessionRepositoryDep, ExecutionResultManagerDep
+from public_tunnel.models.execution_result import (
+    UnifiedResultQueryResponse,
+    ExecutionResultSubmissionRequest,
+    BatchResultQueryRequest,
+    BatchResultQueryResponse,
+    BatchResultWaitMode
+)
+from public_tunnel.dependencies.providers import (
+    SessionRepositoryDep,
+    ExecutionResultManagerDep,
+    CommandQueueManagerDep
+)
 
 router = APIRouter(tags=["unified-result-query-mechanism"])
 
+# Upper bound for result long-poll waiting to keep idle connections bounded
+MAX_RESULT_WAIT_SECONDS = 60.0
+
 
 # Removed _determine_execution_mode_from_command_id as CommandExecutionMode is no longer needed
 
 
+def _if_none_match_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, as RFC 9110 requires)"""
+    if not if_none_match:
+        return False
+    for candidate_etag in if_none_match.split(","):
+        candidate_etag = candidate_etag.strip()
+        if candidate_etag.startswith("W/"):
+            candidate_etag = candidate_etag[2:]
+        if candidate_etag == "*" or candidate_etag == etag:
+            return True
+    return False
+
+
+def build_result_query_response(result, if_none_match: Optional[str] = None) -> Response:
+    """Write a result query response from the result's serialized bytes
+    
+    Args:
+        result: ExecutionResult to respond with
+        if_none_match: If-None-Match request header
+        
+    Returns:
+        Response: 304 if the caller already has this version, otherwise the
+        UnifiedResultQueryResponse JSON; both carry the ETag
+    """
+    response_body, etag = result.get_serialized_response()
+    if _if_none_match_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=response_body, media_type="application/json", headers={"ETag": etag})
+
+
 def _handle_missing_result(
     command_id: str, 
     session_id: str, 
@@ -73,7 +127,8 @@ def _update_existing_result(result_manager, result_request, session_id: str) ->
         command_id=result_request.command_id,
         new_status=result_request.execution_status,
         result_content=result_request.result_content,
-        error_message=result_request.error_message
+        error_message=result_request.error_message,
+        execution_duration_seconds=result_request.execution_duration_seconds
     )
     
     if not success:
@@ -123,13 +178,21 @@ def _create_new_result(result_manager, result_request, session_id: str) -> dict:
     "/api/sessions/{session_id}/results/{command_id}",
     response_model=UnifiedResultQueryResponse,
     summary="Query unified result for all commands",
-    description="US-021: Returns execution results through same API regardless of execution time. Provides consistent result management across all command types with automatic timeout handling."
+    description="US-021: Returns execution results through same API regardless of execution time. Provides consistent result management across all command types with automatic timeout handling. "
+                "Optional wait_seconds holds the request open until the result is completed, failed or cancelled (long-poll)."
 )
 async def query_unified_command_result(
     session_id: str,
     command_id: str,
     session_repo: SessionRepositoryDep,
-    result_manager: ExecutionResultManagerDep
+    result_manager: ExecutionResultManagerDep,
+    wait_seconds: float = Query(
+        default=0.0,
+        ge=0.0,
+        le=MAX_RESULT_WAIT_SECONDS,
+        description="Seconds to wait for a pending or running result to finish (0 returns immediately)"
+    ),
+    if_none_match: Optional[str] = Header(None)
 ) -> UnifiedResultQueryResponse:
     """
     Query unified command result for consistent result management.
@@ -139,33 +202,148 @@ async def query_unified_command_result(
     - Same API endpoint regardless of command execution mode
     - Command-id indexing for all result types
     - Consistent result format across different execution modes
+    - Long-poll: with wait_seconds > 0 an unfinished result parks the request
+      until the result manager reports it finished or the wait elapses
+    - Conditional: responses carry an ETag; If-None-Match with the current
+      ETag returns 304 without a body
     
     Args:
         session_id: Target session identifier
         command_id: Command identifier to query result for
         session_repo: Session repository for data retrieval
         result_manager: Execution result manager for unified query
+        wait_seconds: Maximum seconds to wait for a final result
+        if_none_match: ETag of the version the caller already has
         
     Returns:
         UnifiedResultQueryResponse: Unified result format for both sync and async
+        (written from cached bytes for finished results), or 304
         
     Raises:
         HTTPException: 404 if command result not found
     """
     from public_tunnel.models.execution_result import ExecutionResultStatus
     
+    if wait_seconds > 0 and result_manager.get_result_by_command_id(command_id) is not None:
+        # Woken by store_result / update_result_status, no re-query loop
+        await result_manager.wait_for_completion(command_id, timeout_seconds=wait_seconds)
+    
     # GREEN Stage 2: Real implementation using result manager
-    unified_response = result_manager.get_unified_response(command_id)
+    result = result_manager.get_result_by_command_id(command_id)
     
-    if not unified_response:
+    if not result:
         # Handle missing results based on context
-        unified_response = _handle_missing_result(
+        return _handle_missing_result(
             command_id=command_id,
             session_id=session_id,
             result_manager=result_manager
         )
     
-    return unified_response
+    # Fast path: cached bytes for finished results, skipping response model validation
+    return build_result_query_response(result, if_none_match)
+
+
+@router.get(
+    "/api/sessions/{session_id}/results/{command_id}/content",
+    response_class=Response,
+    summary="Download the full result content",
+    description="Streams the full result_content as text. Bodies spilled to disk are served from the file "
+                "without being loaded into memory; query responses only carry a preview of them."
+)
+async def download_full_result_content(
+    session_id: str,
+    command_id: str,
+    result_manager: ExecutionResultManagerDep
+) -> Response:
+    """
+    Download the full result body of a command.
+    
+    Args:
+        session_id: Target session identifier
+        command_id: Command identifier to download the result body of
+        result_manager: Execution result manager for result lookup
+        
+    Returns:
+        Response: text/plain body, streamed from disk for spilled results
+        
+    Raises:
+        HTTPException: 404 if the session has no result for the command
+    """
+    result = result_manager.get_result_by_command_id(command_id)
+    if result is None or result.session_id != session_id:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Execution result not found for command {command_id}"
+        )
+    
+    spilled_content_path = result_manager.get_spilled_content_path(command_id)
+    if spilled_content_path is not None:
+        return FileResponse(spilled_content_path, media_type="text/plain; charset=utf-8")
+    
+    return Response(content=result.result_content or "", media_type="text/plain; charset=utf-8")
+
+
+@router.post(
+    "/api/sessions/{session_id}/results/batch",
+    response_model=BatchResultQueryResponse,
+    summary="Query results of many commands in one call",
+    description="Returns the results of up to 1000 command ids. Optional only_finished drops pending and running results. "
+                "Optional wait_mode 'any' / 'all' holds the request until any / all of the results are finished or wait_seconds elapses."
+)
+async def query_batch_command_results(
+    session_id: str,
+    batch_request: BatchResultQueryRequest,
+    result_manager: ExecutionResultManagerDep
+) -> Response:
+    """
+    Query many command results at once, optionally waiting for them.
+    
+    Replaces a fan-out polling loop: one request returns every result, and
+    with wait_mode it returns as soon as any / all of them are finished.
+    
+    Args:
+        session_id: Target session identifier
+        batch_request: Command ids, filter and wait options
+        result_manager: Execution result manager for unified query
+        
+    Returns:
+        Response: BatchResultQueryResponse JSON with results in request order,
+        missing ids and counts; finished results are written from cached bytes
+    """
+    command_ids = list(dict.fromkeys(batch_request.command_ids))
+    
+    if batch_request.wait_mode is not None and batch_request.wait_seconds > 0:
+        # Woken by store_result / update_result_status, no re-query loop
+        await result_manager.wait_for_completions(
+            command_ids,
+            timeout_seconds=batch_request.wait_seconds,
+            wait_for_all=batch_request.wait_mode == BatchResultWaitMode.ALL
+        )
+    
+    serialized_results = []
+    missing_command_ids = []
+    finished_count = 0
+    for command_id in command_ids:
+        result = result_manager.get_result_by_command_id(command_id)
+        if result is None or result.session_id != session_id:
+            missing_command_ids.append(command_id)
+            continue
+        
+        is_finished = result.is_finished()
+        finished_count += is_finished
+        if is_finished or not batch_request.only_finished:
+            serialized_results.append(result.get_serialized_response()[0])
+    
+    # Fast path: splice the per-result JSON into the response, skipping response model validation
+    response_body = b"".join([
+        b'{"session_id":', json.dumps(session_id).encode("utf-8"),
+        b',"results":[', b",".join(serialized_results),
+        b'],"missing_command_ids":', json.dumps(missing_command_ids).encode("utf-8"),
+        b',"finished_count":', str(finished_count).encode("ascii"),
+        b',"unfinished_count":', str(len(command_ids) - len(missing_command_ids) - finished_count).encode("ascii"),
+        b"}"
+    ])
+    return Response(content=response_body, media_type="application/json")
 
 
 @router.post(
@@ -177,7 +355,8 @@ async def submit_result_for_unified_storage(
     session_id: str,
     result_request: ExecutionResultSubmissionRequest,
     session_repo: SessionRepositoryDep,
-    result_manager: ExecutionResultManagerDep
+    result_manager: ExecutionResultManagerDep,
+    queue_manager: CommandQueueManagerDep
 ) -> dict:
     """
     Submit execution result for unified storage mechanism.
@@ -186,16 +365,21 @@ async def submit_result_for_unified_storage(
     - Results stored with command-id indexing
     - Unified storage for both sync and async command results
     - Consistent result format across execution modes
+    - Reporting a result acknowledges the command's delivery lease
     
     Args:
         session_id: Target session identifier
         result_request: Execution result data for unified storage
         session_repo: Session repository for data storage
         result_manager: Execution result manager for unified storage
+        queue_manager: Command queue manager for delivery acknowledgement
         
     Returns:
         Dict: Result submission confirmation
     """
+    # A reported result implies the client received the command
+    queue_manager.acknowledge_command(session_id, result_request.command_id)
+    
     # Handle result submission (update existing or create new)
     existing_result = result_manager.get_result_by_command_id(result_request.command_id)
     
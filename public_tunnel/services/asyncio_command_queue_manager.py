@@ -0,0 +1,148 @@
+"""
+Asyncio Command Queue Manager Service
+
+Event-loop-native variant of CommandQueueManager for single-process
+deployments where every queue operation runs on one asyncio event loop
+(the uvicorn worker loop).
+
+CommandQueueManager guards sessions with threading.RLock; called from async
+handlers, a contended acquire blocks the whole event loop. Here the queue
+state is only ever touched from the loop thread, and every operation is a
+synchronous section without awaits, so the loop itself serializes them and
+no lock is needed. Long-poll waiting uses one asyncio.Condition per client
+queue instead of thread-safe future callbacks.
+
+Interface and semantics (priority lanes, leases, limits, expiry) are the
+same as CommandQueueManager. Must not be shared with other threads.
+
+Not selectable through get_command_queue_manager: the
+benchmarks.command_queue_event_loop_lag benchmark has not shown it beating
+InMemoryCommandQueueManager, so it is kept for experiments only.
+"""
+
+from typing import Dict, Set, Tuple
+from contextlib import nullcontext
+import asyncio
+
+from public_tunnel.services.command_queue_manager import CommandQueueManager
+
+
+# Shared no-op context manager standing in for session locks
+_NO_LOCK = nullcontext()
+
+
+class AsyncioCommandQueueManager(CommandQueueManager):
+    """
+    CommandQueueManager without blocking locks, for use on one event loop
+    
+    Features:
+    - No threading locks: sections run atomically between awaits
+    - Per-client asyncio.Condition for long-poll waiting
+    - Each submitted command wakes exactly one waiter of the target client
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize manager (same arguments as CommandQueueManager)
+        """
+        super().__init__(*args, **kwargs)
+        self._held_bytes_lock = _NO_LOCK
+        # Structure: {(session_id, client_id): (event_loop, asyncio.Condition)}
+        self._command_conditions: Dict[Tuple[str, str], Tuple[asyncio.AbstractEventLoop, asyncio.Condition]] = {}
+        # Structure: {(session_id, client_id): number of waiting requests}
+        self._command_condition_waiter_counts: Dict[Tuple[str, str], int] = {}
+        # Pending notification tasks; the loop only keeps weak references to tasks
+        self._notify_tasks: Set[asyncio.Task] = set()
+    
+    def _get_session_lock(self, session_id: str):
+        """Sessions need no lock: the event loop serializes all operations"""
+        return _NO_LOCK
+    
+    async def wait_for_command(
+        self,
+        session_id: str,
+        client_id: str,
+        wait_seconds: float
+    ) -> bool:
+        """
+        Wait until a command is queued for specific client (long-poll support)
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier waiting for commands
+            wait_seconds: Maximum seconds to wait
+        
+        Returns:
+            bool: True if a command is (or became) available, False on timeout
+        """
+        if self.get_queue_size_for_client(session_id, client_id) > 0:
+            return True
+        
+        loop = asyncio.get_running_loop()
+        condition_key = (session_id, client_id)
+        condition_entry = self._command_conditions.get(condition_key)
+        if condition_entry is None or condition_entry[0] is not loop:
+            condition_entry = self._command_conditions[condition_key] = (loop, asyncio.Condition())
+        condition = condition_entry[1]
+        self._command_condition_waiter_counts[condition_key] = (
+            self._command_condition_waiter_counts.get(condition_key, 0) + 1
+        )
+        
+        command_available = False
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self.get_queue_size_for_client(session_id, client_id) > 0),
+                    timeout=wait_seconds
+                )
+            command_available = True
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            remaining_waiters = self._command_condition_waiter_counts[condition_key] - 1
+            if remaining_waiters:
+                self._command_condition_waiter_counts[condition_key] = remaining_waiters
+                # A notification consumed by a waiter that then timed out or was
+                # cancelled would be lost; hand it on to one of the other waiters
+                if not command_available and self.get_queue_size_for_client(session_id, client_id) > 0:
+                    self._notify_command_waiter(session_id, client_id)
+            else:
+                del self._command_condition_waiter_counts[condition_key]
+                if self._command_conditions.get(condition_key) is condition_entry:
+                    del self._command_conditions[condition_key]
+    
+    def _notify_command_waiter(self, session_id: str, client_id: str) -> None:
+        """
+        Wake one waiting request of specific client
+        
+        Condition.notify requires its lock, which can only be acquired by a
+        coroutine, so the notification is scheduled as a task on the loop
+        owning the condition. Clients nobody waits for cost nothing.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier whose waiter should be woken
+        """
+        condition_entry = self._command_conditions.get((session_id, client_id))
+        if condition_entry is None:
+            return
+        
+        loop, condition = condition_entry
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        if running_loop is loop:
+            notify_task = loop.create_task(_notify_one(condition))
+            self._notify_tasks.add(notify_task)
+            notify_task.add_done_callback(self._notify_tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(_notify_one(condition), loop)
+
+
+async def _notify_one(condition: asyncio.Condition) -> None:
+    """Wake one coroutine waiting on the condition"""
+    async with condition:
+        condition.notify(1)
@@ -0,0 +1,68 @@
+"""
+Auto Async Wait Policy Service
+
+Chooses how long submit-auto-async holds a request open for the result,
+from the turnaround latencies (submitted -> completed) recently observed
+for the same command prefix or target client.
+
+- No history yet: wait the configured threshold
+- Almost certainly slow (few samples finish within the threshold):
+  switch to async immediately, without holding a connection
+- Otherwise: wait for the high quantile of the distribution plus a
+  margin, capped by the configured threshold, so fast commands are
+  waited for just long enough
+"""
+
+from typing import Optional
+
+from public_tunnel.services.execution_result_manager import LatencySamples
+
+
+class AutoAsyncWaitPolicy:
+    """Latency-quantile based choice of the auto async initial wait"""
+    
+    def __init__(
+        self,
+        min_samples: int = 5,
+        fast_quantile: float = 0.95,
+        min_fast_fraction: float = 0.1,
+        wait_margin_ratio: float = 0.25,
+        min_wait_seconds: float = 0.05
+    ):
+        """
+        Initialize policy
+        
+        Args:
+            min_samples: Samples needed before the history is trusted
+            fast_quantile: Quantile of the latency that should still be waited for
+            min_fast_fraction: Below this fraction of samples finishing within
+                the threshold, the command is treated as slow
+            wait_margin_ratio: Extra wait on top of the quantile latency
+            min_wait_seconds: Lower bound of a non-zero wait
+        """
+        self.min_samples = min_samples
+        self.fast_quantile = fast_quantile
+        self.min_fast_fraction = min_fast_fraction
+        self.wait_margin_ratio = wait_margin_ratio
+        self.min_wait_seconds = min_wait_seconds
+    
+    def choose_wait_seconds(self, latency_samples: Optional[LatencySamples], max_wait_seconds: float) -> float:
+        """
+        Choose the initial wait for a command
+        
+        Args:
+            latency_samples: Learned turnaround latencies, None if nothing was learned
+            max_wait_seconds: Configured threshold, never exceeded
+        
+        Returns:
+            float: Seconds to wait for the result, 0 to switch to async immediately
+        """
+        if latency_samples is None or latency_samples.get_sample_count() < self.min_samples:
+            return max_wait_seconds
+        
+        if latency_samples.get_fraction_within(max_wait_seconds) < self.min_fast_fraction:
+            return 0.0
+        
+        quantile_latency = latency_samples.get_quantile(self.fast_quantile)
+        wait_seconds = max(self.min_wait_seconds, quantile_latency * (1 + self.wait_margin_ratio))
+        return min(max_wait_seconds, wait_seconds)
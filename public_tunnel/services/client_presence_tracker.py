@@ -102,6 +102,31 @@ class InMemoryClientPresenceTracker:
         
         return presence_info
     
+    def get_session_presence_snapshot(self, session_id: str) -> Dict[str, ClientPresenceStatus]:
+        """
+        Get presence status of every registered client in a session at once
+        
+        Used by bulk command submission so that all targets are validated
+        against one consistent snapshot instead of one lookup per command.
+        
+        Args:
+            session_id: Session to take the snapshot for
+            
+        Returns:
+            Mapping of client_id to its current presence status
+        """
+        snapshot = {}
+        
+        for presence_info in list(self._client_presence.values()):
+            if presence_info.session_id != session_id:
+                continue
+            
+            current_status = self._calculate_presence_status(presence_info.last_seen_timestamp)
+            presence_info.presence_status = current_status
+            snapshot[presence_info.client_id] = current_status
+        
+        return snapshot
+    
     def _calculate_presence_status(self, last_seen: Optional[datetime]) -> ClientPresenceStatus:
         """
         Calculate presence status based on last seen timestamp
@@ -0,0 +1,167 @@
+"""
+Command Expiry Scheduler Service
+
+Enforces SubmitCommandToTargetClientRequest.timeout_seconds. Deadlines of
+commands submitted with a timeout are kept in a min-heap, so scheduling is
+O(log n) and each tick only touches commands that are actually due; no
+periodic scan over queues or results is needed.
+
+When a command expires it is removed from its client queue (or its delivery
+lease is dropped) and its PENDING/RUNNING result is marked FAILED with a
+timeout error. Commands that finished in time are left untouched.
+
+The scheduler runs as a background task in the application lifespan (see
+main.py), which also re-delivers commands whose delivery lease expired and
+releases delayed commands whose not_before time has come.
+"""
+
+from typing import List, Optional, Tuple
+from datetime import datetime
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+
+from public_tunnel.models.command import Command
+from public_tunnel.models.execution_result import ExecutionResultStatus
+
+
+logger = logging.getLogger(__name__)
+
+# Longest sleep between ticks, bounds the delay for newly scheduled deadlines
+MAX_TICK_SECONDS = 1.0
+
+
+class CommandExpiryScheduler:
+    """
+    Min-heap scheduler of command deadlines
+    
+    Heap entries are (expires_at, sequence, session_id, client_id, command_id,
+    timeout_seconds); the sequence keeps ordering stable for equal deadlines.
+    """
+    
+    def __init__(self, command_queue_manager, execution_result_manager):
+        """
+        Initialize scheduler
+        
+        Args:
+            command_queue_manager: Queue manager holding the commands
+            execution_result_manager: Result manager holding their results
+        """
+        self.command_queue_manager = command_queue_manager
+        self.execution_result_manager = execution_result_manager
+        self._expiry_heap: List[Tuple[float, int, str, str, str, int]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+    
+    def schedule_command_expiry(self, command: Command) -> None:
+        """
+        Schedule expiry of a command submitted with a timeout
+        
+        Commands without timeout_seconds are ignored.
+        
+        Args:
+            command: Submitted command
+        """
+        expires_at = command.expires_at
+        if expires_at is None:
+            return
+        
+        with self._lock:
+            heapq.heappush(self._expiry_heap, (
+                expires_at,
+                next(self._sequence),
+                command.session_id,
+                command.target_client,
+                command.command_id,
+                command.timeout_seconds
+            ))
+    
+    def get_scheduled_count(self) -> int:
+        """Get number of scheduled (not yet processed) deadlines"""
+        return len(self._expiry_heap)
+    
+    def get_seconds_until_next_expiry(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Get time until the earliest scheduled deadline
+        
+        Args:
+            now: Current epoch time (defaults to now)
+            
+        Returns:
+            float: Seconds until the next deadline (0 if overdue), None if nothing is scheduled
+        """
+        with self._lock:
+            if not self._expiry_heap:
+                return None
+            next_expires_at = self._expiry_heap[0][0]
+        
+        now = now if now is not None else datetime.now().timestamp()
+        return max(0.0, next_expires_at - now)
+    
+    def expire_due_commands(self, now: Optional[float] = None) -> List[str]:
+        """
+        Expire every command whose deadline has passed
+        
+        Args:
+            now: Current epoch time (defaults to now)
+            
+        Returns:
+            List[str]: IDs of commands whose result was marked as timed out
+        """
+        now = now if now is not None else datetime.now().timestamp()
+        
+        due_entries = []
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                due_entries.append(heapq.heappop(self._expiry_heap))
+        
+        timed_out_command_ids = []
+        for _, _, session_id, client_id, command_id, timeout_seconds in due_entries:
+            # May already be gone (acknowledged, or dropped lazily at dequeue)
+            self.command_queue_manager.expire_command(session_id, client_id, command_id)
+            
+            result = self.execution_result_manager.get_result_by_command_id(command_id)
+            if result is None or result.execution_status not in (
+                ExecutionResultStatus.PENDING,
+                ExecutionResultStatus.RUNNING
+            ):
+                continue
+            
+            self.execution_result_manager.update_result_status(
+                command_id=command_id,
+                new_status=ExecutionResultStatus.FAILED,
+                error_message=f"Command timed out after {timeout_seconds} seconds"
+            )
+            timed_out_command_ids.append(command_id)
+        
+        return timed_out_command_ids
+    
+    async def run(self) -> None:
+        """
+        Background loop: release delayed commands, expire due commands and
+        re-deliver expired leases
+        
+        Sleeps until the next release or deadline, at most MAX_TICK_SECONDS
+        so that deadlines scheduled meanwhile and lease expiry are picked up.
+        A failing tick is logged and retried after MAX_TICK_SECONDS instead of
+        ending the loop. Runs until cancelled.
+        """
+        while True:
+            seconds_until_next_event = MAX_TICK_SECONDS
+            try:
+                self.command_queue_manager.release_due_delayed_commands()
+                self.expire_due_commands()
+                self.command_queue_manager.requeue_expired_leases()
+                
+                for seconds_until_event in (
+                    self.get_seconds_until_next_expiry(),
+                    self.command_queue_manager.get_seconds_until_next_release()
+                ):
+                    if seconds_until_event is not None:
+                        seconds_until_next_event = min(seconds_until_next_event, seconds_until_event)
+            except Exception:
+                logger.exception("Command expiry scheduler tick failed")
+                seconds_until_next_event = MAX_TICK_SECONDS
+            await asyncio.sleep(seconds_until_next_event)
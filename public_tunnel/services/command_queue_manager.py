@@ -3,13 +3,301 @@ Command Queue Manager Service for US-006: Targeted Client Command Submission
 
 Manages FIFO queues for each target client within sessions.
 Ensures commands are delivered only to their intended recipients.
+
+Each client queue has one FIFO lane per priority level: urgent commands
+overtake routine backlog, while commands of equal priority stay in FIFO
+order. Enqueue and dequeue are O(1) (a fixed number of lanes is checked).
+
+Locking is sharded per session: operations on independent sessions never
+contend for the same lock, and lookups of missing or empty queues take
+no lock at all.
+
+Queues are bounded: per-client and per-session command caps plus a global
+byte budget reject submissions with CommandQueueFullError, which carries a
+retry delay estimated from how fast the full queue is being drained.
+
+Commands submitted with timeout_seconds are removed by expire_command
+(driven by CommandExpiryScheduler) in O(1): queued commands are tombstoned
+and skipped when they reach the head of their lane. Expired commands that
+reach the head before the scheduler runs are dropped at dequeue.
+cancel_command uses the same tombstones, found through a per-session
+command_id index, so cancelling deep inside a large queue is O(1).
+
+Commands submitted with not_before are held in a min-heap keyed by release
+time and only appended to their client queue once due
+(release_due_delayed_commands, driven by the lifespan task and checked in
+O(1) on every poll). Polls of clients without due commands never look at
+delayed commands.
 """
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from collections import deque
 from datetime import datetime
-from public_tunnel.models.command import Command
+from public_tunnel.models.command import Command, CommandPriority
+from public_tunnel.models.sortable_id import generate_sortable_id
+import asyncio
+import bisect
+import heapq
+import itertools
+import math
 import threading
+import time
+
+
+# Lanes in dequeue order, highest priority first
+PRIORITY_LANES_HIGHEST_FIRST = (
+    CommandPriority.URGENT,
+    CommandPriority.HIGH,
+    CommandPriority.NORMAL,
+    CommandPriority.LOW,
+)
+
+# Upper bound of the retry delay suggested to rejected submitters
+MAX_RETRY_AFTER_SECONDS = 60
+
+# Queue limit names reported by CommandQueueFullError
+QUEUE_LIMIT_CLIENT_COMMANDS = "max_commands_per_client"
+QUEUE_LIMIT_SESSION_COMMANDS = "max_commands_per_session"
+QUEUE_LIMIT_QUEUED_BYTES = "max_queued_bytes"
+
+
+class CommandQueueFullError(ValueError):
+    """
+    Raised when a submission would exceed a queue limit
+    
+    Attributes:
+        limit_name: Which limit was hit (QUEUE_LIMIT_* constant)
+        limit: Configured value of that limit
+        current_depth: Current usage counted against the limit
+        retry_after_seconds: Suggested delay before retrying the submission
+    """
+    
+    def __init__(self, limit_name: str, limit: int, current_depth: int, retry_after_seconds: int):
+        super().__init__(
+            f"Command queue limit '{limit_name}' reached ({current_depth}/{limit}); "
+            f"retry after {retry_after_seconds} seconds"
+        )
+        self.limit_name = limit_name
+        self.limit = limit
+        self.current_depth = current_depth
+        self.retry_after_seconds = retry_after_seconds
+
+
+class DrainRateTracker:
+    """
+    Sliding-window rate at which a queue is drained (commands or bytes)
+    
+    Drained amounts are summed into one-second buckets, so memory stays
+    bounded by the window length regardless of throughput.
+    """
+    
+    def __init__(self, window_seconds: int = 60):
+        """
+        Initialize empty tracker
+        
+        Args:
+            window_seconds: Length of the sliding window
+        """
+        self.window_seconds = window_seconds
+        # deque[[bucket_second, drained_amount]], oldest first
+        self._buckets: deque = deque()
+        self._total = 0
+    
+    def record(self, amount: int, now: float) -> None:
+        """
+        Record drained amount at given monotonic time
+        
+        Args:
+            amount: Number of commands or bytes drained
+            now: Current monotonic time
+        """
+        bucket_second = int(now)
+        if self._buckets and self._buckets[-1][0] == bucket_second:
+            self._buckets[-1][1] += amount
+        else:
+            self._buckets.append([bucket_second, amount])
+        self._total += amount
+        self._evict(now)
+    
+    def get_rate(self, now: float) -> float:
+        """
+        Get drained amount per second over the window
+        
+        Args:
+            now: Current monotonic time
+        
+        Returns:
+            float: Drain rate, 0.0 when nothing was drained recently
+        """
+        self._evict(now)
+        if not self._buckets:
+            return 0.0
+        observed_seconds = max(now - self._buckets[0][0], 1.0)
+        return self._total / observed_seconds
+    
+    def _evict(self, now: float) -> None:
+        """Drop buckets that fell out of the window"""
+        oldest_second = int(now) - self.window_seconds
+        while self._buckets and self._buckets[0][0] <= oldest_second:
+            self._total -= self._buckets.popleft()[1]
+
+
+class ClientCommandQueue:
+    """
+    Priority-aware command queue of a single client
+    
+    Keeps one deque per priority level. Commands are FIFO within a level and
+    higher levels are always dequeued first. Exposes the deque operations the
+    manager relies on (append, popleft, len, truthiness) plus removal by id.
+    
+    Removed commands stay in their lane as tombstones until they reach the
+    head, so removal never scans a lane.
+    
+    Every lane numbers its entries with consecutive sequence numbers (tail
+    sequence on append, head sequence on dequeue), so the position of a
+    queued command is its distance from the lane head plus the live size of
+    the higher lanes: O(1), minus a binary search over the lane's pending
+    tombstones.
+    """
+    
+    def __init__(self):
+        """Initialize empty priority lanes"""
+        self._lanes: Dict[CommandPriority, deque] = {
+            priority: deque() for priority in PRIORITY_LANES_HIGHEST_FIRST
+        }
+        self._size = 0
+        # Structure: {command_id: Command} - live (not removed) queued commands
+        self._queued_commands: Dict[str, Command] = {}
+        # Command ids removed while still inside a lane
+        self._tombstones: Set[str] = set()
+        # Per lane: live command count, sequence of the head entry and of the next
+        # appended entry, and sorted sequences of tombstones still inside the lane
+        self._lane_sizes: Dict[CommandPriority, int] = {priority: 0 for priority in PRIORITY_LANES_HIGHEST_FIRST}
+        self._lane_head_sequences: Dict[CommandPriority, int] = {priority: 0 for priority in PRIORITY_LANES_HIGHEST_FIRST}
+        self._lane_tail_sequences: Dict[CommandPriority, int] = {priority: 0 for priority in PRIORITY_LANES_HIGHEST_FIRST}
+        self._lane_tombstone_sequences: Dict[CommandPriority, List[int]] = {
+            priority: [] for priority in PRIORITY_LANES_HIGHEST_FIRST
+        }
+    
+    def append(self, command: Command) -> None:
+        """
+        Add command to the tail of its priority lane
+        
+        Args:
+            command: Command to enqueue
+        """
+        priority = command.priority
+        command.queue_sequence = self._lane_tail_sequences[priority]
+        self._lane_tail_sequences[priority] += 1
+        self._lanes[priority].append(command)
+        self._lane_sizes[priority] += 1
+        self._queued_commands[command.command_id] = command
+        self._size += 1
+    
+    def appendleft(self, command: Command) -> None:
+        """
+        Put command back at the head of its priority lane (re-delivery)
+        
+        Args:
+            command: Command to re-enqueue
+        """
+        priority = command.priority
+        self._lane_head_sequences[priority] -= 1
+        command.queue_sequence = self._lane_head_sequences[priority]
+        self._lanes[priority].appendleft(command)
+        self._lane_sizes[priority] += 1
+        self._queued_commands[command.command_id] = command
+        self._size += 1
+    
+    def popleft(self) -> Command:
+        """
+        Remove and return the oldest command of the highest non-empty lane
+        
+        Returns:
+            Command: Next command to deliver
+            
+        Raises:
+            IndexError: If the queue is empty
+        """
+        for priority in PRIORITY_LANES_HIGHEST_FIRST:
+            lane = self._lanes[priority]
+            while lane:
+                command = lane.popleft()
+                self._lane_head_sequences[priority] = command.queue_sequence + 1
+                if command.command_id in self._tombstones:
+                    self._tombstones.discard(command.command_id)
+                    # The head tombstone always has the lowest pending sequence
+                    self._lane_tombstone_sequences[priority].pop(0)
+                    continue
+                del self._queued_commands[command.command_id]
+                self._lane_sizes[priority] -= 1
+                self._size -= 1
+                return command
+        raise IndexError("pop from an empty client command queue")
+    
+    def remove(self, command_id: str) -> Optional[Command]:
+        """
+        Remove a queued command by id without scanning its lane
+        
+        Args:
+            command_id: Command identifier
+            
+        Returns:
+            Command: Removed command, or None if it is not queued here
+        """
+        command = self._queued_commands.pop(command_id, None)
+        if command is None:
+            return None
+        self._tombstones.add(command_id)
+        bisect.insort(self._lane_tombstone_sequences[command.priority], command.queue_sequence)
+        self._lane_sizes[command.priority] -= 1
+        self._size -= 1
+        return command
+    
+    def get_position(self, command_id: str) -> Optional[int]:
+        """
+        Get how many queued commands will be delivered before a command
+        
+        Args:
+            command_id: Command identifier
+            
+        Returns:
+            int: 0 for the next command to deliver, None if it is not queued here
+        """
+        command = self._queued_commands.get(command_id)
+        if command is None:
+            return None
+        
+        priority = command.priority
+        commands_ahead = 0
+        for higher_priority in PRIORITY_LANES_HIGHEST_FIRST:
+            if higher_priority == priority:
+                break
+            commands_ahead += self._lane_sizes[higher_priority]
+        
+        entries_ahead_in_lane = command.queue_sequence - self._lane_head_sequences[priority]
+        tombstones_ahead_in_lane = bisect.bisect_left(
+            self._lane_tombstone_sequences[priority], command.queue_sequence
+        )
+        return commands_ahead + entries_ahead_in_lane - tombstones_ahead_in_lane
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self):
+        """Iterate commands in delivery order"""
+        for priority in PRIORITY_LANES_HIGHEST_FIRST:
+            for command in self._lanes[priority]:
+                if command.command_id not in self._tombstones:
+                    yield command
+
+
+class CommandLease:
+    """In-flight delivery of a command, invisible to polling until it expires"""
+    
+    def __init__(self, command: Command, expires_at: float):
+        self.command = command
+        self.expires_at = expires_at
 
 
 class CommandQueueManager:
@@ -17,65 +305,454 @@ class CommandQueueManager:
     Manages command queues for targeted client command submission
     
     Features:
-    - FIFO queues per client per session
-    - Thread-safe operations
+    - FIFO queues per client per session, with priority lanes
+    - Thread-safe operations with per-session lock sharding
+    - Lock-free fast path for missing or empty queues
     - Command queue isolation
+    - Long-poll waiting with per-client arrival notification
+    - At-least-once delivery with visibility timeout leases and acks
+    - Bounded queues with backpressure (CommandQueueFullError)
+    
+    Limits count commands held by the manager: the client limit counts
+    commands waiting in that client's queue, the session limit and byte
+    budget also count delivered commands until they are acknowledged.
     """
     
-    def __init__(self):
-        """Initialize empty command queue manager"""
-        # Structure: {session_id: {client_id: deque[Command]}}
-        self._command_queues: Dict[str, Dict[str, deque]] = {}
-        self._lock = threading.RLock()
+    def __init__(
+        self,
+        visibility_timeout_seconds: float = 300.0,
+        max_commands_per_client: Optional[int] = 10_000,
+        max_commands_per_session: Optional[int] = 100_000,
+        max_queued_bytes: Optional[int] = 256 * 1024 * 1024
+    ):
+        """
+        Initialize empty command queue manager
+        
+        Args:
+            visibility_timeout_seconds: Seconds a delivered command stays
+                invisible before it is re-delivered unless acknowledged
+            max_commands_per_client: Queued commands allowed per client (None: unbounded)
+            max_commands_per_session: Held commands allowed per session (None: unbounded)
+            max_queued_bytes: Command content bytes held across all sessions (None: unbounded)
+        """
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self.max_commands_per_client = max_commands_per_client
+        self.max_commands_per_session = max_commands_per_session
+        self.max_queued_bytes = max_queued_bytes
+        # Structure: {session_id: {client_id: ClientCommandQueue}}
+        self._command_queues: Dict[str, Dict[str, ClientCommandQueue]] = {}
+        # Structure: {(session_id, client_id): deque[(event_loop, Future)]}
+        self._command_waiters: Dict[Tuple[str, str], deque] = {}
+        # Structure: {session_id: {command_id: CommandLease}}
+        self._leases: Dict[str, Dict[str, CommandLease]] = {}
+        # Structure: {session_id: min-heap[(expires_at, command_id)]}
+        self._lease_expiry_heaps: Dict[str, List[Tuple[float, str]]] = {}
+        # Structure: {session_id: RLock} - guards that session's queues, leases and waiters
+        self._session_locks: Dict[str, threading.RLock] = {}
+        # Only guards creation of new session locks
+        self._session_locks_guard = threading.Lock()
+        # Structure: {session_id: {command_id: Command}} - every held (delayed, queued
+        # or delivered) command, locates a command from its id alone
+        self._held_commands: Dict[str, Dict[str, Command]] = {}
+        # Structure: {session_id: held command count / held content bytes}
+        self._session_command_counts: Dict[str, int] = {}
+        self._session_held_bytes: Dict[str, int] = {}
+        # Structure: {session_id: {client_id: DrainRateTracker}} - commands delivered
+        self._client_drain_rates: Dict[str, Dict[str, DrainRateTracker]] = {}
+        # Structure: {session_id: DrainRateTracker} - commands acknowledged
+        self._session_drain_rates: Dict[str, DrainRateTracker] = {}
+        # Global byte budget, shared by all sessions
+        self._held_bytes = 0
+        self._held_bytes_drain_rate = DrainRateTracker()
+        self._held_bytes_lock = threading.Lock()
+        # Delayed commands: min-heap[(not_before, sequence, command)] across all sessions,
+        # guarded by its own lock; entries whose command left the session index are stale
+        self._delayed_command_heap: List[Tuple[float, int, Command]] = []
+        self._delayed_command_sequence = itertools.count()
+        self._delayed_command_heap_lock = threading.Lock()
+        # Structure: {session_id: {command_id: Command}} - not yet released, guarded by the session lock
+        self._delayed_commands: Dict[str, Dict[str, Command]] = {}
+    
+    def _get_session_lock(self, session_id: str) -> threading.RLock:
+        """
+        Get the lock guarding a session's queues, creating it on first use
+        
+        Session locks are kept for the life of the manager: replacing one
+        while a request still holds it would let two requests mutate the
+        session at once. Once created the lookup is a plain dict read
+        without taking any global lock.
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            threading.RLock: Lock dedicated to this session
+        """
+        session_lock = self._session_locks.get(session_id)
+        if session_lock is None:
+            with self._session_locks_guard:
+                session_lock = self._session_locks.setdefault(session_id, threading.RLock())
+        return session_lock
+    
+    def _peek_client_queue(self, session_id: str, client_id: str) -> Optional[ClientCommandQueue]:
+        """
+        Look up a client queue without locking
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier
+        
+        Returns:
+            ClientCommandQueue: Client queue if it exists, None otherwise
+        """
+        session_queues = self._command_queues.get(session_id)
+        if session_queues is None:
+            return None
+        return session_queues.get(client_id)
+    
+    def _get_or_create_client_queue(self, session_id: str, client_id: str) -> ClientCommandQueue:
+        """
+        Get a client queue, creating session and client entries if needed
+        
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier
+            
+        Returns:
+            ClientCommandQueue: Existing or newly created client queue
+        """
+        session_queues = self._command_queues.setdefault(session_id, {})
+        client_queue = session_queues.get(client_id)
+        if client_queue is None:
+            client_queue = session_queues[client_id] = ClientCommandQueue()
+        return client_queue
     
     def submit_command_to_target_client(
-        self, 
-        session_id: str, 
-        target_client_id: str, 
-        command_content: str
+        self,
+        session_id: str,
+        target_client_id: str,
+        command_content: str,
+        priority: CommandPriority = CommandPriority.NORMAL,
+        timeout_seconds: Optional[int] = None,
+        not_before: Optional[float] = None
     ) -> Command:
         """
         Submit command to specific target client queue
         
         Args:
             session_id: Session identifier
-            target_client_id: Target client identifier  
+            target_client_id: Target client identifier
             command_content: Command content to execute
+            priority: Priority lane of the command (FIFO within a lane)
+            timeout_seconds: Seconds until the command expires (None: never)
+            not_before: Epoch time before which the command stays invisible
+                to the client (None: immediately)
             
         Returns:
             Command: Created command object with unique ID
+        
+        Raises:
+            CommandQueueFullError: If a queue limit would be exceeded
         """
-        with self._lock:
-            # Ensure session exists
-            if session_id not in self._command_queues:
-                self._command_queues[session_id] = {}
+        # Create command with unique ID outside the critical section
+        command = Command(
+            command_id=generate_sortable_id(),
+            content=command_content,
+            target_client=target_client_id,
+            session_id=session_id,
+            priority=priority,
+            timeout_seconds=timeout_seconds,
+            not_before=not_before
+        )
+        
+        with self._get_session_lock(session_id):
+            self._admit_command(session_id, command, time.monotonic())
+            
+            if command.is_delayed():
+                # Held until its release time, not visible to the client yet
+                self._schedule_delayed_command(session_id, command)
+                self._on_commands_enqueued(session_id, [command])
+                return command
             
-            # Ensure client queue exists
-            if target_client_id not in self._command_queues[session_id]:
-                self._command_queues[session_id][target_client_id] = deque()
+            # Add to target client's queue (FIFO within priority lane)
+            self._get_or_create_client_queue(session_id, target_client_id).append(command)
+            self._on_commands_enqueued(session_id, [command])
             
-            # Create command with unique ID
-            import uuid
-            command_id = str(uuid.uuid4())
-            command = Command(
-                command_id=command_id,
+            # Wake one long-polling request of the target client, if any
+            self._notify_command_waiter(session_id, target_client_id)
+            
+            return command
+    
+    def submit_commands_to_target_clients(
+        self,
+        session_id: str,
+        target_commands: List[Tuple[str, str, CommandPriority, Optional[int], Optional[float]]]
+    ) -> Tuple[List[Command], List[Tuple[str, CommandQueueFullError]]]:
+        """
+        Submit many commands to target client queues in one operation
+        
+        All commands are enqueued under a single acquisition of the session
+        lock, which keeps fan-out to thousands of clients cheap. Queue limits
+        are checked per command, so one full client queue does not fail the
+        whole batch.
+        
+        Args:
+            session_id: Session identifier
+            target_commands: List of (target_client_id, command_content,
+                priority, timeout_seconds, not_before)
+            
+        Returns:
+            tuple: (Accepted commands in input order,
+                    List of (target_client_id, CommandQueueFullError) for rejected ones)
+        """
+        commands = [
+            Command(
+                command_id=generate_sortable_id(),
                 content=command_content,
                 target_client=target_client_id,
-                session_id=session_id
+                session_id=session_id,
+                priority=priority,
+                timeout_seconds=timeout_seconds,
+                not_before=not_before
+            )
+            for target_client_id, command_content, priority, timeout_seconds, not_before in target_commands
+        ]
+        
+        accepted_commands = []
+        visible_commands = []
+        rejections = []
+        
+        with self._get_session_lock(session_id):
+            now = time.monotonic()
+            wall_clock_now = time.time()
+            for command in commands:
+                try:
+                    self._admit_command(session_id, command, now)
+                except CommandQueueFullError as error:
+                    rejections.append((command.target_client, error))
+                    continue
+                if command.is_delayed(wall_clock_now):
+                    self._schedule_delayed_command(session_id, command)
+                else:
+                    self._get_or_create_client_queue(session_id, command.target_client).append(command)
+                    visible_commands.append(command)
+                accepted_commands.append(command)
+            self._on_commands_enqueued(session_id, accepted_commands)
+            
+            for command in visible_commands:
+                self._notify_command_waiter(session_id, command.target_client)
+        
+        return accepted_commands, rejections
+    
+    def _schedule_delayed_command(self, session_id: str, command: Command) -> None:
+        """
+        Hold a command until its not_before time
+        
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            command: Command with a future not_before
+        """
+        self._delayed_commands.setdefault(session_id, {})[command.command_id] = command
+        with self._delayed_command_heap_lock:
+            heapq.heappush(
+                self._delayed_command_heap,
+                (command.not_before, next(self._delayed_command_sequence), command)
             )
+    
+    def _has_due_delayed_commands(self, now: float) -> bool:
+        """
+        Check without locking whether any delayed command may be due
+        
+        Args:
+            now: Current epoch time
             
-            # Add to target client's queue (FIFO)
-            self._command_queues[session_id][target_client_id].append(command)
+        Returns:
+            bool: True if the earliest release time has passed
+        """
+        delayed_command_heap = self._delayed_command_heap
+        return bool(delayed_command_heap) and delayed_command_heap[0][0] <= now
+    
+    def release_due_delayed_commands(self, now: Optional[float] = None) -> int:
+        """
+        Move every delayed command whose release time has passed into its client queue
+        
+        Only due heap entries are touched, so the cost is proportional to the
+        number of released commands. Released commands join the tail of their
+        priority lane and wake a waiting long-poll of their client.
+        
+        Args:
+            now: Current epoch time (defaults to now)
             
-            return command
+        Returns:
+            int: Number of commands made visible
+        """
+        now = now if now is not None else time.time()
+        if not self._has_due_delayed_commands(now):
+            return 0
+        
+        due_commands = []
+        with self._delayed_command_heap_lock:
+            while self._delayed_command_heap and self._delayed_command_heap[0][0] <= now:
+                due_commands.append(heapq.heappop(self._delayed_command_heap)[2])
+        
+        released_count = 0
+        for command in due_commands:
+            session_id = command.session_id
+            with self._get_session_lock(session_id):
+                session_delayed_commands = self._delayed_commands.get(session_id)
+                # Expired or cleared while delayed: stale heap entry
+                if not session_delayed_commands or session_delayed_commands.pop(command.command_id, None) is None:
+                    continue
+                if not session_delayed_commands:
+                    del self._delayed_commands[session_id]
+                self._get_or_create_client_queue(session_id, command.target_client).append(command)
+                self._notify_command_waiter(session_id, command.target_client)
+                released_count += 1
+        
+        return released_count
+    
+    def get_seconds_until_next_release(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Get time until the earliest delayed command is due
+        
+        Args:
+            now: Current epoch time (defaults to now)
+            
+        Returns:
+            float: Seconds until the next release (0 if overdue), None if nothing is delayed
+        """
+        with self._delayed_command_heap_lock:
+            if not self._delayed_command_heap:
+                return None
+            next_release_at = self._delayed_command_heap[0][0]
+        
+        now = now if now is not None else time.time()
+        return max(0.0, next_release_at - now)
+    
+    def get_delayed_command_count(self, session_id: str) -> int:
+        """
+        Get number of submitted commands of a session that are not released yet
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            int: Number of delayed commands
+        """
+        return len(self._delayed_commands.get(session_id, {}))
+    
+    def _admit_command(self, session_id: str, command: Command, now: float) -> None:
+        """
+        Check queue limits for a new command and count it as held
+        
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            command: Command about to be enqueued
+            now: Current monotonic time
+        
+        Raises:
+            CommandQueueFullError: If a limit would be exceeded
+        """
+        if self.max_commands_per_client is not None:
+            client_depth = self.get_queue_size_for_client(session_id, command.target_client)
+            if client_depth >= self.max_commands_per_client:
+                drain_rate = self._client_drain_rates.get(session_id, {}).get(command.target_client)
+                raise CommandQueueFullError(
+                    limit_name=QUEUE_LIMIT_CLIENT_COMMANDS,
+                    limit=self.max_commands_per_client,
+                    current_depth=client_depth,
+                    retry_after_seconds=_compute_retry_after_seconds(
+                        client_depth + 1 - self.max_commands_per_client,
+                        drain_rate.get_rate(now) if drain_rate else 0.0
+                    )
+                )
+        
+        session_depth = self._session_command_counts.get(session_id, 0)
+        if self.max_commands_per_session is not None and session_depth >= self.max_commands_per_session:
+            drain_rate = self._session_drain_rates.get(session_id)
+            raise CommandQueueFullError(
+                limit_name=QUEUE_LIMIT_SESSION_COMMANDS,
+                limit=self.max_commands_per_session,
+                current_depth=session_depth,
+                retry_after_seconds=_compute_retry_after_seconds(
+                    session_depth + 1 - self.max_commands_per_session,
+                    drain_rate.get_rate(now) if drain_rate else 0.0
+                )
+            )
+        
+        command_bytes = _get_command_size_bytes(command)
+        with self._held_bytes_lock:
+            held_bytes = self._held_bytes
+            if self.max_queued_bytes is not None and held_bytes + command_bytes > self.max_queued_bytes:
+                raise CommandQueueFullError(
+                    limit_name=QUEUE_LIMIT_QUEUED_BYTES,
+                    limit=self.max_queued_bytes,
+                    current_depth=held_bytes,
+                    retry_after_seconds=_compute_retry_after_seconds(
+                        held_bytes + command_bytes - self.max_queued_bytes,
+                        self._held_bytes_drain_rate.get_rate(now)
+                    )
+                )
+            self._held_bytes = held_bytes + command_bytes
+        
+        self._held_commands.setdefault(session_id, {})[command.command_id] = command
+        self._session_command_counts[session_id] = session_depth + 1
+        self._session_held_bytes[session_id] = self._session_held_bytes.get(session_id, 0) + command_bytes
+    
+    def _count_held_command(self, session_id: str, command: Command) -> None:
+        """
+        Count a command against the queue limits without checking them
+        
+        Used when restoring queues that were accepted before (e.g. replay).
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            command: Restored command
+        """
+        command_bytes = _get_command_size_bytes(command)
+        self._held_commands.setdefault(session_id, {})[command.command_id] = command
+        self._session_command_counts[session_id] = self._session_command_counts.get(session_id, 0) + 1
+        self._session_held_bytes[session_id] = self._session_held_bytes.get(session_id, 0) + command_bytes
+        with self._held_bytes_lock:
+            self._held_bytes += command_bytes
+    
+    def _release_command(self, session_id: str, command: Command, now: float) -> None:
+        """
+        Stop counting an acknowledged, expired or cancelled command against the queue limits
+        
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            command: Acknowledged command
+            now: Current monotonic time
+        """
+        command_bytes = _get_command_size_bytes(command)
+        session_held_commands = self._held_commands.get(session_id)
+        if session_held_commands is not None:
+            session_held_commands.pop(command.command_id, None)
+        self._session_command_counts[session_id] = self._session_command_counts.get(session_id, 1) - 1
+        self._session_held_bytes[session_id] = self._session_held_bytes.get(session_id, command_bytes) - command_bytes
+        self._session_drain_rates.setdefault(session_id, DrainRateTracker()).record(1, now)
+        
+        with self._held_bytes_lock:
+            self._held_bytes -= command_bytes
+            self._held_bytes_drain_rate.record(command_bytes, now)
     
     def get_next_command_for_client(
-        self, 
-        session_id: str, 
+        self,
+        session_id: str,
         client_id: str
     ) -> Optional[Command]:
         """
-        Get next command for specific client (FIFO)
+        Get next command for specific client (FIFO within priority)
         
         Args:
             session_id: Session identifier
@@ -84,23 +761,12 @@ class CommandQueueManager:
         Returns:
             Command: Next command for this client, or None if queue is empty
         """
-        with self._lock:
-            if session_id not in self._command_queues:
-                return None
-                
-            if client_id not in self._command_queues[session_id]:
-                return None
-            
-            client_queue = self._command_queues[session_id][client_id]
-            if not client_queue:
-                return None
-                
-            # Return and remove first command (FIFO)
-            return client_queue.popleft()
+        command, _ = self.get_next_command_with_queue_info(session_id, client_id)
+        return command
     
     def get_queue_size_for_client(
-        self, 
-        session_id: str, 
+        self,
+        session_id: str,
         client_id: str
     ) -> int:
         """
@@ -113,18 +779,15 @@ class CommandQueueManager:
         Returns:
             int: Number of pending commands in client's queue
         """
-        with self._lock:
-            if session_id not in self._command_queues:
-                return 0
+        client_queue = self._peek_client_queue(session_id, client_id)
+        if client_queue is None:
+            return 0
                 
-            if client_id not in self._command_queues[session_id]:
-                return 0
-                
-            return len(self._command_queues[session_id][client_id])
+        return len(client_queue)
     
     def get_next_command_with_queue_info(
-        self, 
-        session_id: str, 
+        self,
+        session_id: str,
         client_id: str
     ) -> tuple[Optional[Command], int]:
         """
@@ -139,22 +802,424 @@ class CommandQueueManager:
         Returns:
             tuple: (Command or None, remaining_queue_size)
         """
-        with self._lock:
-            if session_id not in self._command_queues:
-                return None, 0
+        commands, remaining_size = self.get_next_commands_with_queue_info(
+            session_id=session_id,
+            client_id=client_id,
+            max_commands=1
+        )
                 
-            if client_id not in self._command_queues[session_id]:
-                return None, 0
+        return (commands[0] if commands else None), remaining_size
             
-            client_queue = self._command_queues[session_id][client_id]
+    def get_next_commands_with_queue_info(
+        self,
+        session_id: str,
+        client_id: str,
+        max_commands: int
+    ) -> tuple[List[Command], int]:
+        """
+        Pop up to max_commands commands for specific client in FIFO order
+        
+        The whole batch is taken under a single lock acquisition, so a client
+        with a deep backlog can drain it in a few round trips.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier requesting commands
+            max_commands: Maximum number of commands to return
+            
+        Returns:
+            tuple: (List of commands in FIFO order, remaining_queue_size)
+        """
+        now = time.monotonic()
+        
+        # O(1) check of the earliest release time; due commands are released before serving
+        wall_clock_now = time.time()
+        if self._has_due_delayed_commands(wall_clock_now):
+            self.release_due_delayed_commands(wall_clock_now)
+        
+        # Fast path: idle clients are answered without touching any lock
+        if not self._peek_client_queue(session_id, client_id) and not self._has_expired_leases(session_id, now):
+            return [], 0
+        
+        with self._get_session_lock(session_id):
+            self._requeue_expired_leases(session_id, now)
+            
+            client_queue = self._peek_client_queue(session_id, client_id)
             if not client_queue:
-                return None, 0
+                return [], 0
                 
-            # Get next command (FIFO)
-            command = client_queue.popleft()
+            # Get next commands (FIFO) and lease them until acknowledged.
+            # Commands that expired before the scheduler reached them are dropped.
+            commands = []
+            while client_queue and len(commands) < max_commands:
+                command = client_queue.popleft()
+                if command.is_expired(wall_clock_now):
+                    self._release_command(session_id, command, now)
+                    self._on_command_expired(session_id, command.command_id)
+                    continue
+                commands.append(command)
+            
+            for command in commands:
+                self._lease_command(session_id, command, now)
+            self._on_commands_leased(session_id, commands)
+            self._client_drain_rates.setdefault(session_id, {}).setdefault(
+                client_id, DrainRateTracker()
+            ).record(len(commands), now)
             remaining_size = len(client_queue)
             
-            return command, remaining_size
+            return commands, remaining_size
+    
+    def _lease_command(self, session_id: str, command: Command, now: float) -> None:
+        """
+        Record delivery of a command and hide it until its lease expires
+        
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            command: Command being delivered
+            now: Current monotonic time
+        """
+        expires_at = now + self.visibility_timeout_seconds
+        command.delivery_count += 1
+        self._leases.setdefault(session_id, {})[command.command_id] = CommandLease(command, expires_at)
+        heapq.heappush(self._lease_expiry_heaps.setdefault(session_id, []), (expires_at, command.command_id))
+    
+    def _has_expired_leases(self, session_id: str, now: float) -> bool:
+        """
+        Check without locking whether a session may have expired leases
+        
+        Args:
+            session_id: Session identifier
+            now: Current monotonic time
+            
+        Returns:
+            bool: True if the earliest lease deadline has passed
+        """
+        expiry_heap = self._lease_expiry_heaps.get(session_id)
+        return bool(expiry_heap) and expiry_heap[0][0] <= now
+    
+    def _requeue_expired_leases(self, session_id: str, now: float) -> int:
+        """
+        Put commands with expired leases back at the head of their queues
+        
+        Must be called while holding the session lock. Pops heap entries
+        while the earliest deadline has passed; entries of acknowledged or
+        renewed leases are stale and skipped.
+        
+        Args:
+            session_id: Session identifier
+            now: Current monotonic time
+            
+        Returns:
+            int: Number of commands made visible again
+        """
+        expiry_heap = self._lease_expiry_heaps.get(session_id)
+        if not expiry_heap:
+            return 0
+        
+        session_leases = self._leases.get(session_id, {})
+        requeued_count = 0
+        
+        while expiry_heap and expiry_heap[0][0] <= now:
+            expires_at, command_id = heapq.heappop(expiry_heap)
+            lease = session_leases.get(command_id)
+            if lease is None or lease.expires_at != expires_at:
+                continue
+            
+            del session_leases[command_id]
+            command = lease.command
+            self._get_or_create_client_queue(session_id, command.target_client).appendleft(command)
+            self._notify_command_waiter(session_id, command.target_client)
+            requeued_count += 1
+        
+        return requeued_count
+    
+    def requeue_expired_leases(self) -> int:
+        """
+        Re-deliver every command whose lease has expired, in all sessions
+        
+        Only sessions whose earliest lease deadline has passed are locked,
+        so the cost is proportional to expired leases rather than queue sizes.
+        
+        Returns:
+            int: Number of commands made visible again
+        """
+        now = time.monotonic()
+        requeued_count = 0
+        
+        for session_id in list(self._lease_expiry_heaps.keys()):
+            if not self._has_expired_leases(session_id, now):
+                continue
+            with self._get_session_lock(session_id):
+                requeued_count += self._requeue_expired_leases(session_id, now)
+        
+        return requeued_count
+    
+    def acknowledge_command(self, session_id: str, command_id: str, client_id: Optional[str] = None) -> bool:
+        """
+        Acknowledge a delivered command so it is never re-delivered
+        
+        Args:
+            session_id: Session identifier
+            command_id: Delivered command identifier
+            client_id: Acknowledging client (must match the target if given)
+            
+        Returns:
+            bool: True if an active lease was released, False otherwise
+        """
+        session_leases = self._leases.get(session_id)
+        if not session_leases or command_id not in session_leases:
+            return False
+        
+        with self._get_session_lock(session_id):
+            # Re-read under the lock: the session may have been cleared meanwhile
+            session_leases = self._leases.get(session_id)
+            lease = session_leases.get(command_id) if session_leases else None
+            if lease is None:
+                return False
+            if client_id is not None and lease.command.target_client != client_id:
+                return False
+            
+            # The heap entry becomes stale and is skipped lazily
+            del session_leases[command_id]
+            self._release_command(session_id, lease.command, time.monotonic())
+            self._on_command_acknowledged(session_id, command_id)
+            return True
+    
+    def expire_command(self, session_id: str, client_id: str, command_id: str) -> bool:
+        """
+        Remove a timed-out command, whether still queued or already delivered
+        
+        Queued commands are tombstoned in O(1); delayed commands are dropped
+        before release; delivered commands lose their lease so they are never
+        re-delivered.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Target client of the command
+            command_id: Command identifier
+            
+        Returns:
+            bool: True if the command was still held and is now removed
+        """
+        with self._get_session_lock(session_id):
+            command = self._remove_undelivered_command(session_id, client_id, command_id)
+            
+            if command is None:
+                # The lease heap entry becomes stale and is skipped lazily
+                lease = self._leases.get(session_id, {}).pop(command_id, None)
+                if lease is None:
+                    return False
+                command = lease.command
+            
+            self._release_command(session_id, command, time.monotonic())
+            self._on_command_expired(session_id, command_id)
+            return True
+    
+    def cancel_command(self, session_id: str, command_id: str) -> bool:
+        """
+        Cancel a command that has not been delivered yet
+        
+        The command is located through the session's command_id index and
+        tombstoned in its lane (or dropped from the delayed set), so the cost
+        does not depend on queue depth; the next dequeue skips it lazily.
+        
+        Args:
+            session_id: Session identifier
+            command_id: Command identifier
+            
+        Returns:
+            bool: True if the command was cancelled, False if it is not held
+                or was already delivered to its client
+        """
+        session_held_commands = self._held_commands.get(session_id)
+        if not session_held_commands or command_id not in session_held_commands:
+            return False
+        
+        with self._get_session_lock(session_id):
+            # Re-read under the lock: the session may have been cleared meanwhile
+            session_held_commands = self._held_commands.get(session_id)
+            command = session_held_commands.get(command_id) if session_held_commands else None
+            if command is None:
+                return False
+            if self._remove_undelivered_command(session_id, command.target_client, command_id) is None:
+                return False  # Leased: the client may already be running it
+            
+            self._release_command(session_id, command, time.monotonic())
+            self._on_command_cancelled(session_id, command_id)
+            return True
+    
+    def get_command_queue_position(self, session_id: str, command_id: str) -> Optional[int]:
+        """
+        Get the exact position of a queued command in its client queue
+        
+        Args:
+            session_id: Session identifier
+            command_id: Command identifier
+            
+        Returns:
+            int: Commands delivered before this one (0: next), None if the
+                command is not waiting in a client queue (delayed, delivered or unknown)
+        """
+        command = self._held_commands.get(session_id, {}).get(command_id)
+        if command is None:
+            return None
+        
+        with self._get_session_lock(session_id):
+            client_queue = self._peek_client_queue(session_id, command.target_client)
+            if client_queue is None:
+                return None
+            return client_queue.get_position(command_id)
+    
+    def get_held_command(self, session_id: str, command_id: str) -> Optional[Command]:
+        """
+        Look up a delayed, queued or delivered (unacknowledged) command by id
+        
+        Args:
+            session_id: Session identifier
+            command_id: Command identifier
+            
+        Returns:
+            Command: Held command, or None if it is not held
+        """
+        return self._held_commands.get(session_id, {}).get(command_id)
+    
+    def _remove_undelivered_command(self, session_id: str, client_id: str, command_id: str) -> Optional[Command]:
+        """
+        Take a command out of its client queue (tombstone) or the delayed set
+        
+        Must be called while holding the session lock.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Target client of the command
+            command_id: Command identifier
+            
+        Returns:
+            Command: Removed command, or None if it is neither queued nor delayed
+        """
+        command = None
+        client_queue = self._peek_client_queue(session_id, client_id)
+        if client_queue is not None:
+            command = client_queue.remove(command_id)
+        
+        if command is None:
+            # The delayed heap entry becomes stale and is skipped on release
+            command = self._delayed_commands.get(session_id, {}).pop(command_id, None)
+        
+        return command
+    
+    def get_expiring_commands(self) -> List[Command]:
+        """
+        Get every held (delayed, queued or delivered) command that has a timeout
+        
+        Used to schedule expiry of commands restored from persistence.
+        
+        Returns:
+            List[Command]: Commands with timeout_seconds set
+        """
+        expiring_commands = []
+        
+        for session_id in list(self._command_queues.keys() | self._delayed_commands.keys()):
+            with self._get_session_lock(session_id):
+                for command in self._delayed_commands.get(session_id, {}).values():
+                    if command.timeout_seconds is not None:
+                        expiring_commands.append(command)
+                for lease in self._leases.get(session_id, {}).values():
+                    if lease.command.timeout_seconds is not None:
+                        expiring_commands.append(lease.command)
+                for client_queue in self._command_queues.get(session_id, {}).values():
+                    for command in client_queue:
+                        if command.timeout_seconds is not None:
+                            expiring_commands.append(command)
+        
+        return expiring_commands
+    
+    def get_in_flight_command_count(self, session_id: str) -> int:
+        """
+        Get number of delivered but unacknowledged commands in a session
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            int: Number of active leases
+        """
+        return len(self._leases.get(session_id, {}))
+    
+    async def wait_for_command(
+        self,
+        session_id: str,
+        client_id: str,
+        wait_seconds: float
+    ) -> bool:
+        """
+        Wait until a command is queued for specific client (long-poll support)
+        
+        The waiting request is parked on an asyncio future which is resolved by
+        submit_command_to_target_client, so no polling or sleeping is involved.
+        Each submitted command wakes exactly one waiter of the target client;
+        a waiter that times out or is cancelled after being picked passes the
+        wakeup on to the next one, so it is never lost.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier waiting for commands
+            wait_seconds: Maximum seconds to wait
+        
+        Returns:
+            bool: True if a command is (or became) available, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiter_key = (session_id, client_id)
+        waiter_entry = (loop, waiter)
+        session_lock = self._get_session_lock(session_id)
+        
+        with session_lock:
+            # Check under the lock so a concurrent submit cannot be missed
+            if self.get_queue_size_for_client(session_id, client_id) > 0:
+                return True
+            self._command_waiters.setdefault(waiter_key, deque()).append(waiter_entry)
+        
+        woken = False
+        try:
+            await asyncio.wait_for(waiter, timeout=wait_seconds)
+            woken = True
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with session_lock:
+                waiters = self._command_waiters.get(waiter_key)
+                if waiters is not None and waiter_entry in waiters:
+                    waiters.remove(waiter_entry)
+                elif not woken and self.get_queue_size_for_client(session_id, client_id) > 0:
+                    # Picked by a notifier, but timed out or was cancelled before acting on it
+                    self._notify_command_waiter(session_id, client_id)
+                waiters = self._command_waiters.get(waiter_key)
+                if waiters is not None and not waiters:
+                    del self._command_waiters[waiter_key]
+    
+    def _notify_command_waiter(self, session_id: str, client_id: str) -> None:
+        """
+        Wake the oldest pending waiter of specific client
+        
+        Must be called while holding the session lock. Waiters may belong to
+        another event loop thread, so resolution is scheduled thread-safely.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier whose waiter should be woken
+        """
+        waiters = self._command_waiters.get((session_id, client_id))
+        while waiters:
+            loop, waiter = waiters.popleft()
+            if waiter.done():
+                continue
+            loop.call_soon_threadsafe(_resolve_waiter, waiter)
+            return
 
     def get_all_clients_with_commands_in_session(self, session_id: str) -> Set[str]:
         """
@@ -166,12 +1231,14 @@ class CommandQueueManager:
         Returns:
             Set[str]: Set of client IDs with pending commands
         """
-        with self._lock:
-            if session_id not in self._command_queues:
-                return set()
+        if session_id not in self._command_queues:
+            return set()
+        
+        with self._get_session_lock(session_id):
+            session_queues = self._command_queues.get(session_id, {})
             
             clients_with_commands = set()
-            for client_id, queue in self._command_queues[session_id].items():
+            for client_id, queue in session_queues.items():
                 if queue:  # Non-empty queue
                     clients_with_commands.add(client_id)
             
@@ -184,11 +1251,101 @@ class CommandQueueManager:
         Args:
             session_id: Session identifier to clear
         """
-        with self._lock:
-            if session_id in self._command_queues:
-                del self._command_queues[session_id]
+        with self._get_session_lock(session_id):
+            self._command_queues.pop(session_id, None)
+            # Delayed heap entries of the session become stale and are skipped on release
+            self._delayed_commands.pop(session_id, None)
+            self._held_commands.pop(session_id, None)
+            self._leases.pop(session_id, None)
+            self._lease_expiry_heaps.pop(session_id, None)
+            self._session_command_counts.pop(session_id, None)
+            self._client_drain_rates.pop(session_id, None)
+            self._session_drain_rates.pop(session_id, None)
+            
+            released_bytes = self._session_held_bytes.pop(session_id, 0)
+            with self._held_bytes_lock:
+                self._held_bytes -= released_bytes
+                self._held_bytes_drain_rate.record(released_bytes, time.monotonic())
+            
+            self._on_session_cleared(session_id)
+    
+    async def wait_until_durable(self, commands: List[Command]) -> None:
+        """
+        Wait until submitted commands would survive a restart
+        
+        Submit endpoints await this before confirming a submission. The
+        in-memory manager keeps nothing on disk, so it returns immediately;
+        persistent backends override it (see DurableCommandQueueManager).
+        
+        Args:
+            commands: Commands returned by the submit methods
+        """
+        pass
+    
+    def wait_until_durable_blocking(self, commands: List[Command]) -> None:
+        """Blocking variant of wait_until_durable for callers on worker threads"""
+        pass
+    
+    def close(self) -> None:
+        """Release resources held by the backend (called on server shutdown)"""
+        pass
+    
+    # Queue operation hooks - called while holding the session lock, in the
+    # order the operations were applied. Subclasses override them to journal
+    # queue state (see DurableCommandQueueManager).
+    
+    def _on_commands_enqueued(self, session_id: str, commands: List[Command]) -> None:
+        """Hook: commands were added to client queues"""
+        pass
+    
+    def _on_commands_leased(self, session_id: str, commands: List[Command]) -> None:
+        """Hook: commands were delivered and are now leased"""
+        pass
+    
+    def _on_command_acknowledged(self, session_id: str, command_id: str) -> None:
+        """Hook: a delivered command was acknowledged and is done"""
+        pass
+    
+    def _on_command_expired(self, session_id: str, command_id: str) -> None:
+        """Hook: a queued or delivered command timed out and was removed"""
+        pass
+    
+    def _on_command_cancelled(self, session_id: str, command_id: str) -> None:
+        """Hook: a queued or delayed command was cancelled and removed"""
+        pass
+    
+    def _on_session_cleared(self, session_id: str) -> None:
+        """Hook: all queues and leases of a session were dropped"""
+        pass
+
+
+def _get_command_size_bytes(command: Command) -> int:
+    """Size of a command counted against the byte budget"""
+    return len(command.content.encode("utf-8"))
+
+
+def _compute_retry_after_seconds(excess: int, drain_rate: float) -> int:
+    """
+    Estimate how long until the queue drains enough to accept a submission
+    
+    Args:
+        excess: Commands or bytes that must be drained first
+        drain_rate: Observed drain rate in the same unit per second
+    
+    Returns:
+        int: Whole seconds between 1 and MAX_RETRY_AFTER_SECONDS
+    """
+    if drain_rate <= 0:
+        return MAX_RETRY_AFTER_SECONDS
+    return max(1, min(MAX_RETRY_AFTER_SECONDS, math.ceil(excess / drain_rate)))
+
+
+def _resolve_waiter(waiter: asyncio.Future) -> None:
+    """Resolve waiter future unless it was already cancelled or timed out"""
+    if not waiter.done():
+        waiter.set_result(True)
 
 
 class InMemoryCommandQueueManager(CommandQueueManager):
     """In-memory implementation of CommandQueueManager for development/testing"""
-    pass
\ No newline at end of file
+    pass
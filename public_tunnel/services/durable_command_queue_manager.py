@@ -0,0 +1,521 @@
+"""
+Durable Command Queue Manager Service
+
+Optional persistence backend for CommandQueueManager. Every queue operation
+(enqueue, delivery, acknowledgement) is journaled to an append-only
+write-ahead log so queued commands survive restarts and deploys.
+
+- Group commit: concurrent submissions share one write + fsync; async
+  request handlers await durability without blocking the event loop
+- Compaction: when the log grows past a threshold it is rotated and the
+  live queue state is written to a compact snapshot
+- Replay: on startup the snapshot and log are read sequentially and the
+  queues are rebuilt; commands that were delivered but never acknowledged
+  become visible again (at-least-once delivery), expired ones are dropped
+  and delayed ones go back to waiting for their release time
+
+Enabled through get_command_queue_manager when PUBLIC_TUNNEL_COMMAND_QUEUE_WAL_PATH is set.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import asyncio
+import json
+import os
+import shutil
+import threading
+
+from public_tunnel.models.command import Command, CommandPriority
+from public_tunnel.services.command_queue_manager import CommandQueueManager
+
+
+# Write-ahead log record operations
+WAL_OPERATION_ENQUEUE = "enqueue"
+WAL_OPERATION_LEASE = "lease"
+WAL_OPERATION_ACK = "ack"
+WAL_OPERATION_EXPIRE = "expire"
+WAL_OPERATION_CANCEL = "cancel"
+WAL_OPERATION_CLEAR_SESSION = "clear_session"
+
+
+class CommandQueueWriteAheadLog:
+    """
+    Append-only JSON-lines log with group-commit fsync batching
+    
+    Records are appended to an in-memory buffer by callers and written out by
+    a single flusher thread, which fsyncs each batch once. Callers that need
+    durability wait until the batch containing their record is on disk:
+    threads block in wait_until_durable, coroutines await
+    wait_until_durable_async, whose futures the flusher resolves.
+    
+    Files:
+    - {log_path}: records since the last compaction
+    - {log_path}.compacting: previous log while a compaction is in progress
+    - {log_path}.snapshot: compacted live state
+    """
+    
+    def __init__(
+        self,
+        log_path: str,
+        snapshot_provider: Optional[Callable[[], List[dict]]] = None,
+        compaction_threshold_bytes: int = 64 * 1024 * 1024,
+        group_commit: bool = True
+    ):
+        """
+        Initialize the write-ahead log
+        
+        Args:
+            log_path: Path of the active log file
+            snapshot_provider: Returns enqueue records describing the live
+                state; required for compaction
+            compaction_threshold_bytes: Active log size that triggers compaction
+            group_commit: Batch fsyncs in a flusher thread (False fsyncs every
+                append inline, mainly for benchmarking)
+        """
+        self.log_path = log_path
+        self.snapshot_path = f"{log_path}.snapshot"
+        self.compacting_path = f"{log_path}.compacting"
+        self.snapshot_provider = snapshot_provider
+        self.compaction_threshold_bytes = compaction_threshold_bytes
+        self.group_commit = group_commit
+        
+        # Guards the record buffer and sequence numbers
+        self._condition = threading.Condition()
+        # Guards the active log file (writes and rotation)
+        self._file_lock = threading.Lock()
+        self._pending_lines: List[str] = []
+        self._appended_sequence = 0
+        self._durable_sequence = 0
+        # Structure: [(sequence, event_loop, Future)] - coroutines awaiting durability
+        self._durable_waiters: List[Tuple[int, asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._closed = False
+        self._compaction_in_progress = False
+        
+        self._log_file = open(self.log_path, "a", encoding="utf-8")
+        self._log_size_bytes = self._log_file.tell()
+        
+        self._flusher_thread: Optional[threading.Thread] = None
+        if group_commit:
+            self._flusher_thread = threading.Thread(
+                target=self._run_flusher,
+                name="command-queue-wal-flusher",
+                daemon=True
+            )
+            self._flusher_thread.start()
+    
+    def replay(self) -> Iterator[dict]:
+        """
+        Read every journaled record in the order it was written
+        
+        Yields:
+            dict: Snapshot records first, then records of an interrupted
+                compaction, then the active log
+        """
+        for path in (self.snapshot_path, self.compacting_path, self.log_path):
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as log_file:
+                for line in log_file:
+                    if not line.endswith("\n"):
+                        # Torn write at crash time - the record was never acknowledged
+                        break
+                    yield json.loads(line)
+    
+    def append(self, record: dict) -> int:
+        """
+        Append a record to the log buffer
+        
+        Args:
+            record: JSON-serializable record
+        
+        Returns:
+            int: Sequence number to pass to wait_until_durable
+        """
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        
+        with self._condition:
+            self._appended_sequence += 1
+            sequence = self._appended_sequence
+            
+            if self.group_commit:
+                self._pending_lines.append(line)
+                self._condition.notify_all()
+            else:
+                with self._file_lock:
+                    self._write_batch([line])
+                self._durable_sequence = sequence
+        
+        return sequence
+    
+    def wait_until_durable(self, sequence: int) -> None:
+        """
+        Block until the given record is fsynced
+        
+        Blocks the calling thread; coroutines use wait_until_durable_async.
+        
+        Args:
+            sequence: Sequence number returned by append
+        """
+        with self._condition:
+            while self._durable_sequence < sequence and not self._closed:
+                self._condition.wait()
+    
+    async def wait_until_durable_async(self, sequence: int) -> None:
+        """
+        Wait until the given record is fsynced without blocking the event loop
+        
+        Submissions from concurrent requests keep being appended while one
+        request waits, so they share the flusher's next fsync.
+        
+        Args:
+            sequence: Sequence number returned by append
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiter_entry = (sequence, loop, waiter)
+        
+        with self._condition:
+            if self._durable_sequence >= sequence or self._closed:
+                return
+            self._durable_waiters.append(waiter_entry)
+        
+        try:
+            await waiter
+        finally:
+            with self._condition:
+                if waiter_entry in self._durable_waiters:
+                    self._durable_waiters.remove(waiter_entry)
+    
+    def _resolve_durable_waiters(self) -> None:
+        """Resolve coroutines whose records are durable (caller holds the condition)"""
+        still_waiting = []
+        for waiter_entry in self._durable_waiters:
+            sequence, loop, waiter = waiter_entry
+            if sequence <= self._durable_sequence or self._closed:
+                loop.call_soon_threadsafe(_resolve_durable_waiter, waiter)
+            else:
+                still_waiting.append(waiter_entry)
+        self._durable_waiters = still_waiting
+    
+    def _run_flusher(self) -> None:
+        """
+        Flusher thread: write and fsync all pending records as one batch
+        
+        The batch is taken under the append lock but written outside of it,
+        so appenders keep buffering records while the fsync is in progress
+        and the next batch grows accordingly.
+        """
+        while True:
+            with self._condition:
+                while not self._pending_lines and not self._closed:
+                    self._condition.wait()
+                if not self._pending_lines and self._closed:
+                    return
+                
+                batch = self._pending_lines
+                self._pending_lines = []
+                batch_sequence = self._appended_sequence
+            
+            with self._file_lock:
+                self._write_batch(batch)
+                needs_compaction = self._needs_compaction()
+            
+            with self._condition:
+                self._durable_sequence = batch_sequence
+                self._condition.notify_all()
+                self._resolve_durable_waiters()
+            
+            if needs_compaction:
+                # Snapshotting takes queue locks, so keep it off the flusher thread
+                self._compaction_in_progress = True
+                threading.Thread(
+                    target=self.compact,
+                    name="command-queue-wal-compaction",
+                    daemon=True
+                ).start()
+    
+    def _write_batch(self, lines: List[str]) -> None:
+        """Write lines to the active log and fsync (caller holds the file lock)"""
+        data = "".join(lines)
+        self._log_file.write(data)
+        self._log_file.flush()
+        os.fsync(self._log_file.fileno())
+        self._log_size_bytes += len(data.encode("utf-8"))
+    
+    def _needs_compaction(self) -> bool:
+        """Check whether the active log outgrew the compaction threshold"""
+        return (
+            self.snapshot_provider is not None
+            and self._log_size_bytes >= self.compaction_threshold_bytes
+            and not self._compaction_in_progress
+        )
+    
+    def get_log_size_bytes(self) -> int:
+        """Get current size of the active log file"""
+        return self._log_size_bytes
+    
+    def compact(self) -> None:
+        """
+        Replace the journaled history with a snapshot of the live state
+        
+        1. Rotate: the active log becomes {log_path}.compacting and later
+           batches are written to a fresh log, so writers never wait for
+           the snapshot
+        2. Snapshot the live state (taken after the rotation, so every
+           operation missing from it is in the fresh log)
+        3. Atomically publish the snapshot and drop the rotated log
+        
+        Replaying enqueue records is idempotent per command_id, so records
+        present both in the snapshot and the fresh log are harmless.
+        """
+        if self.snapshot_provider is None:
+            return
+        
+        self._compaction_in_progress = True
+        try:
+            with self._file_lock:
+                self._log_file.close()
+                if os.path.exists(self.compacting_path):
+                    # Leftover of an interrupted compaction: keep its records
+                    # until a published snapshot supersedes them
+                    with open(self.log_path, "r", encoding="utf-8") as active_log, \
+                            open(self.compacting_path, "a", encoding="utf-8") as compacting_log:
+                        shutil.copyfileobj(active_log, compacting_log)
+                        compacting_log.flush()
+                        os.fsync(compacting_log.fileno())
+                    os.remove(self.log_path)
+                else:
+                    os.replace(self.log_path, self.compacting_path)
+                self._log_file = open(self.log_path, "a", encoding="utf-8")
+                self._log_size_bytes = 0
+            
+            snapshot_records = self.snapshot_provider()
+            temporary_snapshot_path = f"{self.snapshot_path}.tmp"
+            
+            with open(temporary_snapshot_path, "w", encoding="utf-8") as snapshot_file:
+                for record in snapshot_records:
+                    snapshot_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            
+            os.replace(temporary_snapshot_path, self.snapshot_path)
+            os.remove(self.compacting_path)
+        finally:
+            self._compaction_in_progress = False
+    
+    def close(self) -> None:
+        """Flush outstanding records and stop the flusher thread"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        
+        # The flusher drains pending records before exiting
+        if self._flusher_thread is not None:
+            self._flusher_thread.join()
+        
+        with self._condition:
+            self._resolve_durable_waiters()
+        
+        with self._file_lock:
+            self._log_file.close()
+
+
+class DurableCommandQueueManager(CommandQueueManager):
+    """
+    CommandQueueManager journaled to a write-ahead log
+    
+    Queue operations are recorded through the base class hooks while the
+    session lock is held, so the log order matches the in-memory order.
+    Each enqueue record's log sequence is kept on the command; submitters
+    confirm a submission only after wait_until_durable(commands) returns.
+    Delivery and acknowledgement records are not waited for, because losing
+    them on a crash only causes a re-delivery.
+    """
+    
+    def __init__(
+        self,
+        log_path: str,
+        visibility_timeout_seconds: float = 300.0,
+        compaction_threshold_bytes: int = 64 * 1024 * 1024,
+        group_commit: bool = True,
+        **queue_limits
+    ):
+        """
+        Initialize manager and rebuild queues from the write-ahead log
+        
+        Args:
+            log_path: Path of the write-ahead log file
+            visibility_timeout_seconds: Lease duration of delivered commands
+            compaction_threshold_bytes: Log size that triggers compaction
+            group_commit: Batch fsyncs across concurrent submissions
+            **queue_limits: Queue limits passed to CommandQueueManager
+                (max_commands_per_client, max_commands_per_session, max_queued_bytes)
+        """
+        super().__init__(visibility_timeout_seconds=visibility_timeout_seconds, **queue_limits)
+        
+        self._write_ahead_log = CommandQueueWriteAheadLog(
+            log_path=log_path,
+            snapshot_provider=self._build_snapshot_records,
+            compaction_threshold_bytes=compaction_threshold_bytes,
+            group_commit=group_commit
+        )
+        self._replay_write_ahead_log()
+    
+    def _replay_write_ahead_log(self) -> None:
+        """
+        Rebuild queues from journaled records
+        
+        Live commands are collected in enqueue order, then re-queued. Leases
+        are not restored: delivered but unacknowledged commands are queued
+        again, ahead of commands that were never delivered. Restored commands
+        count against the queue limits but are never rejected by them.
+        """
+        live_commands: Dict[str, Command] = {}
+        
+        for record in self._write_ahead_log.replay():
+            operation = record["op"]
+            
+            if operation == WAL_OPERATION_ENQUEUE:
+                if record["command_id"] in live_commands:
+                    continue
+                command = Command(
+                    command_id=record["command_id"],
+                    content=record["content"],
+                    target_client=record["client_id"],
+                    session_id=record["session_id"],
+                    priority=CommandPriority(record["priority"]),
+                    timeout_seconds=record.get("timeout_seconds"),
+                    not_before=record.get("not_before")
+                )
+                command.timestamp = record["timestamp"]
+                command.delivery_count = record.get("delivery_count", 0)
+                live_commands[command.command_id] = command
+            elif operation == WAL_OPERATION_LEASE:
+                command = live_commands.get(record["command_id"])
+                if command is not None:
+                    command.delivery_count += 1
+            elif operation in (WAL_OPERATION_ACK, WAL_OPERATION_EXPIRE, WAL_OPERATION_CANCEL):
+                live_commands.pop(record["command_id"], None)
+            elif operation == WAL_OPERATION_CLEAR_SESSION:
+                session_id = record["session_id"]
+                for command_id in [
+                    command_id for command_id, command in live_commands.items()
+                    if command.session_id == session_id
+                ]:
+                    del live_commands[command_id]
+        
+        delivered_first = sorted(
+            live_commands.values(),
+            key=lambda command: command.delivery_count == 0
+        )
+        for command in delivered_first:
+            if command.is_expired():
+                continue
+            if command.is_delayed():
+                self._schedule_delayed_command(command.session_id, command)
+            else:
+                self._get_or_create_client_queue(command.session_id, command.target_client).append(command)
+            self._count_held_command(command.session_id, command)
+    
+    def _build_snapshot_records(self) -> List[dict]:
+        """
+        Describe the live state as enqueue records for compaction
+        
+        Returns:
+            List[dict]: One enqueue record per delayed, leased or queued command
+        """
+        snapshot_records = []
+        
+        for session_id in list(self._command_queues.keys() | self._delayed_commands.keys()):
+            with self._get_session_lock(session_id):
+                for command in self._delayed_commands.get(session_id, {}).values():
+                    snapshot_records.append(_build_enqueue_record(command))
+                for lease in self._leases.get(session_id, {}).values():
+                    snapshot_records.append(_build_enqueue_record(lease.command))
+                for client_queue in self._command_queues.get(session_id, {}).values():
+                    for command in client_queue:
+                        snapshot_records.append(_build_enqueue_record(command))
+        
+        return snapshot_records
+    
+    async def wait_until_durable(self, commands: List[Command]) -> None:
+        """Wait, off the event loop, until the enqueue records of these commands are fsynced"""
+        if commands:
+            await self._write_ahead_log.wait_until_durable_async(
+                max(command.journal_sequence for command in commands)
+            )
+    
+    def wait_until_durable_blocking(self, commands: List[Command]) -> None:
+        """Block the calling thread until the enqueue records of these commands are fsynced"""
+        if commands:
+            self._write_ahead_log.wait_until_durable(max(command.journal_sequence for command in commands))
+    
+    def _on_commands_enqueued(self, session_id: str, commands: List[Command]) -> None:
+        for command in commands:
+            command.journal_sequence = self._write_ahead_log.append(_build_enqueue_record(command))
+    
+    def _on_commands_leased(self, session_id: str, commands: List[Command]) -> None:
+        for command in commands:
+            self._write_ahead_log.append({
+                "op": WAL_OPERATION_LEASE,
+                "session_id": session_id,
+                "command_id": command.command_id
+            })
+    
+    def _on_command_acknowledged(self, session_id: str, command_id: str) -> None:
+        self._write_ahead_log.append({
+            "op": WAL_OPERATION_ACK,
+            "session_id": session_id,
+            "command_id": command_id
+        })
+    
+    def _on_command_expired(self, session_id: str, command_id: str) -> None:
+        self._write_ahead_log.append({
+            "op": WAL_OPERATION_EXPIRE,
+            "session_id": session_id,
+            "command_id": command_id
+        })
+    
+    def _on_command_cancelled(self, session_id: str, command_id: str) -> None:
+        self._write_ahead_log.append({
+            "op": WAL_OPERATION_CANCEL,
+            "session_id": session_id,
+            "command_id": command_id
+        })
+    
+    def _on_session_cleared(self, session_id: str) -> None:
+        self._write_ahead_log.append({
+            "op": WAL_OPERATION_CLEAR_SESSION,
+            "session_id": session_id
+        })
+    
+    def compact(self) -> None:
+        """Compact the write-ahead log immediately"""
+        self._write_ahead_log.compact()
+    
+    def close(self) -> None:
+        """Flush the write-ahead log and stop its flusher thread"""
+        self._write_ahead_log.close()
+
+
+def _resolve_durable_waiter(waiter: asyncio.Future) -> None:
+    """Resolve durability waiter unless its request was already cancelled"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _build_enqueue_record(command: Command) -> dict:
+    """Build the write-ahead log record describing a queued command"""
+    return {
+        "op": WAL_OPERATION_ENQUEUE,
+        "command_id": command.command_id,
+        "session_id": command.session_id,
+        "client_id": command.target_client,
+        "content": command.content,
+        "priority": command.priority.value,
+        "timestamp": command.timestamp,
+        "timeout_seconds": command.timeout_seconds,
+        "not_before": command.not_before,
+        "delivery_count": command.delivery_count
+    }
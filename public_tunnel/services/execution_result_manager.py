@@ -3,18 +3,184 @@ Execution Result Manager Service
 
 Manages unified result storage and query for all commands with automatic timeout handling.
 Implementation of US-021: Unified Result Query Mechanism.
+
+Besides the command-id index, results are indexed by session (insertion
+order, and sorted by command id for "since" range scans), by client and by
+status, so history queries cost O(results returned) instead of a walk over
+every result in the process. The indexes are maintained by store_result,
+update_result_status and remove_result; status changes must go through
+update_result_status to keep the status index consistent.
+
+Retention is bounded by result count, estimated bytes held and a TTL after
+completion. Only finished (completed / failed / cancelled) results are
+evicted: expired ones in completion order, then least recently read ones
+while a limit is exceeded. Both orders are OrderedDicts, so eviction costs
+O(1) amortized per stored result.
+
+With a result body store, result_content above its spill threshold is
+written to disk and only a preview stays in memory; the body file lives as
+long as the result.
+
+Callers can await a result reaching a terminal state: waiters are asyncio
+futures resolved by store_result / update_result_status, so a waiting
+request holds no thread and never polls. Running commands can stream output
+into an append-only chunk log per command, read by offset, with the same
+kind of waiters for new output.
+
+Also keeps a rolling average of execution durations per client, used to
+estimate when a queued command will complete, and the recent turnaround
+latencies (submitted -> completed) per client and per command prefix, used
+to choose the auto async initial wait.
 """
 
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import Optional, Dict, List, Tuple
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+import asyncio
+import bisect
+import time
 
+from public_tunnel.services.result_body_store import DiskResultBodyStore
 from public_tunnel.models.execution_result import (
+    CommandOutputLog,
     ExecutionResult, 
     ExecutionResultStatus,
     UnifiedResultQueryResponse
 )
 
 
+# Number of most recent executions averaged per client
+EXECUTION_DURATION_WINDOW_SIZE = 20
+# Number of most recent turnaround latencies kept per client / command prefix
+TURNAROUND_LATENCY_WINDOW_SIZE = 100
+# A command prefix distribution is preferred over the client's once it has this many samples
+MIN_PREFIX_LATENCY_SAMPLES = 5
+# Rough per-result cost of the result object, its timestamps and index entries
+RESULT_OVERHEAD_BYTES = 1024
+
+TERMINAL_RESULT_STATUSES = (
+    ExecutionResultStatus.COMPLETED,
+    ExecutionResultStatus.FAILED,
+    ExecutionResultStatus.CANCELLED
+)
+
+
+def _resolve_completion_future(completion_future: asyncio.Future, result: ExecutionResult) -> None:
+    """Resolve a waiter on its own event loop, unless it already timed out"""
+    if not completion_future.done():
+        completion_future.set_result(result)
+
+
+async def _await_waiter(
+    waiters_by_command: Dict[str, List[asyncio.Future]],
+    command_id: str,
+    timeout_seconds: float
+) -> Optional[ExecutionResult]:
+    """Register a future for a command and wait for it to be woken
+    
+    Returns:
+        The result passed to _wake_waiters, None if the wait elapsed first
+    """
+    if timeout_seconds <= 0:
+        return None
+    
+    waiter_future = asyncio.get_running_loop().create_future()
+    waiters_by_command.setdefault(command_id, []).append(waiter_future)
+    try:
+        return await asyncio.wait_for(waiter_future, timeout_seconds)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        _discard_waiter(waiters_by_command, command_id, waiter_future)
+
+
+def _discard_waiter(waiters_by_command: Dict[str, List[asyncio.Future]], command_id: str, waiter_future: asyncio.Future) -> None:
+    """Unregister a future that stopped waiting (woken, timed out or cancelled)"""
+    waiters = waiters_by_command.get(command_id)
+    if waiters and waiter_future in waiters:
+        waiters.remove(waiter_future)
+        if not waiters:
+            del waiters_by_command[command_id]
+
+
+def _wake_waiters(waiters_by_command: Dict[str, List[asyncio.Future]], command_id: str, result: ExecutionResult) -> None:
+    """Wake every future waiting on a command
+    
+    Results may be reported from another thread or event loop, so each
+    future is resolved through its own loop.
+    """
+    waiters = waiters_by_command.pop(command_id, None)
+    if not waiters:
+        return
+    for waiter_future in waiters:
+        waiter_future.get_loop().call_soon_threadsafe(_resolve_completion_future, waiter_future, result)
+
+
+class RollingAverage:
+    """Average of the last window_size samples, updated in O(1)"""
+    
+    def __init__(self, window_size: int = EXECUTION_DURATION_WINDOW_SIZE):
+        self._samples: deque = deque(maxlen=window_size)
+        self._total = 0.0
+    
+    def add(self, sample: float) -> None:
+        """Add a sample, dropping the oldest one once the window is full"""
+        if len(self._samples) == self._samples.maxlen:
+            self._total -= self._samples[0]
+        self._samples.append(sample)
+        self._total += sample
+    
+    def get_average(self) -> Optional[float]:
+        """Average of the samples in the window, None before the first sample"""
+        if not self._samples:
+            return None
+        return self._total / len(self._samples)
+
+
+class LatencySamples:
+    """The last window_size latency samples, for quantile queries"""
+    
+    def __init__(self, window_size: int = TURNAROUND_LATENCY_WINDOW_SIZE):
+        self._samples: deque = deque(maxlen=window_size)
+    
+    def add(self, sample: float) -> None:
+        """Add a sample, dropping the oldest one once the window is full"""
+        self._samples.append(sample)
+    
+    def get_sample_count(self) -> int:
+        """Number of samples in the window"""
+        return len(self._samples)
+    
+    def get_quantile(self, fraction: float) -> Optional[float]:
+        """Latency below which the given fraction of samples fall, None before the first sample"""
+        if not self._samples:
+            return None
+        sorted_samples = sorted(self._samples)
+        return sorted_samples[min(int(fraction * len(sorted_samples)), len(sorted_samples) - 1)]
+    
+    def get_fraction_within(self, seconds: float) -> float:
+        """Fraction of samples no slower than the given latency"""
+        if not self._samples:
+            return 0.0
+        return sum(1 for sample in self._samples if sample <= seconds) / len(self._samples)
+
+
+def _discard_index_entry(index: Dict, index_key, command_id: str) -> None:
+    """Remove a command id from one secondary index entry, dropping the entry once empty"""
+    command_ids = index.get(index_key)
+    if command_ids is None:
+        return
+    command_ids.pop(command_id, None)
+    if not command_ids:
+        del index[index_key]
+
+
+def get_command_prefix(command_content: str) -> str:
+    """Program name of a command line, e.g. "ls" for "ls -la /tmp" """
+    command_words = command_content.split(maxsplit=1)
+    return command_words[0] if command_words else ""
+
+
 class InMemoryExecutionResultManager:
     """In-memory implementation of execution result management
     
@@ -22,9 +188,58 @@ class InMemoryExecutionResultManager:
     Results are indexed by command_id for consistent access.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_results: int = 100_000,
+        max_result_bytes: int = 256 * 1024 * 1024,
+        result_ttl_seconds: float = 86_400.0,
+        result_body_store: Optional[DiskResultBodyStore] = None
+    ):
+        """Initialize manager
+        
+        Args:
+            max_results: Maximum number of retained results
+            max_result_bytes: Maximum estimated memory held by retained results
+            result_ttl_seconds: How long a finished result is kept after completion
+            result_body_store: Disk store for large result bodies (None keeps all in memory)
+        """
+        self.max_results = max_results
+        self.max_result_bytes = max_result_bytes
+        self.result_ttl_seconds = result_ttl_seconds
+        self.result_body_store = result_body_store
+        
         # Command-id indexed storage for unified results
         self._results: Dict[str, ExecutionResult] = {}
+        # Structure: {command_id: estimated bytes} - memory accounting
+        self._result_sizes: Dict[str, int] = {}
+        self._held_bytes = 0
+        # Finished results only - {command_id: monotonic completion time}, oldest first
+        self._completion_order: "OrderedDict[str, float]" = OrderedDict()
+        # Finished results only - least recently stored or read first
+        self._access_order: "OrderedDict[str, None]" = OrderedDict()
+        self._expired_count = 0
+        self._evicted_count = 0
+        # Secondary indexes; dicts with None values serve as insertion-ordered sets
+        # Structure: {session_id: {command_id: None}}
+        self._command_ids_by_session: Dict[str, Dict[str, None]] = {}
+        # Per-session command ids kept sorted; sortable ids make this creation order
+        self._sorted_command_ids_by_session: Dict[str, List[str]] = {}
+        # Structure: {(session_id, client_id): {command_id: None}}
+        self._command_ids_by_client: Dict[Tuple[str, str], Dict[str, None]] = {}
+        # Structure: {(session_id, status): {command_id: None}}
+        self._command_ids_by_status: Dict[Tuple[str, ExecutionResultStatus], Dict[str, None]] = {}
+        # Structure: {(session_id, client_id): RollingAverage} - execution seconds
+        self._execution_durations: Dict[Tuple[str, str], RollingAverage] = {}
+        # Structure: {(session_id, client_id): LatencySamples} - submitted -> completed seconds
+        self._client_turnaround_latencies: Dict[Tuple[str, str], LatencySamples] = {}
+        # Structure: {(session_id, command_prefix): LatencySamples} - submitted -> completed seconds
+        self._prefix_turnaround_latencies: Dict[Tuple[str, str], LatencySamples] = {}
+        # Structure: {command_id: [Future]} - requests awaiting a terminal result
+        self._completion_waiters: Dict[str, List[asyncio.Future]] = {}
+        # Structure: {command_id: CommandOutputLog} - output streamed while running
+        self._output_logs: Dict[str, CommandOutputLog] = {}
+        # Structure: {command_id: [Future]} - readers awaiting new output
+        self._output_waiters: Dict[str, List[asyncio.Future]] = {}
     
     def store_result(self, result: ExecutionResult) -> None:
         """Store execution result with command-id indexing
@@ -32,7 +247,22 @@ class InMemoryExecutionResultManager:
         Args:
             result: ExecutionResult to store
         """
+        previous_result = self._results.get(result.command_id)
+        if previous_result is not None:
+            # A replaced result keeps its place in the session history
+            self._remove_from_indexes(previous_result, keep_session_entry=previous_result.session_id == result.session_id)
+            self._completion_order.pop(result.command_id, None)
+            self._access_order.pop(result.command_id, None)
+            if previous_result.result_content_spilled and not result.result_content_spilled:
+                self.result_body_store.delete_body(result.command_id)
         self._results[result.command_id] = result
+        self._add_to_indexes(result)
+        self._account_result_size(result)
+        
+        if result.execution_status in TERMINAL_RESULT_STATUSES:
+            self._mark_result_evictable(result.command_id)
+            self._notify_completion_waiters(result)
+        self._enforce_retention()
     
     def get_result_by_command_id(self, command_id: str) -> Optional[ExecutionResult]:
         """Get execution result by command_id
@@ -43,6 +273,8 @@ class InMemoryExecutionResultManager:
         Returns:
             ExecutionResult if found, None otherwise
         """
+        if command_id in self._access_order:
+            self._access_order.move_to_end(command_id)
         return self._results.get(command_id)
     
     def create_and_store_result(
@@ -52,7 +284,9 @@ class InMemoryExecutionResultManager:
         client_id: str,
         execution_status: ExecutionResultStatus = ExecutionResultStatus.PENDING,
         result_content: Optional[str] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        command_content: Optional[str] = None,
+        file_references: Optional[List[str]] = None
     ) -> ExecutionResult:
         """Create and store new execution result
         
@@ -63,6 +297,8 @@ class InMemoryExecutionResultManager:
             execution_status: Current execution status
             result_content: Execution result content (optional)
             error_message: Error message if failed (optional)
+            command_content: Submitted command line, to learn latency per command prefix (optional)
+            file_references: IDs of files attached to the result (optional)
             
         Returns:
             Created ExecutionResult instance
@@ -75,10 +311,16 @@ class InMemoryExecutionResultManager:
         )
         
         if result_content:
-            result.result_content = result_content
+            self._set_result_content(result, result_content)
             
         if error_message:
             result.error_message = error_message
+        
+        if command_content is not None:
+            result.command_prefix = get_command_prefix(command_content)
+        
+        if file_references:
+            result.file_references = file_references
             
         self.store_result(result)
         return result
@@ -88,15 +330,23 @@ class InMemoryExecutionResultManager:
         command_id: str,
         new_status: ExecutionResultStatus,
         result_content: Optional[str] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        execution_duration_seconds: Optional[float] = None
     ) -> bool:
         """Update execution result status
         
+        A client reported COMPLETED / FAILED result feeds the client's rolling
+        execution duration average: the reported duration if given,
+        otherwise the time since the result was reported RUNNING. Its
+        turnaround latency (submitted -> completed) feeds the client and
+        command prefix latency distributions.
+        
         Args:
             command_id: Command identifier to update
             new_status: New execution status
             result_content: Updated result content (optional)
             error_message: Updated error message (optional)
+            execution_duration_seconds: Client measured execution time (optional)
             
         Returns:
             True if update successful, False if result not found
@@ -105,21 +355,280 @@ class InMemoryExecutionResultManager:
         if not result:
             return False
         
+        result.invalidate_serialized_response()
+        previous_status = result.execution_status
         result.execution_status = new_status
+        if new_status != previous_status:
+            self._move_in_status_index(result, previous_status)
         
         if new_status == ExecutionResultStatus.RUNNING and not result.started_at:
             result.started_at = datetime.now()
-        elif new_status in [ExecutionResultStatus.COMPLETED, ExecutionResultStatus.FAILED]:
+        elif new_status in [ExecutionResultStatus.COMPLETED, ExecutionResultStatus.FAILED, ExecutionResultStatus.CANCELLED]:
             result.completed_at = datetime.now()
+        
+        if new_status in (ExecutionResultStatus.COMPLETED, ExecutionResultStatus.FAILED) and previous_status in (
+            ExecutionResultStatus.PENDING,
+            ExecutionResultStatus.RUNNING
+        ):
+            if execution_duration_seconds is None and result.started_at is not None:
+                execution_duration_seconds = (result.completed_at - result.started_at).total_seconds()
+            if execution_duration_seconds is not None:
+                self.record_execution_duration(result.session_id, result.client_id, execution_duration_seconds)
+            self.record_turnaround_latency(
+                result.session_id,
+                result.client_id,
+                result.command_prefix,
+                (result.completed_at - result.submitted_at).total_seconds()
+            )
             
         if result_content is not None:
-            result.result_content = result_content
+            self._set_result_content(result, result_content)
             
         if error_message is not None:
             result.error_message = error_message
+        
+        self._account_result_size(result)
+        if new_status in TERMINAL_RESULT_STATUSES:
+            if command_id not in self._completion_order:
+                self._mark_result_evictable(command_id)
+            self._notify_completion_waiters(result)
+        self._enforce_retention()
             
         return True
     
+    async def wait_for_completion(self, command_id: str, timeout_seconds: float) -> Optional[ExecutionResult]:
+        """Wait until a command's result reaches a terminal state
+        
+        The waiter is a future on the caller's event loop, resolved when the
+        result is stored or updated as COMPLETED / FAILED / CANCELLED.
+        
+        Args:
+            command_id: Command identifier to wait for
+            timeout_seconds: Maximum time to wait
+            
+        Returns:
+            The terminal ExecutionResult, None if the wait elapsed first
+        """
+        result = self._results.get(command_id)
+        if result is not None and result.execution_status in TERMINAL_RESULT_STATUSES:
+            return result
+        return await _await_waiter(self._completion_waiters, command_id, timeout_seconds)
+    
+    async def wait_for_completions(
+        self,
+        command_ids: List[str],
+        timeout_seconds: float,
+        wait_for_all: bool
+    ) -> None:
+        """Wait until any or all of several commands' results are finished
+        
+        One future per unfinished command is registered on the completion
+        waiters, so a batch wait costs no more than single waits and never
+        polls. Unknown command ids are ignored.
+        
+        Args:
+            command_ids: Command identifiers to wait for
+            timeout_seconds: Maximum time to wait
+            wait_for_all: True to wait for every result, False for the first one
+        """
+        known_results = [self._results[command_id] for command_id in command_ids if command_id in self._results]
+        unfinished_command_ids = [
+            result.command_id for result in known_results
+            if result.execution_status not in TERMINAL_RESULT_STATUSES
+        ]
+        if not unfinished_command_ids or timeout_seconds <= 0:
+            return
+        if not wait_for_all and len(unfinished_command_ids) < len(known_results):
+            return  # One is already finished
+        
+        loop = asyncio.get_running_loop()
+        waiter_futures = {}
+        for command_id in unfinished_command_ids:
+            waiter_futures[command_id] = loop.create_future()
+            self._completion_waiters.setdefault(command_id, []).append(waiter_futures[command_id])
+        try:
+            await asyncio.wait(
+                waiter_futures.values(),
+                timeout=timeout_seconds,
+                return_when=asyncio.ALL_COMPLETED if wait_for_all else asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for command_id, waiter_future in waiter_futures.items():
+                _discard_waiter(self._completion_waiters, command_id, waiter_future)
+                waiter_future.cancel()
+    
+    def get_completion_waiter_count(self) -> int:
+        """Get the number of requests currently waiting for a result"""
+        return sum(len(waiters) for waiters in self._completion_waiters.values())
+    
+    def _notify_completion_waiters(self, result: ExecutionResult) -> None:
+        """Wake every request waiting for this result, and output readers (no more output will come)"""
+        _wake_waiters(self._completion_waiters, result.command_id, result)
+        _wake_waiters(self._output_waiters, result.command_id, result)
+    
+    def append_command_output(self, command_id: str, data: str) -> Optional[int]:
+        """Append a chunk to a running command's output log
+        
+        The first chunk of a PENDING result marks it RUNNING. Readers waiting
+        for new output are woken.
+        
+        Args:
+            command_id: Command identifier the output belongs to
+            data: Output produced since the previous chunk
+            
+        Returns:
+            Offset of the chunk in the output, None if the command has no result
+        """
+        result = self._results.get(command_id)
+        if result is None:
+            return None
+        if result.execution_status == ExecutionResultStatus.PENDING:
+            self.update_result_status(command_id, ExecutionResultStatus.RUNNING)
+        
+        output_log = self._output_logs.get(command_id)
+        if output_log is None:
+            output_log = self._output_logs[command_id] = CommandOutputLog()
+        chunk_offset = output_log.append(data)
+        
+        self._account_result_size(result)
+        _wake_waiters(self._output_waiters, command_id, result)
+        self._enforce_retention()
+        return chunk_offset
+    
+    def get_command_output_size(self, command_id: str) -> int:
+        """Get the length of a command's output so far (0 before the first chunk)"""
+        output_log = self._output_logs.get(command_id)
+        return output_log.total_size if output_log else 0
+    
+    def read_command_output(self, command_id: str, offset: int) -> str:
+        """Read a command's output after an offset
+        
+        Args:
+            command_id: Command identifier to read output of
+            offset: Output the reader already has
+            
+        Returns:
+            Output after offset ("" if there is none yet)
+        """
+        output_log = self._output_logs.get(command_id)
+        return output_log.read(offset) if output_log else ""
+    
+    async def wait_for_output(self, command_id: str, offset: int, timeout_seconds: float) -> None:
+        """Wait until a command has output beyond offset or has finished
+        
+        Args:
+            command_id: Command identifier to wait for
+            offset: Output the reader already has
+            timeout_seconds: Maximum time to wait
+        """
+        result = self._results.get(command_id)
+        if result is None or result.execution_status in TERMINAL_RESULT_STATUSES:
+            return
+        if self.get_command_output_size(command_id) > offset:
+            return
+        await _await_waiter(self._output_waiters, command_id, timeout_seconds)
+    
+    def record_execution_duration(self, session_id: str, client_id: str, duration_seconds: float) -> None:
+        """Add an execution duration sample to a client's rolling average
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client that executed the command
+            duration_seconds: Execution time in seconds
+        """
+        client_key = (session_id, client_id)
+        rolling_average = self._execution_durations.get(client_key)
+        if rolling_average is None:
+            rolling_average = self._execution_durations[client_key] = RollingAverage()
+        rolling_average.add(max(0.0, duration_seconds))
+    
+    def record_turnaround_latency(
+        self,
+        session_id: str,
+        client_id: str,
+        command_prefix: Optional[str],
+        latency_seconds: float
+    ) -> None:
+        """Add a submitted -> completed latency sample for a client and command prefix
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client that executed the command
+            command_prefix: Program name of the command, None if unknown
+            latency_seconds: Seconds from submission to completion
+        """
+        latency_seconds = max(0.0, latency_seconds)
+        latency_keys = [(self._client_turnaround_latencies, (session_id, client_id))]
+        if command_prefix:
+            latency_keys.append((self._prefix_turnaround_latencies, (session_id, command_prefix)))
+        for latency_index, latency_key in latency_keys:
+            latency_samples = latency_index.get(latency_key)
+            if latency_samples is None:
+                latency_samples = latency_index[latency_key] = LatencySamples()
+            latency_samples.add(latency_seconds)
+    
+    def get_turnaround_latencies(
+        self,
+        session_id: str,
+        client_id: str,
+        command_content: str
+    ) -> Optional[LatencySamples]:
+        """Get the latency distribution that best predicts a new command
+        
+        The command prefix distribution is more specific ("sleep" vs "echo")
+        and is used once it has enough samples; otherwise the client's.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Target client of the command
+            command_content: Command line about to be submitted
+            
+        Returns:
+            LatencySamples, None if nothing was learned yet
+        """
+        prefix_latencies = self._prefix_turnaround_latencies.get((session_id, get_command_prefix(command_content)))
+        if prefix_latencies is not None and prefix_latencies.get_sample_count() >= MIN_PREFIX_LATENCY_SAMPLES:
+            return prefix_latencies
+        return self._client_turnaround_latencies.get((session_id, client_id))
+    
+    def get_average_execution_seconds(self, session_id: str, client_id: str) -> Optional[float]:
+        """Get a client's rolling average execution duration
+        
+        Args:
+            session_id: Session identifier
+            client_id: Client identifier
+            
+        Returns:
+            Average seconds over recent executions, None if none were reported
+        """
+        rolling_average = self._execution_durations.get((session_id, client_id))
+        return rolling_average.get_average() if rolling_average else None
+    
+    def estimate_completion_time(
+        self,
+        session_id: str,
+        client_id: str,
+        queue_position: Optional[int]
+    ) -> Optional[datetime]:
+        """Estimate when a queued command will complete
+        
+        The client executes its queue one command at a time, so the command
+        completes after the commands ahead of it plus itself, each taking
+        the client's average execution duration.
+        
+        Args:
+            session_id: Session identifier
+            client_id: Target client of the command
+            queue_position: Commands delivered before this one (0: next)
+            
+        Returns:
+            Estimated completion time, None without a position or duration history
+        """
+        average_execution_seconds = self.get_average_execution_seconds(session_id, client_id)
+        if queue_position is None or average_execution_seconds is None:
+            return None
+        return datetime.now() + timedelta(seconds=(queue_position + 1) * average_execution_seconds)
+    
     def get_unified_response(self, command_id: str) -> Optional[UnifiedResultQueryResponse]:
         """Get unified result response for command
         
@@ -129,12 +638,32 @@ class InMemoryExecutionResultManager:
         Returns:
             UnifiedResultQueryResponse if found, None otherwise
         """
-        result = self._results.get(command_id)
+        result = self.get_result_by_command_id(command_id)
         if not result:
             return None
         
         return result.to_unified_response()
     
+    def remove_result(self, command_id: str) -> Optional[ExecutionResult]:
+        """Remove a result and its index entries
+        
+        Args:
+            command_id: Command identifier to remove
+            
+        Returns:
+            The removed ExecutionResult, None if not found
+        """
+        result = self._results.pop(command_id, None)
+        if result is not None:
+            self._remove_from_indexes(result)
+            self._held_bytes -= self._result_sizes.pop(command_id, 0)
+            if result.result_content_spilled:
+                self.result_body_store.delete_body(command_id)
+            self._completion_order.pop(command_id, None)
+            self._access_order.pop(command_id, None)
+            self._output_logs.pop(command_id, None)
+        return result
+    
     def get_command_ids_by_session(self, session_id: str) -> List[str]:
         """Get all command IDs that have been executed in a session
         
@@ -142,16 +671,235 @@ class InMemoryExecutionResultManager:
             session_id: Session identifier to query
             
         Returns:
-            List of command IDs that have results in this session
+            List of command IDs that have results in this session, in creation order
+        """
+        return list(self._command_ids_by_session.get(session_id, ()))
+    
+    def get_command_ids_by_client(self, session_id: str, client_id: str) -> List[str]:
+        """Get the command IDs of a session that targeted a client
+        
+        Args:
+            session_id: Session identifier to query
+            client_id: Client identifier to query
+            
+        Returns:
+            List of command IDs, in creation order
+        """
+        return list(self._command_ids_by_client.get((session_id, client_id), ()))
+    
+    def get_command_ids_by_status(self, session_id: str, status: ExecutionResultStatus) -> List[str]:
+        """Get the command IDs of a session whose result has a given status
+        
+        Args:
+            session_id: Session identifier to query
+            status: Execution status to match
+            
+        Returns:
+            List of command IDs, in the order they reached the status
+        """
+        return list(self._command_ids_by_status.get((session_id, status), ()))
+    
+    def query_command_ids(
+        self,
+        session_id: str,
+        client_id: Optional[str] = None,
+        status: Optional[ExecutionResultStatus] = None,
+        since_command_id: Optional[str] = None
+    ) -> List[str]:
+        """Get the command IDs of a session matching all given filters
+        
+        Candidates come from the smallest matching index; the other filters
+        are checked per candidate, so the cost follows the candidate count
+        rather than the number of stored results.
+        
+        Args:
+            session_id: Session identifier to query
+            client_id: Only commands that targeted this client (optional)
+            status: Only results with this status (optional)
+            since_command_id: Only command IDs sorting after this one (optional)
+            
+        Returns:
+            List of matching command IDs; in creation order without filters,
+            otherwise sorted by command ID (creation order for sortable IDs)
+        """
+        candidate_lists = []
+        if since_command_id is not None:
+            candidate_lists.append(self.get_command_ids_since(session_id, since_command_id))
+        if client_id is not None:
+            candidate_lists.append(self._command_ids_by_client.get((session_id, client_id), {}))
+        if status is not None:
+            candidate_lists.append(self._command_ids_by_status.get((session_id, status), {}))
+        if not candidate_lists:
+            return self.get_command_ids_by_session(session_id)
+        
+        matching_command_ids = []
+        for command_id in min(candidate_lists, key=len):
+            result = self._results[command_id]
+            if client_id is not None and result.client_id != client_id:
+                continue
+            if status is not None and result.execution_status != status:
+                continue
+            if since_command_id is not None and command_id <= since_command_id:
+                continue
+            matching_command_ids.append(command_id)
+        matching_command_ids.sort()
+        return matching_command_ids
+    
+    def get_spilled_content_path(self, command_id: str) -> Optional[str]:
+        """Get the disk path of a result's full body
+        
+        Args:
+            command_id: Command identifier to query
+            
+        Returns:
+            File path if the result body was spilled to disk, None otherwise
+        """
+        result = self._results.get(command_id)
+        if result is None or not result.result_content_spilled:
+            return None
+        return self.result_body_store.get_body_path(command_id)
+    
+    def get_result_count(self) -> int:
+        """Get the number of stored results"""
+        return len(self._results)
+    
+    def get_retention_stats(self) -> Dict[str, int]:
+        """Get retained result count, memory and eviction counters
+        
+        Returns:
+            Dict: results, held_bytes, limits, expired/evicted counts and
+            the count and size of bodies spilled to disk
+        """
+        self._enforce_retention()
+        return {
+            "results": len(self._results),
+            "finished_results": len(self._completion_order),
+            "max_results": self.max_results,
+            "held_bytes": self._held_bytes,
+            "max_bytes": self.max_result_bytes,
+            "ttl_seconds": int(self.result_ttl_seconds),
+            "expired_count": self._expired_count,
+            "evicted_count": self._evicted_count,
+            **(self.result_body_store.get_stats() if self.result_body_store else {"spilled_results": 0, "spilled_bytes": 0})
+        }
+    
+    def get_command_ids_since(self, session_id: str, since_command_id: str) -> List[str]:
+        """Get command IDs of a session that sort after a given command ID
+        
+        With time-sortable command IDs this is "commands created since X",
+        answered with a binary search over the session index.
+        
+        Args:
+            session_id: Session identifier to query
+            since_command_id: Exclusive lower bound (a command ID or a
+                sortable_id_lower_bound() key)
+            
+        Returns:
+            List of command IDs after since_command_id, oldest first
         """
-        command_ids = []
-        for command_id, result in self._results.items():
-            if result.session_id == session_id:
-                command_ids.append(command_id)
+        session_command_ids = self._sorted_command_ids_by_session.get(session_id, [])
+        start_index = bisect.bisect_right(session_command_ids, since_command_id)
+        return session_command_ids[start_index:]
+    
+    def _add_to_indexes(self, result: ExecutionResult) -> None:
+        """Add a stored result to the secondary indexes"""
+        session_command_ids = self._command_ids_by_session.setdefault(result.session_id, {})
+        if result.command_id not in session_command_ids:
+            session_command_ids[result.command_id] = None
+            # Sortable ids almost always land at the tail, so this is an append in practice
+            bisect.insort(self._sorted_command_ids_by_session.setdefault(result.session_id, []), result.command_id)
+        self._command_ids_by_client.setdefault((result.session_id, result.client_id), {})[result.command_id] = None
+        self._command_ids_by_status.setdefault((result.session_id, result.execution_status), {})[result.command_id] = None
+    
+    def _remove_from_indexes(self, result: ExecutionResult, keep_session_entry: bool = False) -> None:
+        """Remove a result from the secondary indexes, dropping emptied index entries"""
+        _discard_index_entry(self._command_ids_by_client, (result.session_id, result.client_id), result.command_id)
+        _discard_index_entry(self._command_ids_by_status, (result.session_id, result.execution_status), result.command_id)
+        if keep_session_entry:
+            return
+        
+        _discard_index_entry(self._command_ids_by_session, result.session_id, result.command_id)
+        sorted_command_ids = self._sorted_command_ids_by_session.get(result.session_id)
+        if sorted_command_ids is not None:
+            position = bisect.bisect_left(sorted_command_ids, result.command_id)
+            if position < len(sorted_command_ids) and sorted_command_ids[position] == result.command_id:
+                del sorted_command_ids[position]
+            if not sorted_command_ids:
+                del self._sorted_command_ids_by_session[result.session_id]
+    
+    def _set_result_content(self, result: ExecutionResult, result_content: str) -> None:
+        """Set result_content, spilling a body above the threshold to disk"""
+        result.invalidate_serialized_response()
+        if self.result_body_store is not None and self.result_body_store.should_spill(result_content):
+            result.result_content = self.result_body_store.write_body(result.command_id, result_content)
+            result.result_content_size = self.result_body_store.get_body_size(result.command_id)
+            result.result_content_spilled = True
+            return
+        
+        if result.result_content_spilled:
+            self.result_body_store.delete_body(result.command_id)
+            result.result_content_spilled = False
+            result.result_content_size = None
+        result.result_content = result_content
+    
+    def _account_result_size(self, result: ExecutionResult) -> None:
+        """Re-estimate the memory held by a result after its content changed"""
+        size_bytes = (
+            RESULT_OVERHEAD_BYTES
+            + len(result.result_content or "")
+            + len(result.error_message or "")
+            + sum(len(file_reference) for file_reference in result.file_references)
+            + self.get_command_output_size(result.command_id)
+        )
+        self._held_bytes += size_bytes - self._result_sizes.get(result.command_id, 0)
+        self._result_sizes[result.command_id] = size_bytes
+    
+    def _mark_result_evictable(self, command_id: str) -> None:
+        """Start the TTL of a finished result and make it an eviction candidate"""
+        self._completion_order[command_id] = time.monotonic()
+        self._access_order[command_id] = None
+        self._access_order.move_to_end(command_id)
+    
+    def _enforce_retention(self, now: Optional[float] = None) -> None:
+        """Evict expired finished results, then least recently used ones over a limit"""
+        expire_before = (time.monotonic() if now is None else now) - self.result_ttl_seconds
+        while self._completion_order:
+            oldest_command_id, completed_at = next(iter(self._completion_order.items()))
+            if completed_at > expire_before:
+                break
+            self.remove_result(oldest_command_id)
+            self._expired_count += 1
         
-        # Return in creation order (based on storage order)
-        return command_ids
+        while self._access_order and (
+            len(self._results) > self.max_results or self._held_bytes > self.max_result_bytes
+        ):
+            self.remove_result(next(iter(self._access_order)))
+            self._evicted_count += 1
+    
+    def _move_in_status_index(self, result: ExecutionResult, previous_status: ExecutionResultStatus) -> None:
+        """Re-index a result whose status changed"""
+        _discard_index_entry(self._command_ids_by_status, (result.session_id, previous_status), result.command_id)
+        self._command_ids_by_status.setdefault((result.session_id, result.execution_status), {})[result.command_id] = None
+    
+    def close(self) -> None:
+        """Delete spilled result bodies from disk (called on server shutdown)"""
+        if self.result_body_store is not None:
+            self.result_body_store.close()
     
     def clear_all_results(self) -> None:
         """Clear all stored results (for testing)"""
-        self._results.clear()
\ No newline at end of file
+        self._results.clear()
+        self._command_ids_by_session.clear()
+        self._sorted_command_ids_by_session.clear()
+        self._command_ids_by_client.clear()
+        self._command_ids_by_status.clear()
+        self._result_sizes.clear()
+        self._held_bytes = 0
+        self._completion_order.clear()
+        self._access_order.clear()
+        self._execution_durations.clear()
+        self._client_turnaround_latencies.clear()
+        self._prefix_turnaround_latencies.clear()
+        self._completion_waiters.clear()
+        self._output_logs.clear()
+        self._output_waiters.clear()
\ No newline at end of file
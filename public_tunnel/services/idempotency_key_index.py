@@ -0,0 +1,223 @@
+"""
+Idempotency Key Index Service
+
+Deduplicates retried command submissions. A submitter sends the same
+Idempotency-Key header on every retry of one logical submission; the first
+request enqueues the command and records its response, retries get the
+recorded response back without enqueuing again.
+
+The index is an OrderedDict in insertion (= creation) order, so both TTL
+eviction (expired entries are always at the front) and capacity eviction
+(oldest first) are O(1) per evicted entry. Memory is capped by entry count
+and by an estimate of the bytes held, and both are reported by get_stats().
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import threading
+import time
+
+
+# Rough per-entry cost of the dict slot, tuple key and entry object
+ENTRY_OVERHEAD_BYTES = 320
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+class IdempotencyKeyConflictError(ValueError):
+    """Raised when an idempotency key cannot be used for a request"""
+    pass
+
+
+class IdempotencyKeyReusedError(IdempotencyKeyConflictError):
+    """Raised when a key is reused for a different request than the original"""
+    pass
+
+
+class IdempotencyKeyInProgressError(IdempotencyKeyConflictError):
+    """Raised when the original request with this key has not finished yet"""
+    pass
+
+
+def compute_request_fingerprint(request_fields: Dict[str, Any]) -> bytes:
+    """
+    Fingerprint a request to detect an idempotency key reused for a different one
+    
+    SHA-256 of the fields' canonical JSON: unlike hash() it is the same in
+    every process, and a collision (which would replay another request's
+    response instead of rejecting the reuse) is not a practical concern.
+    
+    Args:
+        request_fields: JSON-compatible fields identifying the request
+    
+    Returns:
+        bytes: 32-byte digest
+    """
+    canonical_json = json.dumps(request_fields, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical_json.encode("utf-8")).digest()
+
+
+class IdempotentSubmission:
+    """Index entry: fingerprint of the original request and its recorded response"""
+    
+    __slots__ = ("request_fingerprint", "created_at", "response_body", "size_bytes")
+    
+    def __init__(self, request_fingerprint: bytes, created_at: float, size_bytes: int):
+        self.request_fingerprint = request_fingerprint
+        self.created_at = created_at
+        self.response_body: Optional[bytes] = None  # None while the original request is in progress
+        self.size_bytes = size_bytes
+
+
+class IdempotencyKeyIndex:
+    """
+    Bounded, TTL-evicted index from (session_id, idempotency key) to the
+    recorded submission response
+    
+    Usage per request:
+        begin_submission()  -> recorded response for a retry, None for a new key
+        complete_submission() after the command was enqueued, or
+        abandon_submission() if it failed so a retry can try again
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float = 86_400.0,
+        max_entries: int = 100_000,
+        max_bytes: int = 64 * 1024 * 1024
+    ):
+        """
+        Initialize index
+        
+        Args:
+            ttl_seconds: How long a key is remembered after its first use
+            max_entries: Maximum number of remembered keys
+            max_bytes: Maximum estimated memory held by remembered keys
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], IdempotentSubmission]" = OrderedDict()
+        self._held_bytes = 0
+        self._lock = threading.Lock()
+        self._replayed_count = 0
+        self._expired_count = 0
+        self._evicted_count = 0
+    
+    def begin_submission(
+        self,
+        session_id: str,
+        idempotency_key: str,
+        request_fingerprint: bytes,
+        now: Optional[float] = None
+    ) -> Optional[bytes]:
+        """
+        Look up a key and reserve it if it is new
+        
+        Args:
+            session_id: Session the submission belongs to
+            idempotency_key: Client supplied key
+            request_fingerprint: compute_request_fingerprint of the request, to detect key reuse
+            now: Current time (defaults to time.monotonic())
+        
+        Returns:
+            bytes: Recorded response body if this is a retry, None for a new key
+        
+        Raises:
+            IdempotencyKeyReusedError: If the key was used for a different request
+            IdempotencyKeyInProgressError: If the original request is still running
+        """
+        now = time.monotonic() if now is None else now
+        index_key = (session_id, idempotency_key)
+        
+        with self._lock:
+            self._evict_expired(now)
+            
+            submission = self._entries.get(index_key)
+            if submission is not None:
+                if submission.request_fingerprint != request_fingerprint:
+                    raise IdempotencyKeyReusedError(
+                        f"Idempotency key '{idempotency_key}' was already used for a different request"
+                    )
+                if submission.response_body is None:
+                    raise IdempotencyKeyInProgressError(
+                        f"A request with idempotency key '{idempotency_key}' is still in progress"
+                    )
+                self._replayed_count += 1
+                return submission.response_body
+            
+            size_bytes = ENTRY_OVERHEAD_BYTES + len(session_id) + len(idempotency_key) + len(request_fingerprint)
+            self._entries[index_key] = IdempotentSubmission(request_fingerprint, now, size_bytes)
+            self._held_bytes += size_bytes
+            self._evict_over_capacity()
+            return None
+    
+    def complete_submission(self, session_id: str, idempotency_key: str, response_body: bytes) -> None:
+        """
+        Record the response of the original request so retries can replay it
+        
+        Args:
+            session_id: Session the submission belongs to
+            idempotency_key: Client supplied key
+            response_body: Serialized response returned to the original request
+        """
+        with self._lock:
+            submission = self._entries.get((session_id, idempotency_key))
+            if submission is None:
+                return  # Evicted while in progress; retries will be treated as new
+            submission.response_body = response_body
+            submission.size_bytes += len(response_body)
+            self._held_bytes += len(response_body)
+            self._evict_over_capacity()
+    
+    def abandon_submission(self, session_id: str, idempotency_key: str) -> None:
+        """
+        Forget a reserved key whose request failed, so a retry is processed again
+        
+        Args:
+            session_id: Session the submission belongs to
+            idempotency_key: Client supplied key
+        """
+        with self._lock:
+            submission = self._entries.pop((session_id, idempotency_key), None)
+            if submission is not None:
+                self._held_bytes -= submission.size_bytes
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get index size and eviction counters
+        
+        Returns:
+            Dict: entries, held_bytes, limits, and replayed/expired/evicted counts
+        """
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "held_bytes": self._held_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": int(self.ttl_seconds),
+                "replayed_count": self._replayed_count,
+                "expired_count": self._expired_count,
+                "evicted_count": self._evicted_count
+            }
+    
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries older than the TTL; they are always at the front (lock must be held)"""
+        expire_before = now - self.ttl_seconds
+        while self._entries:
+            oldest_submission = next(iter(self._entries.values()))
+            if oldest_submission.created_at > expire_before:
+                break
+            self._entries.popitem(last=False)
+            self._held_bytes -= oldest_submission.size_bytes
+            self._expired_count += 1
+    
+    def _evict_over_capacity(self) -> None:
+        """Drop oldest entries until both limits hold (lock must be held)"""
+        while self._entries and (len(self._entries) > self.max_entries or self._held_bytes > self.max_bytes):
+            _, oldest_submission = self._entries.popitem(last=False)
+            self._held_bytes -= oldest_submission.size_bytes
+            self._evicted_count += 1
@@ -5,7 +5,7 @@ Handles offline status management operations including threshold configuration,
 forced status checks, and command eligibility determination for US-016.
 """
 
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from datetime import datetime
 from public_tunnel.models.client_presence import (
     OfflineThresholdConfiguration,
@@ -141,4 +141,24 @@ class OfflineStatusManager:
         
         # US-016 business rule: only online clients can receive new commands
         from public_tunnel.models.client_presence import ClientPresenceStatus
-        return presence_info.presence_status == ClientPresenceStatus.ONLINE
\ No newline at end of file
+        return presence_info.presence_status == ClientPresenceStatus.ONLINE
+    
+    def get_command_eligibility_snapshot(self, session_id: str) -> Dict[str, bool]:
+        """
+        Get command eligibility of every registered client in a session
+        
+        Args:
+            session_id: Session to take the snapshot for
+            
+        Returns:
+            Mapping of registered client_id to whether it can receive commands
+            (clients that never registered are absent from the mapping)
+        """
+        from public_tunnel.models.client_presence import ClientPresenceStatus
+        
+        presence_snapshot = self.presence_tracker.get_session_presence_snapshot(session_id)
+        
+        return {
+            client_id: presence_status == ClientPresenceStatus.ONLINE
+            for client_id, presence_status in presence_snapshot.items()
+        }
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Result Body Store Service
+
+Disk-backed storage for large execution result bodies. Results whose
+result_content exceeds the spill threshold are written here once and the
+in-memory ExecutionResult keeps only a short preview, so a query does not
+copy tens of megabytes into every response, and the full body is served
+by streaming the file.
+
+One file per command, named by a hash of the command id so arbitrary ids
+are safe file names. Files are written to a temporary name and renamed,
+so a reader never sees a partial body.
+
+Results live in memory, so their bodies are unreachable after a restart:
+close() (called on server shutdown) deletes every body the store wrote,
+and the directory itself when the store created it.
+"""
+
+from typing import Dict, Optional
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+
+class DiskResultBodyStore:
+    """Stores result bodies above a size threshold as files in one directory"""
+    
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        spill_threshold_bytes: int = 1024 * 1024,
+        preview_bytes: int = 4096
+    ):
+        """
+        Initialize store
+        
+        Args:
+            directory: Directory for body files (a new temporary directory if None)
+            spill_threshold_bytes: Bodies larger than this (UTF-8 bytes) are spilled
+            preview_bytes: Size of the preview kept in memory for a spilled body
+        """
+        self._owns_directory = directory is None
+        self.directory = directory or tempfile.mkdtemp(prefix="public-tunnel-results-")
+        os.makedirs(self.directory, exist_ok=True)
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self.preview_bytes = preview_bytes
+        self._lock = threading.Lock()
+        # Structure: {command_id: size in bytes}
+        self._body_sizes: Dict[str, int] = {}
+        self._held_bytes = 0
+    
+    def should_spill(self, content: str) -> bool:
+        """Check whether a body exceeds the spill threshold"""
+        # A character is at most 4 UTF-8 bytes, so short strings skip the encode
+        if len(content) * 4 <= self.spill_threshold_bytes:
+            return False
+        return len(content.encode("utf-8")) > self.spill_threshold_bytes
+    
+    def write_body(self, command_id: str, content: str) -> str:
+        """
+        Write a body to disk, replacing any previous body of the command
+        
+        Args:
+            command_id: Command the body belongs to
+            content: Full result body
+        
+        Returns:
+            str: Preview of the body (its first preview_bytes, on a character boundary)
+        """
+        encoded_content = content.encode("utf-8")
+        body_path = self.get_body_path(command_id)
+        temporary_path = f"{body_path}.tmp"
+        # Recreated if a previous close() removed it
+        os.makedirs(self.directory, exist_ok=True)
+        with open(temporary_path, "wb") as body_file:
+            body_file.write(encoded_content)
+        os.replace(temporary_path, body_path)
+        
+        with self._lock:
+            self._held_bytes += len(encoded_content) - self._body_sizes.get(command_id, 0)
+            self._body_sizes[command_id] = len(encoded_content)
+        
+        return encoded_content[:self.preview_bytes].decode("utf-8", errors="ignore")
+    
+    def get_body_path(self, command_id: str) -> str:
+        """Path of the body file of a command (which may not exist)"""
+        file_name = hashlib.sha256(command_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, file_name)
+    
+    def get_body_size(self, command_id: str) -> Optional[int]:
+        """Size in bytes of a stored body, None if the command has none"""
+        with self._lock:
+            return self._body_sizes.get(command_id)
+    
+    def delete_body(self, command_id: str) -> None:
+        """Delete the body of a command, if any"""
+        with self._lock:
+            size_bytes = self._body_sizes.pop(command_id, None)
+            if size_bytes is None:
+                return
+            self._held_bytes -= size_bytes
+        try:
+            os.remove(self.get_body_path(command_id))
+        except FileNotFoundError:
+            pass
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the number and total size of stored bodies
+        
+        Returns:
+            Dict: spilled_results, spilled_bytes
+        """
+        with self._lock:
+            return {
+                "spilled_results": len(self._body_sizes),
+                "spilled_bytes": self._held_bytes
+            }
+    
+    def close(self) -> None:
+        """
+        Delete every stored body, and the directory if the store created it
+        
+        Only files this store wrote are removed from a configured directory,
+        which other processes may share.
+        """
+        with self._lock:
+            command_ids = list(self._body_sizes)
+        for command_id in command_ids:
+            self.delete_body(command_id)
+        
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
@@ -1,11 +1,13 @@
 from conftest import BDDPhase
+import uuid
 
 def execute(context):
     """Set up a command submission scenario for auto async response testing"""
     context.phase = BDDPhase.GIVEN
     
     # Set up test environment
-    context.session_id = "test-session-auto-async"
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-auto-async-{uuid.uuid4().hex[:8]}"
     context.client_id = "test-client-auto-async" 
     context.command_content = "echo 'test command'"
     
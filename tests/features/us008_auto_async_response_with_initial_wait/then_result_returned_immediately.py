@@ -14,7 +14,8 @@ def execute(context):
     # For immediate response, we should get the actual result, not just a command-id
     # The response should contain the execution result directly
     assert "result" in response_data, "Expected immediate result in response"
-    assert response_data["result"] is not None, "Expected non-null immediate result"
+    assert response_data["result"] == "test command", "Expected the result reported by the client"
+    assert response_data["execution_status"] == "completed"
     
     # Should NOT be in async mode (no command_id for polling)
     assert "command_id" not in response_data or response_data.get("async_mode") is False, \
@@ -1,20 +1,51 @@
 from conftest import BDDPhase
+from public_tunnel.dependencies.providers import get_auto_async_wait_seconds
+from public_tunnel.main import app
+import threading
 import time
 
 def execute(context):
-    """Execute command submission expecting immediate response (fast execution)"""
+    """Execute command submission while the client reports its result within the threshold"""
     context.phase = BDDPhase.WHEN
     
-    # Submit command with expectation of immediate response
-    # This should use a new API endpoint that supports auto async mode
-    submit_response = context.test_client.post(
-        f"/api/sessions/{context.session_id}/commands/submit-auto-async",
-        json=context.command_submission_data
+    app.dependency_overrides[get_auto_async_wait_seconds] = lambda: 10.0
+    
+    # The submission blocks until the result arrives, so it runs beside the client
+    submission_outcome = {}
+    def submit_command():
+        submission_outcome["response"] = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit-auto-async",
+            json=context.command_submission_data
+        )
+    submitter = threading.Thread(target=submit_command)
+    submitter.start()
+    
+    # Client side: pick up the command and report its result
+    delivered_commands = []
+    deadline = time.time() + 5
+    while not delivered_commands and time.time() < deadline:
+        poll_response = context.test_client.get(
+            f"/api/sessions/{context.session_id}/clients/{context.client_id}/commands/poll"
+        )
+        delivered_commands = poll_response.json()["commands"]
+    assert delivered_commands, "Client should receive the submitted command"
+    
+    result_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/results",
+        json={
+            "command_id": delivered_commands[0]["command_id"],
+            "execution_status": "completed",
+            "result_content": "test command"
+        }
     )
+    assert result_response.status_code == 200
+    
+    submitter.join(timeout=10)
+    submit_response = submission_outcome["response"]
     
     context.submission_result = {
         "response": submit_response,
         "status_code": submit_response.status_code,
         "response_data": submit_response.json() if submit_response.status_code in [200, 201] else None,
         "submission_time": time.time()
-    }
\ No newline at end of file
+    }
@@ -1,12 +1,15 @@
 from conftest import BDDPhase
+from public_tunnel.dependencies.providers import get_auto_async_wait_seconds
+from public_tunnel.main import app
 import time
 
 def execute(context):
     """Execute command submission expecting async response (slow execution)"""
     context.phase = BDDPhase.WHEN
     
-    # Modify command to simulate slower execution
+    # Modify command to simulate slower execution; the client never reports within the threshold
     context.command_submission_data["command_content"] = "sleep 2 && echo 'slow command'"
+    app.dependency_overrides[get_auto_async_wait_seconds] = lambda: 0.2
     
     # Submit command with expectation of async response
     submit_response = context.test_client.post(
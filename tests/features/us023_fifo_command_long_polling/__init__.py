@@ -0,0 +1 @@
+# US-023: FIFO Command Long Polling test package
@@ -0,0 +1,22 @@
+def execute(context):
+    """
+    Register a client whose command queue is empty
+    
+    US-013 requires the target client to have polled at least once
+    before commands can be submitted to it.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-long-poll"
+    context.target_client_id = "client-long-poll"
+    context.wait_seconds = 5
+    context.command_content = "echo 'long poll command'"
+    
+    client_presence_tracker = get_client_presence_tracker()
+    client_presence_tracker.update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
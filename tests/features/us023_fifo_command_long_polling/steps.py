@@ -0,0 +1,45 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us023_fifo_command_long_polling import given_registered_client_with_empty_queue
+from tests.features.us023_fifo_command_long_polling import when_client_long_polls_and_command_submitted
+from tests.features.us023_fifo_command_long_polling import when_client_long_polls_without_commands
+from tests.features.us023_fifo_command_long_polling import when_first_waiter_times_out_as_command_submitted
+from tests.features.us023_fifo_command_long_polling import then_waiting_poll_returns_submitted_command
+from tests.features.us023_fifo_command_long_polling import then_command_delivered_before_wait_elapses
+from tests.features.us023_fifo_command_long_polling import then_poll_returns_no_command_after_waiting
+from tests.features.us023_fifo_command_long_polling import then_second_waiter_woken_for_command
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a registered client with an empty command queue')
+def step_given_registered_client_with_empty_queue(context):
+    return given_registered_client_with_empty_queue.execute(context)
+
+@when('the client long-polls and a command is submitted while it waits')
+def step_when_client_long_polls_and_command_submitted(context):
+    return when_client_long_polls_and_command_submitted.execute(context)
+
+@when('the client long-polls and no command is submitted')
+def step_when_client_long_polls_without_commands(context):
+    return when_client_long_polls_without_commands.execute(context)
+
+@then('the waiting poll should return the submitted command')
+def step_then_waiting_poll_returns_submitted_command(context):
+    return then_waiting_poll_returns_submitted_command.execute(context)
+
+@then('the command should be delivered well before the wait elapses')
+def step_then_command_delivered_before_wait_elapses(context):
+    return then_command_delivered_before_wait_elapses.execute(context)
+
+@then('the poll should return no command after waiting')
+def step_then_poll_returns_no_command_after_waiting(context):
+    return then_poll_returns_no_command_after_waiting.execute(context)
+
+@when('two requests of the client wait and the first one times out as a command is submitted')
+def step_when_first_waiter_times_out_as_command_submitted(context):
+    return when_first_waiter_times_out_as_command_submitted.execute(context)
+
+@then('the second waiting request should be woken for the command')
+def step_then_second_waiter_woken_for_command(context):
+    return then_second_waiter_woken_for_command.execute(context)
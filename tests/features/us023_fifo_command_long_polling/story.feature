@@ -0,0 +1,20 @@
+Feature: FIFO Command Long Polling
+  As a client
+  I want my poll request to wait until a command arrives
+  So that I do not have to re-poll repeatedly while my queue is empty
+
+  Scenario: Command submitted during long-poll is delivered immediately
+    Given a registered client with an empty command queue
+    When the client long-polls and a command is submitted while it waits
+    Then the waiting poll should return the submitted command
+    And the command should be delivered well before the wait elapses
+
+  Scenario: Long-poll without commands returns empty after the wait
+    Given a registered client with an empty command queue
+    When the client long-polls and no command is submitted
+    Then the poll should return no command after waiting
+
+  Scenario: Wake-up picked for a timed out waiter is passed to the next waiter
+    Given a registered client with an empty command queue
+    When two requests of the client wait and the first one times out as a command is submitted
+    Then the second waiting request should be woken for the command
@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify the poll was woken by the submission instead of running out its wait"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.delivery_delay_seconds < context.wait_seconds / 2, \
+        f"Command pickup took {context.delivery_delay_seconds:.2f}s, expected immediate wake-up"
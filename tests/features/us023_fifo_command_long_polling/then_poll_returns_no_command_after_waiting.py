@@ -0,0 +1,14 @@
+def execute(context):
+    """Verify an empty long-poll waits for the requested time and returns no command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.poll_response.status_code == 200
+    
+    response_data = context.poll_response.json()
+    assert response_data["command"] is None, "No command should be returned"
+    assert response_data["total_queue_size"] == 0
+    
+    assert context.elapsed_seconds >= context.short_wait_seconds * 0.9, \
+        f"Poll returned after {context.elapsed_seconds:.2f}s, expected to wait {context.short_wait_seconds}s"
@@ -0,0 +1,15 @@
+def execute(context):
+    """Verify the parked poll received the command submitted while it waited"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.submit_response.status_code == 200, \
+        f"Command submission failed: {context.submit_response.status_code}"
+    assert context.poll_response.status_code == 200, \
+        f"Long-poll failed: {context.poll_response.status_code}"
+    
+    command = context.poll_response.json()["command"]
+    assert command is not None, "Long-poll should return the submitted command"
+    assert command["command_id"] == context.submit_response.json()["command_id"]
+    assert command["content"] == context.command_content
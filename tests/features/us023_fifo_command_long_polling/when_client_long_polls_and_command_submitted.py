@@ -0,0 +1,47 @@
+import threading
+import time
+
+
+def execute(context):
+    """
+    Start a long-poll request in background and submit a command while it waits
+    
+    The poll runs in a separate thread so the submission can happen while
+    the poll request is parked on the server.
+    """
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
+    poll_outcome = {}
+    
+    def long_poll():
+        started_at = time.monotonic()
+        poll_outcome["response"] = context.test_client.get(
+            poll_endpoint,
+            params={"wait_seconds": context.wait_seconds}
+        )
+        poll_outcome["returned_at"] = time.monotonic()
+        poll_outcome["started_at"] = started_at
+    
+    poll_thread = threading.Thread(target=long_poll)
+    poll_thread.start()
+    
+    # Give the poll request time to park on the empty queue
+    time.sleep(0.3)
+    
+    submitted_at = time.monotonic()
+    submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit",
+        json={
+            "command_content": context.command_content,
+            "target_client_id": context.target_client_id
+        }
+    )
+    
+    poll_thread.join(timeout=context.wait_seconds + 5)
+    
+    context.submit_response = submit_response
+    context.poll_response = poll_outcome["response"]
+    context.delivery_delay_seconds = poll_outcome["returned_at"] - submitted_at
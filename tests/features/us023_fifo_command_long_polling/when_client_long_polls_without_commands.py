@@ -0,0 +1,17 @@
+import time
+
+
+def execute(context):
+    """Long-poll an empty queue with a short wait and measure the waiting time"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.short_wait_seconds = 0.5
+    
+    started_at = time.monotonic()
+    context.poll_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll",
+        params={"wait_seconds": context.short_wait_seconds}
+    )
+    context.elapsed_seconds = time.monotonic() - started_at
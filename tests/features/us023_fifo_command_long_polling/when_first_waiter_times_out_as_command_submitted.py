@@ -0,0 +1,37 @@
+import asyncio
+
+
+def execute(context):
+    """
+    Park two waiters, then cancel the first one and submit a command before the loop runs again
+    
+    The cancellation is already scheduled when the submission picks the first
+    waiter for its wake-up, which reproduces a wait_for timeout racing the
+    notification.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.services.command_queue_manager import InMemoryCommandQueueManager
+    
+    context.phase = BDDPhase.WHEN
+    
+    queue_manager = InMemoryCommandQueueManager()
+    
+    async def race_timeout_with_submission():
+        first_wait = asyncio.create_task(
+            queue_manager.wait_for_command(context.session_id, context.target_client_id, context.wait_seconds)
+        )
+        second_wait = asyncio.create_task(
+            queue_manager.wait_for_command(context.session_id, context.target_client_id, context.wait_seconds)
+        )
+        await asyncio.sleep(0.05)
+        
+        first_wait.cancel()
+        queue_manager.submit_command_to_target_client(
+            context.session_id, context.target_client_id, context.command_content
+        )
+        
+        started_at = asyncio.get_running_loop().time()
+        second_wait_outcome = await asyncio.wait_for(second_wait, timeout=context.wait_seconds + 1)
+        return second_wait_outcome, asyncio.get_running_loop().time() - started_at
+    
+    context.second_wait_outcome, context.delivery_delay_seconds = asyncio.run(race_timeout_with_submission())
@@ -0,0 +1 @@
+# US-024: Batch Command Polling test package
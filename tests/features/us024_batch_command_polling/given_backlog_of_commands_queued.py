@@ -0,0 +1,32 @@
+def execute(context):
+    """
+    Queue a backlog of commands for a single registered client
+    
+    The backlog is submitted through the US-006 submission API so that
+    the batch polling is exercised against real queued commands.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-batch-poll"
+    context.target_client_id = "client-batch-poll"
+    context.batch_size = 3
+    context.test_commands = [f"echo 'backlog command {index}'" for index in range(5)]
+    
+    client_presence_tracker = get_client_presence_tracker()
+    client_presence_tracker.update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    for command_content in context.test_commands:
+        response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={
+                "command_content": command_content,
+                "target_client_id": context.target_client_id
+            }
+        )
+        assert response.status_code == 200, f"Command submission failed: {response.status_code}"
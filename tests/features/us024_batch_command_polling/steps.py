@@ -0,0 +1,25 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us024_batch_command_polling import given_backlog_of_commands_queued
+from tests.features.us024_batch_command_polling import when_client_polls_with_batch_size
+from tests.features.us024_batch_command_polling import then_polled_batch_in_fifo_order
+from tests.features.us024_batch_command_polling import then_remaining_commands_retrievable_in_one_batch
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a backlog of commands is queued for the client')
+def step_given_backlog_of_commands_queued(context):
+    return given_backlog_of_commands_queued.execute(context)
+
+@when('the client polls with a maximum batch size')
+def step_when_client_polls_with_batch_size(context):
+    return when_client_polls_with_batch_size.execute(context)
+
+@then('the polled batch should contain commands in FIFO order')
+def step_then_polled_batch_in_fifo_order(context):
+    return then_polled_batch_in_fifo_order.execute(context)
+
+@then('the remaining commands should be retrievable in one batch')
+def step_then_remaining_commands_retrievable_in_one_batch(context):
+    return then_remaining_commands_retrievable_in_one_batch.execute(context)
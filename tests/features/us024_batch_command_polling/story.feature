@@ -0,0 +1,10 @@
+Feature: Batch Command Polling
+  As a fast client
+  I want to receive several queued commands in one polling request
+  So that I can drain a command backlog in a handful of round trips
+
+  Scenario: Client drains a backlog with batch polling
+    Given a backlog of commands is queued for the client
+    When the client polls with a maximum batch size
+    Then the polled batch should contain commands in FIFO order
+    And the remaining commands should be retrievable in one batch
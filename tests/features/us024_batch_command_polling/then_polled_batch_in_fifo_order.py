@@ -0,0 +1,16 @@
+def execute(context):
+    """Verify the first batch holds the oldest commands in submission order"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.batch_poll_response.status_code == 200
+    response_data = context.batch_poll_response.json()
+    
+    received_contents = [command["content"] for command in response_data["commands"]]
+    assert received_contents == context.test_commands[:context.batch_size], \
+        f"Expected first {context.batch_size} commands in FIFO order, got {received_contents}"
+    
+    # The single-command field stays compatible with existing clients
+    assert response_data["command"]["content"] == context.test_commands[0]
+    assert response_data["total_queue_size"] == len(context.test_commands) - context.batch_size
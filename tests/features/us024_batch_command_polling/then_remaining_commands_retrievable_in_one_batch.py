@@ -0,0 +1,15 @@
+def execute(context):
+    """Verify the rest of the backlog is returned in one retrieval and the queue is empty"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.batch_retrieval_response.status_code == 200
+    response_data = context.batch_retrieval_response.json()
+    
+    received_contents = [command["content"] for command in response_data["commands"]]
+    assert received_contents == context.test_commands[context.batch_size:], \
+        f"Expected remaining commands in FIFO order, got {received_contents}"
+    
+    assert response_data["has_more_commands"] is False
+    assert response_data["queue_size"] == 0
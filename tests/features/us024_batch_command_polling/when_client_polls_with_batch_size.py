@@ -0,0 +1,15 @@
+def execute(context):
+    """Poll the FIFO endpoint once for a batch, then drain the rest via single command retrieval"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.batch_poll_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll",
+        params={"max_commands": context.batch_size}
+    )
+    
+    context.batch_retrieval_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/command",
+        params={"max_commands": 10}
+    )
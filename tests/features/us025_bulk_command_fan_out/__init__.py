@@ -0,0 +1 @@
+# US-025: Bulk Command Fan-out test package
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+
+def execute(context):
+    """
+    Register several online clients and one client that has gone offline
+    
+    The offline client was last seen well beyond the offline threshold,
+    so US-014 rules must keep commands away from it.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-bulk-fan-out"
+    context.online_client_ids = [f"client-bulk-online-{index}" for index in range(3)]
+    context.offline_client_id = "client-bulk-offline"
+    context.unknown_client_id = "client-bulk-never-registered"
+    context.command_content = "collect diagnostics"
+    
+    client_presence_tracker = get_client_presence_tracker()
+    for client_id in context.online_client_ids:
+        client_presence_tracker.update_client_last_seen(
+            client_id=client_id,
+            session_id=context.session_id
+        )
+    
+    client_presence_tracker.update_client_last_seen(
+        client_id=context.offline_client_id,
+        session_id=context.session_id,
+        timestamp=datetime.now() - timedelta(hours=1)
+    )
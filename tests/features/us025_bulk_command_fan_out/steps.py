@@ -0,0 +1,40 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us025_bulk_command_fan_out import given_online_and_offline_clients_in_session
+from tests.features.us025_bulk_command_fan_out import when_broadcast_command_to_session
+from tests.features.us025_bulk_command_fan_out import when_submit_bulk_command_list
+from tests.features.us025_bulk_command_fan_out import then_every_online_client_has_command_queued
+from tests.features.us025_bulk_command_fan_out import then_offline_client_does_not_receive_command
+from tests.features.us025_bulk_command_fan_out import then_commands_for_online_clients_submitted
+from tests.features.us025_bulk_command_fan_out import then_invalid_targets_rejected_with_error_codes
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('several online clients and one offline client in a session')
+def step_given_online_and_offline_clients_in_session(context):
+    return given_online_and_offline_clients_in_session.execute(context)
+
+@when('I broadcast a command to the session')
+def step_when_broadcast_command_to_session(context):
+    return when_broadcast_command_to_session.execute(context)
+
+@when('I submit a bulk command list including unknown and offline clients')
+def step_when_submit_bulk_command_list(context):
+    return when_submit_bulk_command_list.execute(context)
+
+@then('every online client should have the command queued')
+def step_then_every_online_client_has_command_queued(context):
+    return then_every_online_client_has_command_queued.execute(context)
+
+@then('the offline client should not receive the command')
+def step_then_offline_client_does_not_receive_command(context):
+    return then_offline_client_does_not_receive_command.execute(context)
+
+@then('commands for online clients should be submitted')
+def step_then_commands_for_online_clients_submitted(context):
+    return then_commands_for_online_clients_submitted.execute(context)
+
+@then('unknown and offline targets should be rejected with error codes')
+def step_then_invalid_targets_rejected_with_error_codes(context):
+    return then_invalid_targets_rejected_with_error_codes.execute(context)
@@ -0,0 +1,16 @@
+Feature: Bulk Command Fan-out
+  As an AI assistant
+  I want to submit commands to many clients in a single request
+  So that pushing the same command to a whole fleet costs one round trip
+
+  Scenario: Broadcast command reaches every online client in the session
+    Given several online clients and one offline client in a session
+    When I broadcast a command to the session
+    Then every online client should have the command queued
+    And the offline client should not receive the command
+
+  Scenario: Explicit bulk submission reports invalid targets individually
+    Given several online clients and one offline client in a session
+    When I submit a bulk command list including unknown and offline clients
+    Then commands for online clients should be submitted
+    And unknown and offline targets should be rejected with error codes
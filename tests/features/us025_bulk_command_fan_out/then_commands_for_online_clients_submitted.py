@@ -0,0 +1,18 @@
+def execute(context):
+    """Verify each online client got a submitted command with a queryable result"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.bulk_response.status_code == 200
+    response_data = context.bulk_response.json()
+    
+    submitted_client_ids = [submitted["target_client_id"] for submitted in response_data["submitted_commands"]]
+    assert submitted_client_ids == context.online_client_ids
+    
+    for submitted in response_data["submitted_commands"]:
+        result_response = context.test_client.get(
+            f"/api/sessions/{context.session_id}/results/{submitted['command_id']}"
+        )
+        assert result_response.status_code == 200
+        assert result_response.json()["execution_status"] == "pending"
@@ -0,0 +1,21 @@
+def execute(context):
+    """Verify the broadcast created one command per online client"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.bulk_response.status_code == 200, \
+        f"Bulk submission failed: {context.bulk_response.status_code}"
+    response_data = context.bulk_response.json()
+    
+    assert response_data["total_submitted"] == len(context.online_client_ids)
+    submitted_by_client = {
+        submitted["target_client_id"]: submitted["command_id"]
+        for submitted in response_data["submitted_commands"]
+    }
+    
+    for client_id in context.online_client_ids:
+        polled_command = context.polled_commands[client_id]
+        assert polled_command is not None, f"Client {client_id} did not receive the broadcast"
+        assert polled_command["content"] == context.command_content
+        assert polled_command["command_id"] == submitted_by_client[client_id]
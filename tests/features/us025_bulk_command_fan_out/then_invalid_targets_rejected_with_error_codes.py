@@ -0,0 +1,17 @@
+def execute(context):
+    """Verify offline and unknown targets are listed as rejected with their reasons"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    response_data = context.bulk_response.json()
+    rejection_codes = {
+        rejected["target_client_id"]: rejected["error_code"]
+        for rejected in response_data["rejected_commands"]
+    }
+    
+    assert rejection_codes == {
+        context.offline_client_id: "CLIENT_OFFLINE",
+        context.unknown_client_id: "CLIENT_NOT_FOUND"
+    }
+    assert response_data["total_rejected"] == 2
@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify the offline client was skipped by the broadcast"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.polled_commands[context.offline_client_id] is None, \
+        "Offline client should not receive broadcast commands"
@@ -0,0 +1,17 @@
+def execute(context):
+    """Broadcast one command to all online clients and poll every client once"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.bulk_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit-bulk",
+        json={"broadcast_command_content": context.command_content}
+    )
+    
+    context.polled_commands = {}
+    for client_id in context.online_client_ids + [context.offline_client_id]:
+        poll_response = context.test_client.get(
+            f"/api/sessions/{context.session_id}/clients/{client_id}/commands/poll"
+        )
+        context.polled_commands[client_id] = poll_response.json()["command"]
@@ -0,0 +1,17 @@
+def execute(context):
+    """Submit explicit commands to online, offline and never-registered clients"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    target_client_ids = context.online_client_ids + [context.offline_client_id, context.unknown_client_id]
+    
+    context.bulk_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit-bulk",
+        json={
+            "commands": [
+                {"command_content": f"echo {client_id}", "target_client_id": client_id}
+                for client_id in target_client_ids
+            ]
+        }
+    )
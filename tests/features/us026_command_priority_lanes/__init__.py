@@ -0,0 +1 @@
+# US-026: Command Priority Lanes test package
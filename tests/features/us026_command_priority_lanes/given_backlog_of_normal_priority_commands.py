@@ -0,0 +1,26 @@
+def execute(context):
+    """Queue several normal priority commands for one registered client"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-priority"
+    context.target_client_id = "client-priority"
+    context.normal_commands = [f"echo 'routine work {index}'" for index in range(3)]
+    
+    client_presence_tracker = get_client_presence_tracker()
+    client_presence_tracker.update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    for command_content in context.normal_commands:
+        response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={
+                "command_content": command_content,
+                "target_client_id": context.target_client_id
+            }
+        )
+        assert response.status_code == 200
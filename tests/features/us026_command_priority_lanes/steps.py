@@ -0,0 +1,25 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us026_command_priority_lanes import given_backlog_of_normal_priority_commands
+from tests.features.us026_command_priority_lanes import when_submit_urgent_and_high_priority_commands
+from tests.features.us026_command_priority_lanes import then_commands_ordered_by_priority
+from tests.features.us026_command_priority_lanes import then_equal_priority_in_fifo_order
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a client has a backlog of normal priority commands')
+def step_given_backlog_of_normal_priority_commands(context):
+    return given_backlog_of_normal_priority_commands.execute(context)
+
+@when('I submit an urgent and a high priority command to the same client')
+def step_when_submit_urgent_and_high_priority_commands(context):
+    return when_submit_urgent_and_high_priority_commands.execute(context)
+
+@then('the client should receive commands ordered by priority')
+def step_then_commands_ordered_by_priority(context):
+    return then_commands_ordered_by_priority.execute(context)
+
+@then('commands of equal priority should stay in FIFO order')
+def step_then_equal_priority_in_fifo_order(context):
+    return then_equal_priority_in_fifo_order.execute(context)
@@ -0,0 +1,10 @@
+Feature: Command Priority Lanes
+  As an AI assistant
+  I want urgent commands to overtake a routine backlog
+  So that abort or diagnostics commands are not stuck behind queued work
+
+  Scenario: Urgent commands are delivered before routine backlog
+    Given a client has a backlog of normal priority commands
+    When I submit an urgent and a high priority command to the same client
+    Then the client should receive commands ordered by priority
+    And commands of equal priority should stay in FIFO order
@@ -0,0 +1,13 @@
+def execute(context):
+    """Verify urgent and high priority commands are delivered first"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.poll_response.status_code == 200
+    received_commands = context.poll_response.json()["commands"]
+    
+    assert [command["priority"] for command in received_commands] == \
+        ["urgent", "high", "normal", "normal", "normal"]
+    assert received_commands[0]["content"] == context.urgent_command
+    assert received_commands[1]["content"] == context.high_command
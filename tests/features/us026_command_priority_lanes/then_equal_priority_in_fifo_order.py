@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the routine backlog kept its submission order"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    received_commands = context.poll_response.json()["commands"]
+    normal_contents = [command["content"] for command in received_commands if command["priority"] == "normal"]
+    
+    assert normal_contents == context.normal_commands
+    assert context.poll_response.json()["total_queue_size"] == 0
@@ -0,0 +1,24 @@
+def execute(context):
+    """Submit higher priority commands after the backlog and drain the queue"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.high_command = "collect diagnostics"
+    context.urgent_command = "abort"
+    
+    for command_content, priority in [(context.high_command, "high"), (context.urgent_command, "urgent")]:
+        response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={
+                "command_content": command_content,
+                "target_client_id": context.target_client_id,
+                "priority": priority
+            }
+        )
+        assert response.status_code == 200
+    
+    context.poll_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll",
+        params={"max_commands": 10}
+    )
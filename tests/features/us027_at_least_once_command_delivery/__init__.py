@@ -0,0 +1 @@
+# US-027: At-least-once Command Delivery test package
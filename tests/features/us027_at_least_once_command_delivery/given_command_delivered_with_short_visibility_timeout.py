@@ -0,0 +1,43 @@
+def execute(context):
+    """
+    Deliver one command through a queue manager with a short visibility timeout
+    
+    The shared queue manager is overridden so the lease expires within the test.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_client_presence_tracker, get_command_queue_manager
+    from public_tunnel.services.command_queue_manager import InMemoryCommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-at-least-once"
+    context.target_client_id = "client-at-least-once"
+    context.visibility_timeout_seconds = 0.2
+    
+    queue_manager = InMemoryCommandQueueManager(visibility_timeout_seconds=context.visibility_timeout_seconds)
+    app.dependency_overrides[get_command_queue_manager] = lambda: queue_manager
+    
+    client_presence_tracker = get_client_presence_tracker()
+    client_presence_tracker.update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit",
+        json={
+            "command_content": "echo 'at least once'",
+            "target_client_id": context.target_client_id
+        }
+    )
+    assert submit_response.status_code == 200
+    context.command_id = submit_response.json()["command_id"]
+    
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
+    first_delivery = context.test_client.get(context.poll_endpoint).json()["command"]
+    assert first_delivery["command_id"] == context.command_id
+    assert first_delivery["delivery_count"] == 1
+    
+    # While leased the command is invisible to further polls
+    assert context.test_client.get(context.poll_endpoint).json()["command"] is None
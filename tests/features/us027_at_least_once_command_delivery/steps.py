@@ -0,0 +1,40 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us027_at_least_once_command_delivery import given_command_delivered_with_short_visibility_timeout
+from tests.features.us027_at_least_once_command_delivery import when_client_does_not_acknowledge
+from tests.features.us027_at_least_once_command_delivery import when_client_acknowledges_command
+from tests.features.us027_at_least_once_command_delivery import when_client_reports_command_result
+from tests.features.us027_at_least_once_command_delivery import when_client_reports_command_result_with_files
+from tests.features.us027_at_least_once_command_delivery import then_command_delivered_again
+from tests.features.us027_at_least_once_command_delivery import then_command_not_delivered_again
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command was delivered to a client with a short visibility timeout')
+def step_given_command_delivered_with_short_visibility_timeout(context):
+    return given_command_delivered_with_short_visibility_timeout.execute(context)
+
+@when('the client does not acknowledge it before the timeout')
+def step_when_client_does_not_acknowledge(context):
+    return when_client_does_not_acknowledge.execute(context)
+
+@when('the client acknowledges the command')
+def step_when_client_acknowledges_command(context):
+    return when_client_acknowledges_command.execute(context)
+
+@when('the client reports the command result')
+def step_when_client_reports_command_result(context):
+    return when_client_reports_command_result.execute(context)
+
+@when('the client reports the command result with files')
+def step_when_client_reports_command_result_with_files(context):
+    return when_client_reports_command_result_with_files.execute(context)
+
+@then('the command should be delivered again')
+def step_then_command_delivered_again(context):
+    return then_command_delivered_again.execute(context)
+
+@then('the command should not be delivered again')
+def step_then_command_not_delivered_again(context):
+    return then_command_not_delivered_again.execute(context)
@@ -0,0 +1,24 @@
+Feature: At-least-once Command Delivery
+  As a client
+  I want commands I received but never confirmed to be delivered again
+  So that a crash or lost response after polling does not lose the command
+
+  Scenario: Unacknowledged command is re-delivered after the visibility timeout
+    Given a command was delivered to a client with a short visibility timeout
+    When the client does not acknowledge it before the timeout
+    Then the command should be delivered again
+
+  Scenario: Acknowledged command is not re-delivered
+    Given a command was delivered to a client with a short visibility timeout
+    When the client acknowledges the command
+    Then the command should not be delivered again
+
+  Scenario: Reporting a result acknowledges the command
+    Given a command was delivered to a client with a short visibility timeout
+    When the client reports the command result
+    Then the command should not be delivered again
+
+  Scenario: Reporting a result with files acknowledges the command
+    Given a command was delivered to a client with a short visibility timeout
+    When the client reports the command result with files
+    Then the command should not be delivered again
@@ -0,0 +1,12 @@
+def execute(context):
+    """Verify the same command came back with an increased delivery count"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.redelivery_poll_response.status_code == 200
+    redelivered_command = context.redelivery_poll_response.json()["command"]
+    
+    assert redelivered_command is not None, "Unacknowledged command should be re-delivered"
+    assert redelivered_command["command_id"] == context.command_id
+    assert redelivered_command["delivery_count"] == 2
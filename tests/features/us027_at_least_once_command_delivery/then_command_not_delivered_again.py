@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the acknowledged command stays delivered"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.redelivery_poll_response.status_code == 200
+    assert context.redelivery_poll_response.json()["command"] is None, \
+        "Acknowledged command must not be re-delivered"
@@ -0,0 +1,17 @@
+import time
+
+
+def execute(context):
+    """Acknowledge the delivered command, wait past the timeout and poll again"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.ack_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/{context.command_id}/ack"
+    )
+    assert context.ack_response.status_code == 200
+    assert context.ack_response.json()["acknowledged"] is True
+    
+    time.sleep(context.visibility_timeout_seconds * 2)
+    context.redelivery_poll_response = context.test_client.get(context.poll_endpoint)
@@ -0,0 +1,11 @@
+import time
+
+
+def execute(context):
+    """Let the visibility timeout elapse without acknowledging, then poll again"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    time.sleep(context.visibility_timeout_seconds * 2)
+    context.redelivery_poll_response = context.test_client.get(context.poll_endpoint)
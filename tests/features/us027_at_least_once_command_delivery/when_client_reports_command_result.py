@@ -0,0 +1,21 @@
+import time
+
+
+def execute(context):
+    """Report the result through the unified result API, wait past the timeout and poll again"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.result_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/results",
+        json={
+            "command_id": context.command_id,
+            "execution_status": "completed",
+            "result_content": "at least once"
+        }
+    )
+    assert context.result_response.status_code == 200
+    
+    time.sleep(context.visibility_timeout_seconds * 2)
+    context.redelivery_poll_response = context.test_client.get(context.poll_endpoint)
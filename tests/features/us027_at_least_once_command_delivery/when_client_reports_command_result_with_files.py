@@ -0,0 +1,30 @@
+import base64
+import time
+
+
+def execute(context):
+    """Report the result through the result-with-files API, wait past the timeout and poll again"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.result_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/{context.command_id}/result-with-files",
+        json={
+            "command_id": context.command_id,
+            "execution_status": "completed",
+            "result_content": "at least once",
+            "result_files": [
+                {
+                    "file_name": "output.log",
+                    "file_content_base64": base64.b64encode(b"at least once").decode("ascii"),
+                    "content_type": "text/plain",
+                    "file_summary": "Command output"
+                }
+            ]
+        }
+    )
+    assert context.result_response.status_code == 200
+    
+    time.sleep(context.visibility_timeout_seconds * 2)
+    context.redelivery_poll_response = context.test_client.get(context.poll_endpoint)
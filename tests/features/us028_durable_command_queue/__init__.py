@@ -0,0 +1 @@
+# US-028: Durable Command Queue test package
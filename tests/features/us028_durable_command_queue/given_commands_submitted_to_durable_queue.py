@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+
+def execute(context):
+    """
+    Submit commands through a queue manager journaled to a temporary write-ahead log
+    """
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_client_presence_tracker, get_command_queue_manager
+    from public_tunnel.services.durable_command_queue_manager import DurableCommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-durable-queue"
+    context.target_client_id = "client-durable-queue"
+    context.write_ahead_log_path = os.path.join(tempfile.mkdtemp(), "command-queue.wal")
+    
+    context.queue_manager = DurableCommandQueueManager(log_path=context.write_ahead_log_path)
+    app.dependency_overrides[get_command_queue_manager] = lambda: context.queue_manager
+    
+    client_presence_tracker = get_client_presence_tracker()
+    client_presence_tracker.update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.submitted_command_ids = []
+    for index in range(5):
+        submit_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={
+                "command_content": f"echo 'durable {index}'",
+                "target_client_id": context.target_client_id
+            }
+        )
+        assert submit_response.status_code == 200
+        context.submitted_command_ids.append(submit_response.json()["command_id"])
+    
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
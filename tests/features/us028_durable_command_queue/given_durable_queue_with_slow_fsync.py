@@ -0,0 +1,30 @@
+import os
+import tempfile
+import time
+
+
+def execute(context):
+    """
+    Create a durable queue manager whose log writes take 50ms, counting write batches
+    """
+    from conftest import BDDPhase
+    from public_tunnel.services.durable_command_queue_manager import DurableCommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-durable-group-commit"
+    context.target_client_id = "client-durable-group-commit"
+    context.write_ahead_log_path = os.path.join(tempfile.mkdtemp(), "command-queue.wal")
+    context.fsync_seconds = 0.05
+    context.queue_manager = DurableCommandQueueManager(log_path=context.write_ahead_log_path)
+    
+    write_ahead_log = context.queue_manager._write_ahead_log
+    write_batch = write_ahead_log._write_batch
+    context.written_batch_sizes = []
+    
+    def slow_write_batch(lines):
+        time.sleep(context.fsync_seconds)
+        write_batch(lines)
+        context.written_batch_sizes.append(len(lines))
+    
+    write_ahead_log._write_batch = slow_write_batch
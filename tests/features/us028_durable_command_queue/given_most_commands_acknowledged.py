@@ -0,0 +1,20 @@
+def execute(context):
+    """Deliver and acknowledge all but the last two commands"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    acknowledged_count = len(context.submitted_command_ids) - 2
+    poll_response = context.test_client.get(
+        context.poll_endpoint,
+        params={"max_commands": acknowledged_count}
+    ).json()
+    
+    for command in poll_response["commands"]:
+        ack_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/clients/{context.target_client_id}"
+            f"/commands/{command['command_id']}/ack"
+        )
+        assert ack_response.status_code == 200
+    
+    context.unacknowledged_command_ids = context.submitted_command_ids[acknowledged_count:]
@@ -0,0 +1,10 @@
+def execute(context):
+    """Deliver the first command without acknowledging it"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    delivered_command = context.test_client.get(context.poll_endpoint).json()["command"]
+    assert delivered_command["command_id"] == context.submitted_command_ids[0]
+    
+    context.unacknowledged_command_ids = list(context.submitted_command_ids)
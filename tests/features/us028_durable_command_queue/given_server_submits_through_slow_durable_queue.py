@@ -0,0 +1,19 @@
+def execute(context):
+    """Serve submissions through the slow durable queue, with a long enough fsync to report a result inside it"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_client_presence_tracker, get_command_queue_manager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.fsync_seconds = 0.5
+    app.dependency_overrides[get_command_queue_manager] = lambda: context.queue_manager
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.submit_endpoint = f"/api/sessions/{context.session_id}/commands/submit"
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
+    context.results_endpoint = f"/api/sessions/{context.session_id}/results"
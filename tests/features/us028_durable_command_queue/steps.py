@@ -0,0 +1,75 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us028_durable_command_queue import given_commands_submitted_to_durable_queue
+from tests.features.us028_durable_command_queue import given_one_command_delivered_not_acknowledged
+from tests.features.us028_durable_command_queue import given_most_commands_acknowledged
+from tests.features.us028_durable_command_queue import when_server_restarts
+from tests.features.us028_durable_command_queue import when_log_compacted_and_server_restarts
+from tests.features.us028_durable_command_queue import then_unacknowledged_commands_delivered_again
+from tests.features.us028_durable_command_queue import then_only_unacknowledged_commands_restored
+from tests.features.us028_durable_command_queue import given_durable_queue_with_slow_fsync
+from tests.features.us028_durable_command_queue import when_submissions_wait_for_durability_concurrently
+from tests.features.us028_durable_command_queue import then_submissions_share_fsyncs_without_blocking_loop
+from tests.features.us028_durable_command_queue import then_confirmed_submissions_restored_without_shutdown
+from tests.features.us028_durable_command_queue import given_server_submits_through_slow_durable_queue
+from tests.features.us028_durable_command_queue import when_client_reports_result_while_submission_waits_for_durability
+from tests.features.us028_durable_command_queue import then_reported_result_survives_durability_wait
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('commands were submitted to a durable command queue')
+def step_given_commands_submitted_to_durable_queue(context):
+    return given_commands_submitted_to_durable_queue.execute(context)
+
+@given('one of them was delivered but not acknowledged')
+def step_given_one_command_delivered_not_acknowledged(context):
+    return given_one_command_delivered_not_acknowledged.execute(context)
+
+@given('most of them were acknowledged by the client')
+def step_given_most_commands_acknowledged(context):
+    return given_most_commands_acknowledged.execute(context)
+
+@when('the server restarts from the same write-ahead log')
+def step_when_server_restarts(context):
+    return when_server_restarts.execute(context)
+
+@when('the write-ahead log is compacted and the server restarts')
+def step_when_log_compacted_and_server_restarts(context):
+    return when_log_compacted_and_server_restarts.execute(context)
+
+@then('every unacknowledged command should be delivered again')
+def step_then_unacknowledged_commands_delivered_again(context):
+    return then_unacknowledged_commands_delivered_again.execute(context)
+
+@then('only the unacknowledged commands should be restored')
+def step_then_only_unacknowledged_commands_restored(context):
+    return then_only_unacknowledged_commands_restored.execute(context)
+
+@given('a durable command queue whose fsync is slow')
+def step_given_durable_queue_with_slow_fsync(context):
+    return given_durable_queue_with_slow_fsync.execute(context)
+
+@when('20 submissions wait for durability concurrently on one event loop')
+def step_when_submissions_wait_for_durability_concurrently(context):
+    return when_submissions_wait_for_durability_concurrently.execute(context)
+
+@then('the submissions should share a few fsyncs while the event loop stays responsive')
+def step_then_submissions_share_fsyncs_without_blocking_loop(context):
+    return then_submissions_share_fsyncs_without_blocking_loop.execute(context)
+
+@then('every confirmed submission should be restored without a clean shutdown')
+def step_then_confirmed_submissions_restored_without_shutdown(context):
+    return then_confirmed_submissions_restored_without_shutdown.execute(context)
+
+@given('the server submits commands through that queue')
+def step_given_server_submits_through_slow_durable_queue(context):
+    return given_server_submits_through_slow_durable_queue.execute(context)
+
+@when('the client reports the result while the submission still waits for durability')
+def step_when_client_reports_result_while_submission_waits_for_durability(context):
+    return when_client_reports_result_while_submission_waits_for_durability.execute(context)
+
+@then('the reported result should not be overwritten by a pending record')
+def step_then_reported_result_survives_durability_wait(context):
+    return then_reported_result_survives_durability_wait.execute(context)
@@ -0,0 +1,28 @@
+Feature: Durable Command Queue
+  As a server operator
+  I want queued commands to be journaled to a write-ahead log
+  So that a restart or deploy does not drop commands waiting for clients
+
+  Scenario: Queued commands survive a server restart
+    Given commands were submitted to a durable command queue
+    And one of them was delivered but not acknowledged
+    When the server restarts from the same write-ahead log
+    Then every unacknowledged command should be delivered again
+
+  Scenario: Compacted log keeps only live commands
+    Given commands were submitted to a durable command queue
+    And most of them were acknowledged by the client
+    When the write-ahead log is compacted and the server restarts
+    Then only the unacknowledged commands should be restored
+
+  Scenario: Concurrent submissions share fsyncs without blocking the event loop
+    Given a durable command queue whose fsync is slow
+    When 20 submissions wait for durability concurrently on one event loop
+    Then the submissions should share a few fsyncs while the event loop stays responsive
+    And every confirmed submission should be restored without a clean shutdown
+
+  Scenario: A result reported while the submission waits for durability is kept
+    Given a durable command queue whose fsync is slow
+    And the server submits commands through that queue
+    When the client reports the result while the submission still waits for durability
+    Then the reported result should not be overwritten by a pending record
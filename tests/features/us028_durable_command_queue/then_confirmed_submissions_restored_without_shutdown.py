@@ -0,0 +1,16 @@
+def execute(context):
+    """Rebuild a queue from the log while the original is still open, as after a crash"""
+    from conftest import BDDPhase
+    from public_tunnel.services.durable_command_queue_manager import DurableCommandQueueManager
+    
+    context.phase = BDDPhase.THEN
+    
+    recovered_queue_manager = DurableCommandQueueManager(log_path=context.write_ahead_log_path)
+    try:
+        recovered_commands, _ = recovered_queue_manager.get_next_commands_with_queue_info(
+            context.session_id, context.target_client_id, 100
+        )
+        assert sorted(command.command_id for command in recovered_commands) == sorted(context.confirmed_command_ids)
+    finally:
+        recovered_queue_manager.close()
+        context.queue_manager.close()
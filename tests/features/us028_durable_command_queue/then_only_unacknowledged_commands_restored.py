@@ -0,0 +1,19 @@
+import os
+
+
+def execute(context):
+    """Verify acknowledged commands are gone and the compacted log holds only live state"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.restart_poll_response.status_code == 200
+    restored_commands = context.restart_poll_response.json()["commands"]
+    
+    assert [command["command_id"] for command in restored_commands] == context.unacknowledged_command_ids
+    
+    with open(f"{context.write_ahead_log_path}.snapshot", "r", encoding="utf-8") as snapshot_file:
+        assert len(snapshot_file.readlines()) == len(context.unacknowledged_command_ids)
+    assert not os.path.exists(f"{context.write_ahead_log_path}.compacting")
+    
+    context.restarted_queue_manager.close()
@@ -0,0 +1,17 @@
+def execute(context):
+    """The result reported during the fsync wait is not overwritten by the submission's pending record"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    try:
+        assert len(context.delivered_commands) == 1
+        assert context.result_report_response.status_code == 200
+        assert context.submission_pending_when_reported
+        assert context.submit_response.status_code == 200
+        
+        result = context.result_query_response.json()
+        assert result["execution_status"] == "completed"
+        assert result["result_content"] == "reported early"
+    finally:
+        context.queue_manager.close()
@@ -0,0 +1,12 @@
+def execute(context):
+    """Verify the flusher batched the records and the loop never waited for an fsync"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert len(context.confirmed_command_ids) == 20
+    assert sum(context.written_batch_sizes) >= 20
+    assert len(context.written_batch_sizes) <= 5, \
+        f"Expected group commit, got {len(context.written_batch_sizes)} write batches"
+    assert context.max_event_loop_lag_seconds < context.fsync_seconds, \
+        f"Event loop stalled for {context.max_event_loop_lag_seconds * 1000:.0f}ms"
@@ -0,0 +1,15 @@
+def execute(context):
+    """Verify the restarted queue delivers every unacknowledged command, delivered one first"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.restart_poll_response.status_code == 200
+    restored_commands = context.restart_poll_response.json()["commands"]
+    
+    assert [command["command_id"] for command in restored_commands] == context.unacknowledged_command_ids
+    # The command delivered before the restart keeps its delivery history
+    assert restored_commands[0]["delivery_count"] == 2
+    assert all(command["delivery_count"] == 1 for command in restored_commands[1:])
+    
+    context.restarted_queue_manager.close()
@@ -0,0 +1,41 @@
+import threading
+import time
+
+
+def execute(context):
+    """Submit over HTTP in the background; the client polls and reports the result before the fsync finishes"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    submit_responses = []
+    submission = threading.Thread(
+        target=lambda: submit_responses.append(context.test_client.post(
+            context.submit_endpoint,
+            json={"command_content": "echo 'reported early'", "target_client_id": context.target_client_id}
+        ))
+    )
+    submission.start()
+    
+    delivered_commands = []
+    deadline = time.monotonic() + context.fsync_seconds
+    while not delivered_commands and time.monotonic() < deadline:
+        delivered_commands = context.test_client.get(context.poll_endpoint).json()["commands"]
+    context.delivered_commands = delivered_commands
+    
+    if delivered_commands:
+        context.result_report_response = context.test_client.post(
+            context.results_endpoint,
+            json={
+                "command_id": delivered_commands[0]["command_id"],
+                "execution_status": "completed",
+                "result_content": "reported early"
+            }
+        )
+        context.submission_pending_when_reported = submission.is_alive()
+    
+    submission.join()
+    context.submit_response = submit_responses[0]
+    context.result_query_response = context.test_client.get(
+        f"{context.results_endpoint}/{context.submit_response.json()['command_id']}"
+    )
@@ -0,0 +1,19 @@
+def execute(context):
+    """Compact the write-ahead log, then rebuild a queue manager from it"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_command_queue_manager
+    from public_tunnel.services.durable_command_queue_manager import DurableCommandQueueManager
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.queue_manager.compact()
+    context.queue_manager.close()
+    
+    context.restarted_queue_manager = DurableCommandQueueManager(log_path=context.write_ahead_log_path)
+    app.dependency_overrides[get_command_queue_manager] = lambda: context.restarted_queue_manager
+    
+    context.restart_poll_response = context.test_client.get(
+        context.poll_endpoint,
+        params={"max_commands": 10}
+    )
@@ -0,0 +1,32 @@
+import asyncio
+
+
+def execute(context):
+    """Submit 20 commands from concurrent tasks that each await durability, probing event loop lag"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    async def submit_durably(index):
+        command = context.queue_manager.submit_command_to_target_client(
+            context.session_id, context.target_client_id, f"echo 'group commit {index}'"
+        )
+        await context.queue_manager.wait_until_durable([command])
+        return command.command_id
+    
+    async def probe_event_loop_lag(lag_samples):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected_at = loop.time() + 0.005
+            await asyncio.sleep(0.005)
+            lag_samples.append(loop.time() - expected_at)
+    
+    async def submit_concurrently():
+        lag_samples = []
+        probe = asyncio.create_task(probe_event_loop_lag(lag_samples))
+        await asyncio.sleep(0.01)
+        confirmed_command_ids = await asyncio.gather(*(submit_durably(index) for index in range(20)))
+        probe.cancel()
+        return confirmed_command_ids, max(lag_samples)
+    
+    context.confirmed_command_ids, context.max_event_loop_lag_seconds = asyncio.run(submit_concurrently())
@@ -0,0 +1 @@
+# US-029: Queue Depth Limits with Backpressure test package
@@ -0,0 +1,18 @@
+def execute(context):
+    """Fill the client queue up to its limit"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    for index in range(context.max_commands_per_client):
+        submit_response = context.test_client.post(
+            context.submit_endpoint,
+            json={"command_content": f"echo 'fill {index}'", "target_client_id": context.target_client_id}
+        )
+        assert submit_response.status_code == 200
+    
+    overflow_response = context.test_client.post(
+        context.submit_endpoint,
+        json={"command_content": "echo 'overflow'", "target_client_id": context.target_client_id}
+    )
+    assert overflow_response.status_code == 429
@@ -0,0 +1,23 @@
+def execute(context):
+    """Register a client with a queue manager limited to 2 queued commands per client"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_client_presence_tracker, get_command_queue_manager
+    from public_tunnel.services.command_queue_manager import InMemoryCommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-backpressure"
+    context.target_client_id = "client-backpressure"
+    context.max_commands_per_client = 2
+    
+    queue_manager = InMemoryCommandQueueManager(max_commands_per_client=context.max_commands_per_client)
+    app.dependency_overrides[get_command_queue_manager] = lambda: queue_manager
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.submit_endpoint = f"/api/sessions/{context.session_id}/commands/submit"
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
@@ -0,0 +1,19 @@
+def execute(context):
+    """Register two clients behind a byte budget that fits exactly one broadcast command"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_client_presence_tracker, get_command_queue_manager
+    from public_tunnel.services.command_queue_manager import InMemoryCommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = "test-session-byte-budget"
+    context.client_ids = ["client-byte-budget-1", "client-byte-budget-2"]
+    context.broadcast_command_content = "echo 'byte budget'"
+    
+    queue_manager = InMemoryCommandQueueManager(max_queued_bytes=len(context.broadcast_command_content))
+    app.dependency_overrides[get_command_queue_manager] = lambda: queue_manager
+    
+    client_presence_tracker = get_client_presence_tracker()
+    for client_id in context.client_ids:
+        client_presence_tracker.update_client_last_seen(client_id=client_id, session_id=context.session_id)
@@ -0,0 +1,55 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us029_queue_depth_backpressure import given_client_queue_limited
+from tests.features.us029_queue_depth_backpressure import given_client_queue_full
+from tests.features.us029_queue_depth_backpressure import given_clients_sharing_byte_budget
+from tests.features.us029_queue_depth_backpressure import when_commands_submitted_over_limit
+from tests.features.us029_queue_depth_backpressure import when_client_drains_queue_and_command_submitted
+from tests.features.us029_queue_depth_backpressure import when_command_broadcast_to_clients
+from tests.features.us029_queue_depth_backpressure import then_submissions_report_queue_depth
+from tests.features.us029_queue_depth_backpressure import then_third_submission_rejected_with_retry_after
+from tests.features.us029_queue_depth_backpressure import then_new_submission_accepted
+from tests.features.us029_queue_depth_backpressure import then_one_command_rejected_as_queue_full
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a client whose command queue is limited to 2 commands')
+def step_given_client_queue_limited(context):
+    return given_client_queue_limited.execute(context)
+
+@given('the client queue is full')
+def step_given_client_queue_full(context):
+    return given_client_queue_full.execute(context)
+
+@given('two clients sharing a queue byte budget for one command')
+def step_given_clients_sharing_byte_budget(context):
+    return given_clients_sharing_byte_budget.execute(context)
+
+@when('3 commands are submitted to the client')
+def step_when_commands_submitted_over_limit(context):
+    return when_commands_submitted_over_limit.execute(context)
+
+@when('the client drains its queue and a command is submitted again')
+def step_when_client_drains_queue_and_command_submitted(context):
+    return when_client_drains_queue_and_command_submitted.execute(context)
+
+@when('a command is broadcast to both clients')
+def step_when_command_broadcast_to_clients(context):
+    return when_command_broadcast_to_clients.execute(context)
+
+@then('the first 2 submissions should report the growing queue depth')
+def step_then_submissions_report_queue_depth(context):
+    return then_submissions_report_queue_depth.execute(context)
+
+@then('the third submission should be rejected with 429 and a Retry-After header')
+def step_then_third_submission_rejected_with_retry_after(context):
+    return then_third_submission_rejected_with_retry_after.execute(context)
+
+@then('the new submission should be accepted')
+def step_then_new_submission_accepted(context):
+    return then_new_submission_accepted.execute(context)
+
+@then('one command should be submitted and one rejected as QUEUE_FULL')
+def step_then_one_command_rejected_as_queue_full(context):
+    return then_one_command_rejected_as_queue_full.execute(context)
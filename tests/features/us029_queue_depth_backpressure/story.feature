@@ -0,0 +1,21 @@
+Feature: Queue Depth Limits with Backpressure
+  As a server operator
+  I want command queues to be bounded
+  So that a runaway submitter cannot exhaust server memory
+
+  Scenario: Submission over the client queue limit is rejected with Retry-After
+    Given a client whose command queue is limited to 2 commands
+    When 3 commands are submitted to the client
+    Then the first 2 submissions should report the growing queue depth
+    And the third submission should be rejected with 429 and a Retry-After header
+
+  Scenario: Draining the client queue makes room for new commands
+    Given a client whose command queue is limited to 2 commands
+    And the client queue is full
+    When the client drains its queue and a command is submitted again
+    Then the new submission should be accepted
+
+  Scenario: Bulk submission over the byte budget rejects only the overflowing targets
+    Given two clients sharing a queue byte budget for one command
+    When a command is broadcast to both clients
+    Then one command should be submitted and one rejected as QUEUE_FULL
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the drained queue accepts commands again"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert len(context.drain_response.json()["commands"]) == context.max_commands_per_client
+    assert context.resubmit_response.status_code == 200
+    assert context.resubmit_response.json()["queue_depth"] == 1
@@ -0,0 +1,16 @@
+def execute(context):
+    """Verify the byte budget admitted one broadcast command and rejected the other"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.bulk_response.status_code == 200
+    bulk_result = context.bulk_response.json()
+    
+    assert bulk_result["total_submitted"] == 1
+    assert bulk_result["total_rejected"] == 1
+    
+    rejection = bulk_result["rejected_commands"][0]
+    assert rejection["error_code"] == "QUEUE_FULL"
+    assert rejection["retry_after_seconds"] >= 1
+    assert {rejection["target_client_id"], bulk_result["submitted_commands"][0]["target_client_id"]} == set(context.client_ids)
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify accepted submissions report the client queue depth after enqueueing"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    accepted_responses = context.submit_responses[:context.max_commands_per_client]
+    assert [response.status_code for response in accepted_responses] == [200, 200]
+    assert [response.json()["queue_depth"] for response in accepted_responses] == [1, 2]
@@ -0,0 +1,13 @@
+def execute(context):
+    """Verify the overflowing submission is rejected with backpressure information"""
+    from conftest import BDDPhase
+    from public_tunnel.services.command_queue_manager import MAX_RETRY_AFTER_SECONDS
+    
+    context.phase = BDDPhase.THEN
+    
+    rejected_response = context.submit_responses[-1]
+    assert rejected_response.status_code == 429
+    assert "max_commands_per_client" in rejected_response.json()["detail"]
+    
+    # Nothing was drained yet, so the longest retry delay is suggested
+    assert rejected_response.headers["Retry-After"] == str(MAX_RETRY_AFTER_SECONDS)
@@ -0,0 +1,14 @@
+def execute(context):
+    """Let the client take its queued commands, then submit a new command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.drain_response = context.test_client.get(
+        context.poll_endpoint,
+        params={"max_commands": context.max_commands_per_client}
+    )
+    context.resubmit_response = context.test_client.post(
+        context.submit_endpoint,
+        json={"command_content": "echo 'after drain'", "target_client_id": context.target_client_id}
+    )
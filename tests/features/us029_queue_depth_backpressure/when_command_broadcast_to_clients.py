@@ -0,0 +1,10 @@
+def execute(context):
+    """Broadcast one command to every online client of the session"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.bulk_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit-bulk",
+        json={"broadcast_command_content": context.broadcast_command_content}
+    )
@@ -0,0 +1,13 @@
+def execute(context):
+    """Submit one command more than the client queue limit allows"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.submit_responses = [
+        context.test_client.post(
+            context.submit_endpoint,
+            json={"command_content": f"echo 'runaway {index}'", "target_client_id": context.target_client_id}
+        )
+        for index in range(context.max_commands_per_client + 1)
+    ]
@@ -0,0 +1 @@
+# US-030: Command Timeout Expiry test package
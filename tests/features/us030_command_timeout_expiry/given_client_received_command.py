@@ -0,0 +1,8 @@
+def execute(context):
+    """Deliver the command to the client without a result yet"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    delivered_command = context.test_client.get(context.poll_endpoint).json()["command"]
+    assert delivered_command["command_id"] == context.command_id
@@ -0,0 +1,15 @@
+def execute(context):
+    """Report a completed result before the deadline"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    result_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/results",
+        json={
+            "command_id": context.command_id,
+            "execution_status": "completed",
+            "result_content": "finished in time"
+        }
+    )
+    assert result_response.status_code == 200
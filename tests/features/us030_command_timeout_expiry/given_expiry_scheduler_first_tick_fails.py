@@ -0,0 +1,30 @@
+def execute(context):
+    """Serve submissions with an expiry scheduler whose first tick raises"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import (
+        get_command_expiry_scheduler,
+        get_command_queue_manager,
+        get_execution_result_manager
+    )
+    from public_tunnel.services.command_expiry_scheduler import CommandExpiryScheduler
+    
+    context.phase = BDDPhase.GIVEN
+    
+    class FirstTickFailsCommandExpiryScheduler(CommandExpiryScheduler):
+        """Raises from the first expire_due_commands call, as a transient bug would"""
+        
+        def __init__(self, command_queue_manager, execution_result_manager):
+            super().__init__(command_queue_manager, execution_result_manager)
+            self.expiry_passes = 0
+        
+        def expire_due_commands(self, now=None):
+            self.expiry_passes += 1
+            if self.expiry_passes == 1:
+                raise RuntimeError("injected expiry tick failure")
+            return super().expire_due_commands(now)
+    
+    context.expiry_scheduler = FirstTickFailsCommandExpiryScheduler(
+        get_command_queue_manager(), get_execution_result_manager()
+    )
+    app.dependency_overrides[get_command_expiry_scheduler] = lambda: context.expiry_scheduler
@@ -0,0 +1,65 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us030_command_timeout_expiry import given_command_submitted_with_timeout
+from tests.features.us030_command_timeout_expiry import given_client_received_command
+from tests.features.us030_command_timeout_expiry import given_client_reported_command_result
+from tests.features.us030_command_timeout_expiry import when_expiry_scheduler_runs_after_deadline
+from tests.features.us030_command_timeout_expiry import when_server_runs_past_deadline
+from tests.features.us030_command_timeout_expiry import then_command_no_longer_delivered
+from tests.features.us030_command_timeout_expiry import then_command_result_failed_with_timeout
+from tests.features.us030_command_timeout_expiry import then_command_no_longer_in_flight
+from tests.features.us030_command_timeout_expiry import then_command_result_still_completed
+from tests.features.us030_command_timeout_expiry import given_expiry_scheduler_first_tick_fails
+from tests.features.us030_command_timeout_expiry import when_expiry_scheduler_loop_runs_past_deadline
+from tests.features.us030_command_timeout_expiry import then_failing_tick_logged_and_loop_kept_running
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command was submitted with a timeout to a client')
+def step_given_command_submitted_with_timeout(context):
+    return given_command_submitted_with_timeout.execute(context)
+
+@given('the client received the command')
+def step_given_client_received_command(context):
+    return given_client_received_command.execute(context)
+
+@given('the client reported the command result')
+def step_given_client_reported_command_result(context):
+    return given_client_reported_command_result.execute(context)
+
+@when('the expiry scheduler runs after the deadline')
+def step_when_expiry_scheduler_runs_after_deadline(context):
+    return when_expiry_scheduler_runs_after_deadline.execute(context)
+
+@when('the server runs past the command deadline')
+def step_when_server_runs_past_deadline(context):
+    return when_server_runs_past_deadline.execute(context)
+
+@then('the command should no longer be delivered')
+def step_then_command_no_longer_delivered(context):
+    return then_command_no_longer_delivered.execute(context)
+
+@then('the command result should be failed with a timeout error')
+def step_then_command_result_failed_with_timeout(context):
+    return then_command_result_failed_with_timeout.execute(context)
+
+@then('the command should no longer be in flight')
+def step_then_command_no_longer_in_flight(context):
+    return then_command_no_longer_in_flight.execute(context)
+
+@then('the command result should still be completed')
+def step_then_command_result_still_completed(context):
+    return then_command_result_still_completed.execute(context)
+
+@given("the expiry scheduler's first tick will fail")
+def step_given_expiry_scheduler_first_tick_fails(context):
+    return given_expiry_scheduler_first_tick_fails.execute(context)
+
+@when('the expiry scheduler loop runs past the command deadline')
+def step_when_expiry_scheduler_loop_runs_past_deadline(context):
+    return when_expiry_scheduler_loop_runs_past_deadline.execute(context)
+
+@then('the failing tick should be logged and the loop should keep running')
+def step_then_failing_tick_logged_and_loop_kept_running(context):
+    return then_failing_tick_logged_and_loop_kept_running.execute(context)
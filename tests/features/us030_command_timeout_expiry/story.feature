@@ -0,0 +1,36 @@
+Feature: Command Timeout Expiry
+  As an AI assistant
+  I want commands submitted with timeout_seconds to expire
+  So that commands for unresponsive clients fail instead of waiting forever
+
+  Scenario: Queued command that times out is purged and its result fails
+    Given a command was submitted with a timeout to a client
+    When the expiry scheduler runs after the deadline
+    Then the command should no longer be delivered
+    And the command result should be failed with a timeout error
+
+  Scenario: Delivered command that does not finish in time fails
+    Given a command was submitted with a timeout to a client
+    And the client received the command
+    When the expiry scheduler runs after the deadline
+    Then the command result should be failed with a timeout error
+    And the command should no longer be in flight
+
+  Scenario: Command completed in time is not marked as timed out
+    Given a command was submitted with a timeout to a client
+    And the client received the command
+    And the client reported the command result
+    When the expiry scheduler runs after the deadline
+    Then the command result should still be completed
+
+  Scenario: Background scheduler expires commands while the server runs
+    Given a command was submitted with a timeout to a client
+    When the server runs past the command deadline
+    Then the command result should be failed with a timeout error
+
+  Scenario: A failing scheduler tick does not stop the background loop
+    Given the expiry scheduler's first tick will fail
+    And a command was submitted with a timeout to a client
+    When the expiry scheduler loop runs past the command deadline
+    Then the failing tick should be logged and the loop should keep running
+    And the command result should be failed with a timeout error
@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the expired command was purged from the client queue"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.command_id in context.timed_out_command_ids
+    
+    poll_result = context.poll_response.json()
+    assert poll_result["command"] is None, "Expired command must not be delivered"
+    assert poll_result["total_queue_size"] == 0
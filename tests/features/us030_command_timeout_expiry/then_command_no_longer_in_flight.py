@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify the delivery lease of the expired command was dropped"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_command_queue_manager
+    
+    context.phase = BDDPhase.THEN
+    
+    assert get_command_queue_manager().get_in_flight_command_count(context.session_id) == 0
@@ -0,0 +1,12 @@
+def execute(context):
+    """Verify the command result was flipped to failed with a timeout error"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.result_response.status_code == 200
+    result = context.result_response.json()
+    
+    assert result["execution_status"] == "failed"
+    assert result["error_message"] == f"Command timed out after {context.timeout_seconds} seconds"
+    assert result["completed_at"] is not None
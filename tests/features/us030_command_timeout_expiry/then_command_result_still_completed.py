@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify a result reported before the deadline is not overwritten"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.command_id not in context.timed_out_command_ids
+    
+    result = context.result_response.json()
+    assert result["execution_status"] == "completed"
+    assert result["result_content"] == "finished in time"
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the failing tick was logged with its traceback and did not end the loop"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.scheduler_still_running
+    assert len(context.logged_records) == 1
+    assert context.logged_records[0].exc_info[1].args == ("injected expiry tick failure",)
@@ -0,0 +1,29 @@
+import asyncio
+import logging
+
+
+def execute(context):
+    """Run the scheduler's background loop past the command deadline, capturing what it logs"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    logged_records = []
+    log_handler = logging.Handler(level=logging.ERROR)
+    log_handler.emit = logged_records.append
+    scheduler_logger = logging.getLogger("public_tunnel.services.command_expiry_scheduler")
+    scheduler_logger.addHandler(log_handler)
+    
+    async def run_scheduler_past_deadline():
+        scheduler_task = asyncio.create_task(context.expiry_scheduler.run())
+        await asyncio.sleep(context.timeout_seconds + 1.5)
+        context.scheduler_still_running = not scheduler_task.done()
+        scheduler_task.cancel()
+    
+    try:
+        asyncio.run(run_scheduler_past_deadline())
+    finally:
+        scheduler_logger.removeHandler(log_handler)
+    
+    context.logged_records = logged_records
+    context.result_response = context.test_client.get(context.result_endpoint)
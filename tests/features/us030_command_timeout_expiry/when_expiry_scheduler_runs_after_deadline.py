@@ -0,0 +1,15 @@
+import time
+
+
+def execute(context):
+    """Run one scheduler tick as if the deadline had already passed"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_command_expiry_scheduler
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.timed_out_command_ids = get_command_expiry_scheduler().expire_due_commands(
+        now=time.time() + context.timeout_seconds + 1
+    )
+    context.poll_response = context.test_client.get(context.poll_endpoint)
+    context.result_response = context.test_client.get(context.result_endpoint)
@@ -0,0 +1,15 @@
+import time
+
+from fastapi.testclient import TestClient
+
+
+def execute(context):
+    """Start the app with its lifespan so the background scheduler runs, then wait past the deadline"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    
+    context.phase = BDDPhase.WHEN
+    
+    with TestClient(app) as running_server_client:
+        time.sleep(context.timeout_seconds + 1)
+        context.result_response = running_server_client.get(context.result_endpoint)
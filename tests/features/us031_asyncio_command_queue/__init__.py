@@ -0,0 +1 @@
+# US-031: Asyncio-native Command Queue test package
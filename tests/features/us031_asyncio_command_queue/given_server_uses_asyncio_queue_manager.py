@@ -0,0 +1,26 @@
+import uuid
+
+
+def execute(context):
+    """Override the queue manager with the asyncio-native implementation and register a client"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_client_presence_tracker, get_command_queue_manager
+    from public_tunnel.services.asyncio_command_queue_manager import AsyncioCommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = f"test-session-asyncio-queue-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-asyncio-queue"
+    context.wait_seconds = 5
+    
+    queue_manager = AsyncioCommandQueueManager()
+    app.dependency_overrides[get_command_queue_manager] = lambda: queue_manager
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
+    context.submit_endpoint = f"/api/sessions/{context.session_id}/commands/submit"
@@ -0,0 +1,40 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us031_asyncio_command_queue import given_server_uses_asyncio_queue_manager
+from tests.features.us031_asyncio_command_queue import when_client_long_polls_and_command_submitted
+from tests.features.us031_asyncio_command_queue import when_concurrent_polls_wait_and_commands_submitted
+from tests.features.us031_asyncio_command_queue import then_waiting_poll_receives_command_early
+from tests.features.us031_asyncio_command_queue import then_every_poll_receives_different_command
+from tests.features.us031_asyncio_command_queue import when_first_waiter_cancelled_as_command_submitted
+from tests.features.us031_asyncio_command_queue import then_second_waiter_woken_for_command
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('the server uses the asyncio-native command queue manager')
+def step_given_server_uses_asyncio_queue_manager(context):
+    return given_server_uses_asyncio_queue_manager.execute(context)
+
+@when('a client long-polls and a command is submitted while it waits')
+def step_when_client_long_polls_and_command_submitted(context):
+    return when_client_long_polls_and_command_submitted.execute(context)
+
+@when('3 polls of the same client wait and 3 commands are submitted')
+def step_when_concurrent_polls_wait_and_commands_submitted(context):
+    return when_concurrent_polls_wait_and_commands_submitted.execute(context)
+
+@then('the waiting poll should receive the command well before the wait elapses')
+def step_then_waiting_poll_receives_command_early(context):
+    return then_waiting_poll_receives_command_early.execute(context)
+
+@then('every poll should receive a different command')
+def step_then_every_poll_receives_different_command(context):
+    return then_every_poll_receives_different_command.execute(context)
+
+@when('the first of two waiting polls is cancelled as a command is submitted')
+def step_when_first_waiter_cancelled_as_command_submitted(context):
+    return when_first_waiter_cancelled_as_command_submitted.execute(context)
+
+@then('the second waiting poll should be woken for the command')
+def step_then_second_waiter_woken_for_command(context):
+    return then_second_waiter_woken_for_command.execute(context)
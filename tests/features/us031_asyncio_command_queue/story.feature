@@ -0,0 +1,19 @@
+Feature: Asyncio-native Command Queue
+  As a server operator
+  I want a command queue manager that never blocks the event loop
+  So that lock contention cannot stall every request of the server
+
+  Scenario: Waiting poll is woken by a submitted command
+    Given the server uses the asyncio-native command queue manager
+    When a client long-polls and a command is submitted while it waits
+    Then the waiting poll should receive the command well before the wait elapses
+
+  Scenario: Each submitted command wakes exactly one waiting poll
+    Given the server uses the asyncio-native command queue manager
+    When 3 polls of the same client wait and 3 commands are submitted
+    Then every poll should receive a different command
+
+  Scenario: Wake-up consumed by a cancelled waiter is passed on
+    Given the server uses the asyncio-native command queue manager
+    When the first of two waiting polls is cancelled as a command is submitted
+    Then the second waiting poll should be woken for the command
@@ -0,0 +1,14 @@
+def execute(context):
+    """Verify the 3 commands were spread over the 3 waiting polls"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    delivered_command_ids = []
+    for poll_response in context.poll_responses:
+        assert poll_response is not None and poll_response.status_code == 200
+        delivered_command = poll_response.json()["command"]
+        assert delivered_command is not None, "Every waiting poll should be woken with a command"
+        delivered_command_ids.append(delivered_command["command_id"])
+    
+    assert sorted(delivered_command_ids) == sorted(context.submitted_command_ids)
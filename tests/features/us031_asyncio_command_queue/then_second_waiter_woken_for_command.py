@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the second waiter got the wake-up instead of running out its wait"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.second_wait_outcome is True
+    assert context.delivery_delay_seconds < context.wait_seconds / 2, \
+        f"Second waiter woke after {context.delivery_delay_seconds:.2f}s, expected the wake-up to be passed on"
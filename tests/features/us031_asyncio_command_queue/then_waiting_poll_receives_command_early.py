@@ -0,0 +1,14 @@
+def execute(context):
+    """Verify the parked poll was woken by the submission instead of timing out"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.poll_response.status_code == 200
+    delivered_command = context.poll_response.json()["command"]
+    
+    assert delivered_command is not None
+    assert delivered_command["command_id"] == context.submitted_command_id
+    assert context.delivery_delay_seconds < 1.0, (
+        f"Poll should be woken right after submission, took {context.delivery_delay_seconds:.2f}s"
+    )
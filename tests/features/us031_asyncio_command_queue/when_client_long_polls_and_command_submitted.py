@@ -0,0 +1,44 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+
+def execute(context):
+    """
+    Long-poll in a background thread and submit a command while it waits
+    
+    Requests go through one running TestClient, so every request is served
+    by the same event loop as in a uvicorn worker.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    
+    context.phase = BDDPhase.WHEN
+    
+    poll_outcome = {}
+    
+    with TestClient(app) as running_server_client:
+        def long_poll():
+            poll_outcome["response"] = running_server_client.get(
+                context.poll_endpoint,
+                params={"wait_seconds": context.wait_seconds}
+            )
+            poll_outcome["returned_at"] = time.monotonic()
+        
+        poll_thread = threading.Thread(target=long_poll)
+        poll_thread.start()
+        
+        # Give the poll request time to park on the empty queue
+        time.sleep(0.3)
+        
+        submitted_at = time.monotonic()
+        submit_response = running_server_client.post(
+            context.submit_endpoint,
+            json={"command_content": "echo 'asyncio'", "target_client_id": context.target_client_id}
+        )
+        poll_thread.join(timeout=context.wait_seconds + 5)
+    
+    context.submitted_command_id = submit_response.json()["command_id"]
+    context.poll_response = poll_outcome["response"]
+    context.delivery_delay_seconds = poll_outcome["returned_at"] - submitted_at
@@ -0,0 +1,42 @@
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+
+def execute(context):
+    """Park 3 long-polls of one client, then submit 3 commands"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    
+    context.phase = BDDPhase.WHEN
+    
+    poll_count = 3
+    poll_responses = [None] * poll_count
+    
+    with TestClient(app) as running_server_client:
+        def long_poll(poll_index):
+            poll_responses[poll_index] = running_server_client.get(
+                context.poll_endpoint,
+                params={"wait_seconds": context.wait_seconds}
+            )
+        
+        poll_threads = [threading.Thread(target=long_poll, args=(index,)) for index in range(poll_count)]
+        for poll_thread in poll_threads:
+            poll_thread.start()
+        
+        time.sleep(0.3)
+        
+        submitted_command_ids = []
+        for index in range(poll_count):
+            submit_response = running_server_client.post(
+                context.submit_endpoint,
+                json={"command_content": f"echo 'asyncio {index}'", "target_client_id": context.target_client_id}
+            )
+            submitted_command_ids.append(submit_response.json()["command_id"])
+        
+        for poll_thread in poll_threads:
+            poll_thread.join(timeout=context.wait_seconds + 5)
+    
+    context.submitted_command_ids = submitted_command_ids
+    context.poll_responses = poll_responses
@@ -0,0 +1,37 @@
+import asyncio
+
+
+def execute(context):
+    """
+    Park two waiters, then cancel the first one in the same loop iteration its notification runs in
+    
+    The cancellation is processed just before the notification task wakes the
+    first waiter, so that waiter consumes the notify and is then cancelled,
+    the way a timeout or a client disconnect races a submission.
+    """
+    from conftest import BDDPhase
+    from public_tunnel.services.asyncio_command_queue_manager import AsyncioCommandQueueManager
+    
+    context.phase = BDDPhase.WHEN
+    
+    queue_manager = AsyncioCommandQueueManager()
+    
+    async def race_cancellation_with_submission():
+        first_wait = asyncio.create_task(
+            queue_manager.wait_for_command(context.session_id, context.target_client_id, context.wait_seconds)
+        )
+        second_wait = asyncio.create_task(
+            queue_manager.wait_for_command(context.session_id, context.target_client_id, context.wait_seconds)
+        )
+        await asyncio.sleep(0.05)
+        
+        asyncio.get_running_loop().call_soon(first_wait.cancel)
+        queue_manager.submit_command_to_target_client(
+            context.session_id, context.target_client_id, "echo 'handed on'"
+        )
+        
+        started_at = asyncio.get_running_loop().time()
+        second_wait_outcome = await asyncio.wait_for(second_wait, timeout=context.wait_seconds + 1)
+        return second_wait_outcome, asyncio.get_running_loop().time() - started_at
+    
+    context.second_wait_outcome, context.delivery_delay_seconds = asyncio.run(race_cancellation_with_submission())
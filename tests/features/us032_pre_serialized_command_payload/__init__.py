@@ -0,0 +1 @@
+# US-032: Pre-serialized Command Payload test package
@@ -0,0 +1,29 @@
+import uuid
+
+
+def execute(context):
+    """Submit a command whose content needs JSON escaping and UTF-8 encoding"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-payload-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-payload"
+    context.command_content = 'echo "部署完成 ✓" \\ done\n'
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit",
+        json={
+            "command_content": context.command_content,
+            "target_client_id": context.target_client_id
+        }
+    )
+    assert submit_response.status_code == 200
+    context.command_id = submit_response.json()["command_id"]
@@ -0,0 +1,30 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us032_pre_serialized_command_payload import given_command_with_special_content_submitted
+from tests.features.us032_pre_serialized_command_payload import when_client_polls_for_commands
+from tests.features.us032_pre_serialized_command_payload import when_client_retrieves_single_command
+from tests.features.us032_pre_serialized_command_payload import then_response_validates_as_response_model
+from tests.features.us032_pre_serialized_command_payload import then_delivered_command_carries_submitted_fields
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command with quotes and non-ASCII content is submitted to a client')
+def step_given_command_with_special_content_submitted(context):
+    return given_command_with_special_content_submitted.execute(context)
+
+@when('the client polls for its commands')
+def step_when_client_polls_for_commands(context):
+    return when_client_polls_for_commands.execute(context)
+
+@when('the client retrieves a single command')
+def step_when_client_retrieves_single_command(context):
+    return when_client_retrieves_single_command.execute(context)
+
+@then('the response should validate as the declared response model')
+def step_then_response_validates_as_response_model(context):
+    return then_response_validates_as_response_model.execute(context)
+
+@then('the delivered command should carry the submitted fields')
+def step_then_delivered_command_carries_submitted_fields(context):
+    return then_delivered_command_carries_submitted_fields.execute(context)
@@ -0,0 +1,16 @@
+Feature: Pre-serialized Command Payload
+  As a server operator
+  I want command payloads serialized once when they are submitted
+  So that every poll writes cached bytes instead of re-serializing the command
+
+  Scenario: Polled command payload matches the submitted command
+    Given a command with quotes and non-ASCII content is submitted to a client
+    When the client polls for its commands
+    Then the response should validate as the declared response model
+    And the delivered command should carry the submitted fields
+
+  Scenario: Retrieved command payload matches the submitted command
+    Given a command with quotes and non-ASCII content is submitted to a client
+    When the client retrieves a single command
+    Then the response should validate as the declared response model
+    And the delivered command should carry the submitted fields
@@ -0,0 +1,19 @@
+def execute(context):
+    """Verify the cached payload carries the submitted command unchanged"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    response_data = context.response.json()
+    assert response_data["session_id"] == context.session_id
+    assert response_data["client_id"] == context.target_client_id
+    assert response_data["commands"] == [response_data["command"]]
+    
+    assert response_data["command"] == {
+        "command_id": context.command_id,
+        "content": context.command_content,
+        "target_client": context.target_client_id,
+        "session_id": context.session_id,
+        "priority": "normal",
+        "delivery_count": 1
+    }
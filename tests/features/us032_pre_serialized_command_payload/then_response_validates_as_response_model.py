@@ -0,0 +1,12 @@
+def execute(context):
+    """Verify the hand-written response bytes are what the declared response model produces"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.response.status_code == 200
+    assert context.response.headers["content-type"] == "application/json"
+    
+    response_data = context.response.json()
+    validated_response = context.response_model(**response_data)
+    assert validated_response.model_dump() == response_data, "Payload must round-trip through the response model"
@@ -0,0 +1,11 @@
+def execute(context):
+    """Poll the client's FIFO command queue"""
+    from conftest import BDDPhase
+    from public_tunnel.models.session import FIFOCommandPollingResponse
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
+    )
+    context.response_model = FIFOCommandPollingResponse
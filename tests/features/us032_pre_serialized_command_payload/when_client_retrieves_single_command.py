@@ -0,0 +1,11 @@
+def execute(context):
+    """Retrieve a single command for execution pace control"""
+    from conftest import BDDPhase
+    from public_tunnel.models.command import ClientCommandRetrievalResponse
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/command"
+    )
+    context.response_model = ClientCommandRetrievalResponse
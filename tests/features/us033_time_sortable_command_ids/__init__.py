@@ -0,0 +1 @@
+# US-033: Time-sortable Command IDs test package
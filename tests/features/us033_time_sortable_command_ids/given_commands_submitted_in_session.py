@@ -0,0 +1,30 @@
+import uuid
+
+
+def execute(context):
+    """Submit 5 commands to one client, in order"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-sortable-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-sortable"
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.submitted_command_ids = []
+    for command_index in range(5):
+        submit_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={
+                "command_content": f"echo {command_index}",
+                "target_client_id": context.target_client_id
+            }
+        )
+        assert submit_response.status_code == 200
+        context.submitted_command_ids.append(submit_response.json()["command_id"])
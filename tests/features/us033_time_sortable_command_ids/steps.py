@@ -0,0 +1,30 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us033_time_sortable_command_ids import given_commands_submitted_in_session
+from tests.features.us033_time_sortable_command_ids import when_query_history_since_second_command
+from tests.features.us033_time_sortable_command_ids import then_command_ids_are_compact_sortable_ids
+from tests.features.us033_time_sortable_command_ids import then_command_ids_sort_in_submission_order
+from tests.features.us033_time_sortable_command_ids import then_only_later_commands_returned
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('5 commands are submitted one after another in a session')
+def step_given_commands_submitted_in_session(context):
+    return given_commands_submitted_in_session.execute(context)
+
+@when('I query the command history since the second command')
+def step_when_query_history_since_second_command(context):
+    return when_query_history_since_second_command.execute(context)
+
+@then('the command IDs should be compact sortable IDs')
+def step_then_command_ids_are_compact_sortable_ids(context):
+    return then_command_ids_are_compact_sortable_ids.execute(context)
+
+@then('the command IDs should sort in submission order')
+def step_then_command_ids_sort_in_submission_order(context):
+    return then_command_ids_sort_in_submission_order.execute(context)
+
+@then('I should receive only the 3 commands submitted after it')
+def step_then_only_later_commands_returned(context):
+    return then_only_later_commands_returned.execute(context)
@@ -0,0 +1,14 @@
+Feature: Time-sortable Command IDs
+  As an AI assistant
+  I want command IDs that sort in creation order
+  So that I can ask for the commands created since one I already know
+
+  Scenario: Command IDs sort in submission order
+    Given 5 commands are submitted one after another in a session
+    Then the command IDs should be compact sortable IDs
+    And the command IDs should sort in submission order
+
+  Scenario: List commands created since a known command
+    Given 5 commands are submitted one after another in a session
+    When I query the command history since the second command
+    Then I should receive only the 3 commands submitted after it
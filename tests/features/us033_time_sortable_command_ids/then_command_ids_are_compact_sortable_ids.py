@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify command IDs use the compact sortable format"""
+    from conftest import BDDPhase
+    from public_tunnel.models.sortable_id import is_sortable_id, SORTABLE_ID_LENGTH
+    
+    context.phase = BDDPhase.THEN
+    
+    for command_id in context.submitted_command_ids:
+        assert len(command_id) == SORTABLE_ID_LENGTH
+        assert is_sortable_id(command_id), f"{command_id} is not a sortable ID"
@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify plain string order of the IDs equals submission order"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert sorted(context.submitted_command_ids) == context.submitted_command_ids
+    assert len(set(context.submitted_command_ids)) == 5
@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify only commands submitted after the given one are listed, oldest first"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.history_response.status_code == 200
+    history = context.history_response.json()
+    assert history["command_ids"] == context.submitted_command_ids[2:]
+    assert history["total_commands"] == 3
@@ -0,0 +1,10 @@
+def execute(context):
+    """Query the session command history starting after the second command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.history_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/commands/history",
+        params={"since": context.submitted_command_ids[1]}
+    )
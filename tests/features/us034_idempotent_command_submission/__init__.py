@@ -0,0 +1 @@
+# US-034: Idempotent Command Submission test package
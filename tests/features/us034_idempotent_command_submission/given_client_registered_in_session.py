@@ -0,0 +1,21 @@
+import uuid
+
+
+def execute(context):
+    """Register a target client in a fresh session"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-idempotency-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-idempotency"
+    context.idempotency_key = f"retry-{uuid.uuid4().hex}"
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.submit_endpoint = f"/api/sessions/{context.session_id}/commands/submit"
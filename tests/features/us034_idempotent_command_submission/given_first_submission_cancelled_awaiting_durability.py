@@ -0,0 +1,26 @@
+import asyncio
+
+
+def execute(context):
+    """Override the queue manager so the first submission is cancelled while awaiting durability"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_command_queue_manager
+    from public_tunnel.services.command_queue_manager import CommandQueueManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    class CancelFirstDurabilityWaitQueueManager(CommandQueueManager):
+        """Simulates a client disconnect cancelling the first request during the fsync wait"""
+        
+        def __init__(self):
+            super().__init__()
+            self.durability_waits = 0
+        
+        async def wait_until_durable(self, commands):
+            self.durability_waits += 1
+            if self.durability_waits == 1:
+                raise asyncio.CancelledError()
+    
+    context.queue_manager = CancelFirstDurabilityWaitQueueManager()
+    app.dependency_overrides[get_command_queue_manager] = lambda: context.queue_manager
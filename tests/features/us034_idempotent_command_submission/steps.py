@@ -0,0 +1,60 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us034_idempotent_command_submission import given_client_registered_in_session
+from tests.features.us034_idempotent_command_submission import when_submit_same_command_twice_with_same_key
+from tests.features.us034_idempotent_command_submission import when_submit_different_commands_with_same_key
+from tests.features.us034_idempotent_command_submission import then_both_responses_carry_same_command_id
+from tests.features.us034_idempotent_command_submission import then_retry_marked_as_replayed
+from tests.features.us034_idempotent_command_submission import then_client_queue_holds_command_once
+from tests.features.us034_idempotent_command_submission import then_idempotency_key_stats_report_replay
+from tests.features.us034_idempotent_command_submission import then_second_submission_rejected_with_conflict
+from tests.features.us034_idempotent_command_submission import given_first_submission_cancelled_awaiting_durability
+from tests.features.us034_idempotent_command_submission import when_submit_cancelled_then_retry_with_same_key
+from tests.features.us034_idempotent_command_submission import then_retry_processed_after_cancellation
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a client is registered in a session')
+def step_given_client_registered_in_session(context):
+    return given_client_registered_in_session.execute(context)
+
+@when('I submit the same command twice with the same Idempotency-Key')
+def step_when_submit_same_command_twice_with_same_key(context):
+    return when_submit_same_command_twice_with_same_key.execute(context)
+
+@when('I submit two different commands with the same Idempotency-Key')
+def step_when_submit_different_commands_with_same_key(context):
+    return when_submit_different_commands_with_same_key.execute(context)
+
+@then('both responses should carry the same command id')
+def step_then_both_responses_carry_same_command_id(context):
+    return then_both_responses_carry_same_command_id.execute(context)
+
+@then('the retry should be marked as replayed')
+def step_then_retry_marked_as_replayed(context):
+    return then_retry_marked_as_replayed.execute(context)
+
+@then('the client queue should hold the command only once')
+def step_then_client_queue_holds_command_once(context):
+    return then_client_queue_holds_command_once.execute(context)
+
+@then('the idempotency key stats should report the replay')
+def step_then_idempotency_key_stats_report_replay(context):
+    return then_idempotency_key_stats_report_replay.execute(context)
+
+@then('the second submission should be rejected with 409 Conflict')
+def step_then_second_submission_rejected_with_conflict(context):
+    return then_second_submission_rejected_with_conflict.execute(context)
+
+@given('the first submission will be cancelled while awaiting durability')
+def step_given_first_submission_cancelled_awaiting_durability(context):
+    return given_first_submission_cancelled_awaiting_durability.execute(context)
+
+@when('I submit a command that is cancelled and retry it with the same Idempotency-Key')
+def step_when_submit_cancelled_then_retry_with_same_key(context):
+    return when_submit_cancelled_then_retry_with_same_key.execute(context)
+
+@then('the retry should be processed instead of rejected as in progress')
+def step_then_retry_processed_after_cancellation(context):
+    return then_retry_processed_after_cancellation.execute(context)
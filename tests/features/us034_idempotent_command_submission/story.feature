@@ -0,0 +1,23 @@
+Feature: Idempotent Command Submission
+  As an orchestrator that retries after gateway timeouts
+  I want retries carrying the same Idempotency-Key to return the original submission
+  So that a device never runs one command twice
+
+  Scenario: Retry with the same Idempotency-Key is not enqueued again
+    Given a client is registered in a session
+    When I submit the same command twice with the same Idempotency-Key
+    Then both responses should carry the same command id
+    And the retry should be marked as replayed
+    And the client queue should hold the command only once
+    And the idempotency key stats should report the replay
+
+  Scenario: Idempotency-Key reused for a different command is rejected
+    Given a client is registered in a session
+    When I submit two different commands with the same Idempotency-Key
+    Then the second submission should be rejected with 409 Conflict
+
+  Scenario: Retry after a cancelled submission is processed again
+    Given a client is registered in a session
+    And the first submission will be cancelled while awaiting durability
+    When I submit a command that is cancelled and retry it with the same Idempotency-Key
+    Then the retry should be processed instead of rejected as in progress
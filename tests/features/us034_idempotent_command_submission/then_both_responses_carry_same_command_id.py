@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the retry returned the original submission"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.first_response.status_code == 200
+    assert context.retry_response.status_code == 200
+    assert context.retry_response.json() == context.first_response.json()
@@ -0,0 +1,14 @@
+def execute(context):
+    """Verify the retry did not enqueue a second command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    poll_result = context.test_client.get(
+        f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll",
+        params={"max_commands": 10}
+    ).json()
+    
+    assert [command["command_id"] for command in poll_result["commands"]] == [
+        context.first_response.json()["command_id"]
+    ]
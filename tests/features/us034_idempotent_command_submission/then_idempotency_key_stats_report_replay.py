@@ -0,0 +1,16 @@
+def execute(context):
+    """Verify the admin stats expose the remembered key and the replay"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    stats_response = context.test_client.get(
+        "/api/admin/idempotency-keys",
+        headers={"Authorization": "default-admin-token"}
+    )
+    assert stats_response.status_code == 200
+    
+    stats = stats_response.json()
+    assert stats["entries"] >= 1
+    assert stats["replayed_count"] >= 1
+    assert 0 < stats["held_bytes"] <= stats["max_bytes"]
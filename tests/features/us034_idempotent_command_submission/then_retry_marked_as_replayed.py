@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify only the retry carries the replay marker header"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert "Idempotent-Replayed" not in context.first_response.headers
+    assert context.retry_response.headers["Idempotent-Replayed"] == "true"
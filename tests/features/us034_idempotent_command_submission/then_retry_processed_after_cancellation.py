@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify the cancelled submission released its key instead of leaving it in progress"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.first_submission_cancelled
+    assert context.retry_response.status_code == 200
+    assert "Idempotent-Replayed" not in context.retry_response.headers
+    assert context.retry_response.json()["command_id"]
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify key reuse for another command is refused instead of replayed"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.first_response.status_code == 200
+    assert context.retry_response.status_code == 409
+    assert "different request" in context.retry_response.json()["detail"]
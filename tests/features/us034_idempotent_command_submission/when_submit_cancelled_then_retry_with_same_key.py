@@ -0,0 +1,21 @@
+import concurrent.futures
+
+
+def execute(context):
+    """Submit a command that is cancelled in flight, then retry it with the same Idempotency-Key"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    command_request = {
+        "command_content": "systemctl restart app",
+        "target_client_id": context.target_client_id
+    }
+    headers = {"Idempotency-Key": context.idempotency_key}
+    
+    try:
+        context.test_client.post(context.submit_endpoint, json=command_request, headers=headers)
+        context.first_submission_cancelled = False
+    except concurrent.futures.CancelledError:
+        context.first_submission_cancelled = True
+    context.retry_response = context.test_client.post(context.submit_endpoint, json=command_request, headers=headers)
@@ -0,0 +1,18 @@
+def execute(context):
+    """Submit two different commands carrying the same Idempotency-Key"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    headers = {"Idempotency-Key": context.idempotency_key}
+    
+    context.first_response = context.test_client.post(
+        context.submit_endpoint,
+        json={"command_content": "echo first", "target_client_id": context.target_client_id},
+        headers=headers
+    )
+    context.retry_response = context.test_client.post(
+        context.submit_endpoint,
+        json={"command_content": "echo second", "target_client_id": context.target_client_id},
+        headers=headers
+    )
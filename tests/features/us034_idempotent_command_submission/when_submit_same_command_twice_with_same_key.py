@@ -0,0 +1,14 @@
+def execute(context):
+    """Submit a command, then retry it with the same Idempotency-Key"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    command_request = {
+        "command_content": "systemctl restart app",
+        "target_client_id": context.target_client_id
+    }
+    headers = {"Idempotency-Key": context.idempotency_key}
+    
+    context.first_response = context.test_client.post(context.submit_endpoint, json=command_request, headers=headers)
+    context.retry_response = context.test_client.post(context.submit_endpoint, json=command_request, headers=headers)
@@ -0,0 +1 @@
+# US-035: Delayed Command Execution test package
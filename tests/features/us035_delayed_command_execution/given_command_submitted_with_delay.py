@@ -0,0 +1,35 @@
+import time
+import uuid
+
+
+def execute(context):
+    """Submit a command with delay_seconds=1 to a registered client"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-delayed-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-delayed"
+    context.delay_seconds = 1
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.submitted_at = time.monotonic()
+    submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit",
+        json={
+            "command_content": "echo 'later'",
+            "target_client_id": context.target_client_id,
+            "delay_seconds": context.delay_seconds
+        }
+    )
+    assert submit_response.status_code == 200
+    assert submit_response.json()["not_before"] is not None
+    context.command_id = submit_response.json()["command_id"]
+    
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
@@ -0,0 +1,40 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us035_delayed_command_execution import given_command_submitted_with_delay
+from tests.features.us035_delayed_command_execution import when_client_polls_before_delay
+from tests.features.us035_delayed_command_execution import when_client_polls_after_delay
+from tests.features.us035_delayed_command_execution import when_client_long_polls_while_server_running
+from tests.features.us035_delayed_command_execution import then_first_poll_receives_nothing
+from tests.features.us035_delayed_command_execution import then_second_poll_receives_command
+from tests.features.us035_delayed_command_execution import then_long_poll_receives_command_after_delay
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command is submitted with a delay of 1 second to a registered client')
+def step_given_command_submitted_with_delay(context):
+    return given_command_submitted_with_delay.execute(context)
+
+@when('the client polls before the delay has passed')
+def step_when_client_polls_before_delay(context):
+    return when_client_polls_before_delay.execute(context)
+
+@when('the client polls again after the delay has passed')
+def step_when_client_polls_after_delay(context):
+    return when_client_polls_after_delay.execute(context)
+
+@when('the client long-polls while the server is running')
+def step_when_client_long_polls_while_server_running(context):
+    return when_client_long_polls_while_server_running.execute(context)
+
+@then('the first poll should not receive the command')
+def step_then_first_poll_receives_nothing(context):
+    return then_first_poll_receives_nothing.execute(context)
+
+@then('the second poll should receive the command')
+def step_then_second_poll_receives_command(context):
+    return then_second_poll_receives_command.execute(context)
+
+@then('the long-poll should receive the command once its delay has passed')
+def step_then_long_poll_receives_command_after_delay(context):
+    return then_long_poll_receives_command_after_delay.execute(context)
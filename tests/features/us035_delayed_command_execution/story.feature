@@ -0,0 +1,16 @@
+Feature: Delayed Command Execution
+  As an AI assistant
+  I want to submit a command that only becomes visible to the client at a later time
+  So that I do not have to hold a timer and call back myself
+
+  Scenario: Delayed command stays invisible until its release time
+    Given a command is submitted with a delay of 1 second to a registered client
+    When the client polls before the delay has passed
+    And the client polls again after the delay has passed
+    Then the first poll should not receive the command
+    And the second poll should receive the command
+
+  Scenario: Waiting long-poll is woken when a delayed command is released
+    Given a command is submitted with a delay of 1 second to a registered client
+    When the client long-polls while the server is running
+    Then the long-poll should receive the command once its delay has passed
@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify the delayed command is not visible before its release time"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.early_poll_response.status_code == 200
+    assert context.early_poll_response.json()["command"] is None
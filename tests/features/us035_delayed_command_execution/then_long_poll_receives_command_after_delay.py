@@ -0,0 +1,13 @@
+def execute(context):
+    """Verify the long-poll was woken by the release, not by its own timeout"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.long_poll_response.status_code == 200
+    delivered_command = context.long_poll_response.json()["command"]
+    assert delivered_command is not None
+    assert delivered_command["command_id"] == context.command_id
+    
+    assert context.long_poll_returned_after >= context.delay_seconds - 0.05
+    assert context.long_poll_returned_after < 5, "Long-poll should return soon after the release time"
@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify the poll after the release time delivers the command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.late_poll_response.status_code == 200
+    delivered_command = context.late_poll_response.json()["command"]
+    assert delivered_command is not None
+    assert delivered_command["command_id"] == context.command_id
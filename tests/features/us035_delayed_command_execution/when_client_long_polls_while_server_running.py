@@ -0,0 +1,18 @@
+import time
+
+from fastapi.testclient import TestClient
+
+
+def execute(context):
+    """Long-poll with the app lifespan running, so the background task releases the command"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    
+    context.phase = BDDPhase.WHEN
+    
+    with TestClient(app) as running_server_client:
+        context.long_poll_response = running_server_client.get(
+            context.poll_endpoint,
+            params={"wait_seconds": 10}
+        )
+        context.long_poll_returned_after = time.monotonic() - context.submitted_at
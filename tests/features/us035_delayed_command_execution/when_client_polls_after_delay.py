@@ -0,0 +1,11 @@
+import time
+
+
+def execute(context):
+    """Poll again once the delay has passed (no background task is running)"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    time.sleep(context.delay_seconds + 0.1)
+    context.late_poll_response = context.test_client.get(context.poll_endpoint)
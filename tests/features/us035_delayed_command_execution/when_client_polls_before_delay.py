@@ -0,0 +1,7 @@
+def execute(context):
+    """Poll right after submission"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.early_poll_response = context.test_client.get(context.poll_endpoint)
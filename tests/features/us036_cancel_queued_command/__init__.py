@@ -0,0 +1 @@
+# US-036: Cancel Queued Command test package
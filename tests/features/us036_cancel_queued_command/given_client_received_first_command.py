@@ -0,0 +1,8 @@
+def execute(context):
+    """Deliver the first command to the client"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    delivered_command = context.test_client.get(context.poll_endpoint).json()["command"]
+    assert delivered_command["command_id"] == context.queued_command_ids[0]
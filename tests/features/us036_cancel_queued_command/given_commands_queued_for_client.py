@@ -0,0 +1,32 @@
+import uuid
+
+
+def execute(context):
+    """Queue 3 commands for one registered client"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-cancel-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-cancel"
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    context.queued_command_ids = []
+    for command_index in range(3):
+        submit_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={
+                "command_content": f"echo {command_index}",
+                "target_client_id": context.target_client_id
+            }
+        )
+        assert submit_response.status_code == 200
+        context.queued_command_ids.append(submit_response.json()["command_id"])
+    
+    context.poll_endpoint = f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
@@ -0,0 +1,55 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us036_cancel_queued_command import given_commands_queued_for_client
+from tests.features.us036_cancel_queued_command import given_client_received_first_command
+from tests.features.us036_cancel_queued_command import when_cancel_second_command
+from tests.features.us036_cancel_queued_command import when_cancel_first_command
+from tests.features.us036_cancel_queued_command import when_cancel_unknown_command
+from tests.features.us036_cancel_queued_command import then_cancellation_succeeds
+from tests.features.us036_cancel_queued_command import then_client_receives_remaining_commands
+from tests.features.us036_cancel_queued_command import then_second_command_result_cancelled
+from tests.features.us036_cancel_queued_command import then_cancellation_rejected_with_conflict
+from tests.features.us036_cancel_queued_command import then_cancellation_rejected_with_not_found
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('3 commands are queued for a client')
+def step_given_commands_queued_for_client(context):
+    return given_commands_queued_for_client.execute(context)
+
+@given('the client has received the first command')
+def step_given_client_received_first_command(context):
+    return given_client_received_first_command.execute(context)
+
+@when('I cancel the second command')
+def step_when_cancel_second_command(context):
+    return when_cancel_second_command.execute(context)
+
+@when('I cancel the first command')
+def step_when_cancel_first_command(context):
+    return when_cancel_first_command.execute(context)
+
+@when('I cancel a command that does not exist')
+def step_when_cancel_unknown_command(context):
+    return when_cancel_unknown_command.execute(context)
+
+@then('the cancellation should succeed')
+def step_then_cancellation_succeeds(context):
+    return then_cancellation_succeeds.execute(context)
+
+@then('the client should only receive the first and third commands')
+def step_then_client_receives_remaining_commands(context):
+    return then_client_receives_remaining_commands.execute(context)
+
+@then('the result of the second command should be cancelled')
+def step_then_second_command_result_cancelled(context):
+    return then_second_command_result_cancelled.execute(context)
+
+@then('the cancellation should be rejected with 409 Conflict')
+def step_then_cancellation_rejected_with_conflict(context):
+    return then_cancellation_rejected_with_conflict.execute(context)
+
+@then('the cancellation should be rejected with 404 Not Found')
+def step_then_cancellation_rejected_with_not_found(context):
+    return then_cancellation_rejected_with_not_found.execute(context)
@@ -0,0 +1,22 @@
+Feature: Cancel Queued Command
+  As an AI assistant
+  I want to cancel a command that has not reached its client yet
+  So that a command I no longer need is never executed
+
+  Scenario: Cancel a command from the middle of a client queue
+    Given 3 commands are queued for a client
+    When I cancel the second command
+    Then the cancellation should succeed
+    And the client should only receive the first and third commands
+    And the result of the second command should be cancelled
+
+  Scenario: Cancelling an already delivered command is rejected
+    Given 3 commands are queued for a client
+    And the client has received the first command
+    When I cancel the first command
+    Then the cancellation should be rejected with 409 Conflict
+
+  Scenario: Cancelling an unknown command returns not found
+    Given 3 commands are queued for a client
+    When I cancel a command that does not exist
+    Then the cancellation should be rejected with 404 Not Found
@@ -0,0 +1,8 @@
+def execute(context):
+    """Verify a delivered command cannot be cancelled"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.cancel_response.status_code == 409
+    assert "already delivered" in context.cancel_response.json()["detail"]
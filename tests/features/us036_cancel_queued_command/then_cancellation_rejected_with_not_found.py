@@ -0,0 +1,7 @@
+def execute(context):
+    """Verify an unknown command is reported as not found"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.cancel_response.status_code == 404
@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify the cancellation response"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.cancel_response.status_code == 200
+    cancellation = context.cancel_response.json()
+    assert cancellation["command_id"] == context.queued_command_ids[1]
+    assert cancellation["execution_status"] == "cancelled"
@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the cancelled command is skipped and never delivered"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    poll_result = context.test_client.get(context.poll_endpoint, params={"max_commands": 10}).json()
+    
+    delivered_command_ids = [command["command_id"] for command in poll_result["commands"]]
+    assert delivered_command_ids == [context.queued_command_ids[0], context.queued_command_ids[2]]
+    assert poll_result["total_queue_size"] == 0
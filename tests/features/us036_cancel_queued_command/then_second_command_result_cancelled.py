@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the result record of the cancelled command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    result_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/results/{context.queued_command_ids[1]}"
+    )
+    assert result_response.status_code == 200
+    assert result_response.json()["execution_status"] == "cancelled"
@@ -0,0 +1,9 @@
+def execute(context):
+    """Cancel the first queued command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.cancel_response = context.test_client.delete(
+        f"/api/sessions/{context.session_id}/commands/{context.queued_command_ids[0]}"
+    )
@@ -0,0 +1,9 @@
+def execute(context):
+    """Cancel a command id that was never submitted"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.cancel_response = context.test_client.delete(
+        f"/api/sessions/{context.session_id}/commands/non_existent_command"
+    )
@@ -0,0 +1 @@
+# US-037: Queue Position and ETA test package
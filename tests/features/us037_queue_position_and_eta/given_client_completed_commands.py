@@ -0,0 +1,40 @@
+import uuid
+
+
+def execute(context):
+    """Run 2 commands through the client, each reported with a 10 second duration"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_client_presence_tracker
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-eta-{uuid.uuid4().hex[:8]}"
+    context.target_client_id = "client-eta"
+    context.submit_endpoint = f"/api/sessions/{context.session_id}/commands/submit"
+    
+    get_client_presence_tracker().update_client_last_seen(
+        client_id=context.target_client_id,
+        session_id=context.session_id
+    )
+    
+    for command_index in range(2):
+        submit_response = context.test_client.post(
+            context.submit_endpoint,
+            json={"command_content": f"build {command_index}", "target_client_id": context.target_client_id}
+        )
+        command_id = submit_response.json()["command_id"]
+        
+        context.test_client.get(
+            f"/api/sessions/{context.session_id}/clients/{context.target_client_id}/commands/poll"
+        )
+        result_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/results",
+            json={
+                "command_id": command_id,
+                "execution_status": "completed",
+                "result_content": "ok",
+                "execution_duration_seconds": 10
+            }
+        )
+        assert result_response.status_code == 200
@@ -0,0 +1,15 @@
+def execute(context):
+    """Queue 3 normal priority commands"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.queued_command_ids = []
+    for command_index in range(3):
+        submit_response = context.test_client.post(
+            context.submit_endpoint,
+            json={"command_content": f"deploy {command_index}", "target_client_id": context.target_client_id}
+        )
+        assert submit_response.status_code == 200
+        assert submit_response.json()["queue_position"] == command_index
+        context.queued_command_ids.append(submit_response.json()["command_id"])
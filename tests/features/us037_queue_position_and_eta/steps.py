@@ -0,0 +1,35 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us037_queue_position_and_eta import given_client_completed_commands
+from tests.features.us037_queue_position_and_eta import given_commands_queued_for_client
+from tests.features.us037_queue_position_and_eta import when_query_status_of_third_queued_command
+from tests.features.us037_queue_position_and_eta import when_first_cancelled_and_urgent_submitted
+from tests.features.us037_queue_position_and_eta import then_command_pending_at_position
+from tests.features.us037_queue_position_and_eta import then_estimated_completion_about_30_seconds
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a client has completed 2 commands taking 10 seconds each')
+def step_given_client_completed_commands(context):
+    return given_client_completed_commands.execute(context)
+
+@given('3 more commands are queued for the client')
+def step_given_commands_queued_for_client(context):
+    return given_commands_queued_for_client.execute(context)
+
+@when('I query the status of the third queued command')
+def step_when_query_status_of_third_queued_command(context):
+    return when_query_status_of_third_queued_command.execute(context)
+
+@when('the first queued command is cancelled and an urgent command is submitted')
+def step_when_first_cancelled_and_urgent_submitted(context):
+    return when_first_cancelled_and_urgent_submitted.execute(context)
+
+@then('the command should be pending at queue position 2')
+def step_then_command_pending_at_position(context):
+    return then_command_pending_at_position.execute(context)
+
+@then('the estimated completion time should be about 30 seconds from now')
+def step_then_estimated_completion_about_30_seconds(context):
+    return then_estimated_completion_about_30_seconds.execute(context)
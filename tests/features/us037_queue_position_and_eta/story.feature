@@ -0,0 +1,18 @@
+Feature: Queue Position and ETA
+  As an AI scheduler
+  I want the exact queue position and an estimated completion time of a pending command
+  So that I can choose between waiting and rerouting
+
+  Scenario: Status of a queued command reports its position and ETA
+    Given a client has completed 2 commands taking 10 seconds each
+    And 3 more commands are queued for the client
+    When I query the status of the third queued command
+    Then the command should be pending at queue position 2
+    And the estimated completion time should be about 30 seconds from now
+
+  Scenario: Queue position follows cancellations and higher priority commands
+    Given a client has completed 2 commands taking 10 seconds each
+    And 3 more commands are queued for the client
+    When the first queued command is cancelled and an urgent command is submitted
+    And I query the status of the third queued command
+    Then the command should be pending at queue position 2
@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the command is pending with two commands ahead of it"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.status_response.status_code == 200
+    status = context.status_response.json()
+    assert status["execution_status"] == "pending"
+    assert status["client_id"] == context.target_client_id
+    assert status["queue_position"] == 2
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+
+def execute(context):
+    """Verify ETA = (position + 1) x average execution duration"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    estimated_completion_time = datetime.fromisoformat(context.status_response.json()["estimated_completion_time"])
+    seconds_from_now = (estimated_completion_time - datetime.now()).total_seconds()
+    assert 28 <= seconds_from_now <= 30
@@ -0,0 +1,21 @@
+def execute(context):
+    """Remove one command ahead and add an urgent one that overtakes the queue"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    cancel_response = context.test_client.delete(
+        f"/api/sessions/{context.session_id}/commands/{context.queued_command_ids[0]}"
+    )
+    assert cancel_response.status_code == 200
+    
+    urgent_response = context.test_client.post(
+        context.submit_endpoint,
+        json={
+            "command_content": "rollback",
+            "target_client_id": context.target_client_id,
+            "priority": "urgent"
+        }
+    )
+    assert urgent_response.status_code == 200
+    assert urgent_response.json()["queue_position"] == 0
@@ -0,0 +1,9 @@
+def execute(context):
+    """Query the status endpoint for the third queued command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.status_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/commands/{context.queued_command_ids[2]}/status"
+    )
@@ -0,0 +1 @@
+# US-038: Adaptive Auto Async Wait test package
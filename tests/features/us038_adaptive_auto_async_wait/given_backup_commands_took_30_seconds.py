@@ -0,0 +1,19 @@
+import uuid
+
+
+def execute(context):
+    """Register a client and teach the result manager that backups are slow"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_execution_result_manager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-adaptive-{uuid.uuid4().hex[:8]}"
+    context.client_id = "client-adaptive"
+    context.test_client.post(f"/api/sessions/{context.session_id}/poll", json={"client_id": context.client_id})
+    
+    for _ in range(5):
+        get_execution_result_manager().record_turnaround_latency(
+            context.session_id, context.client_id, "backup", 30.0
+        )
@@ -0,0 +1,27 @@
+import uuid
+
+
+def execute(context):
+    """Run 5 echo commands through the client, each answered right away"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-adaptive-{uuid.uuid4().hex[:8]}"
+    context.client_id = "client-adaptive"
+    context.test_client.post(f"/api/sessions/{context.session_id}/poll", json={"client_id": context.client_id})
+    
+    for command_index in range(5):
+        submit_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={"command_content": f"echo {command_index}", "target_client_id": context.client_id}
+        )
+        command_id = submit_response.json()["command_id"]
+        
+        context.test_client.get(f"/api/sessions/{context.session_id}/clients/{context.client_id}/commands/poll")
+        result_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/results",
+            json={"command_id": command_id, "execution_status": "completed", "result_content": str(command_index)}
+        )
+        assert result_response.status_code == 200
@@ -0,0 +1,35 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us038_adaptive_auto_async_wait import given_backup_commands_took_30_seconds
+from tests.features.us038_adaptive_auto_async_wait import given_echo_commands_completed_quickly
+from tests.features.us038_adaptive_auto_async_wait import when_submit_backup_command
+from tests.features.us038_adaptive_auto_async_wait import when_submit_unanswered_echo_command
+from tests.features.us038_adaptive_auto_async_wait import then_async_without_waiting
+from tests.features.us038_adaptive_auto_async_wait import then_async_after_short_wait
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('backup commands of the client took 30 seconds each')
+def step_given_backup_commands_took_30_seconds(context):
+    return given_backup_commands_took_30_seconds.execute(context)
+
+@given('echo commands of the client completed quickly 5 times')
+def step_given_echo_commands_completed_quickly(context):
+    return given_echo_commands_completed_quickly.execute(context)
+
+@when('I submit a backup command with auto async response')
+def step_when_submit_backup_command(context):
+    return when_submit_backup_command.execute(context)
+
+@when('I submit an echo command with auto async response that the client does not answer')
+def step_when_submit_unanswered_echo_command(context):
+    return when_submit_unanswered_echo_command.execute(context)
+
+@then('the response should switch to async mode without waiting')
+def step_then_async_without_waiting(context):
+    return then_async_without_waiting.execute(context)
+
+@then('the response should switch to async mode after a short wait')
+def step_then_async_after_short_wait(context):
+    return then_async_after_short_wait.execute(context)
@@ -0,0 +1,14 @@
+Feature: Adaptive Auto Async Wait
+  As an AI caller
+  I want the auto async wait to follow how long similar commands took before
+  So that slow commands never hold a connection and fast ones are waited for just long enough
+
+  Scenario: Commands that are always slow switch to async immediately
+    Given backup commands of the client took 30 seconds each
+    When I submit a backup command with auto async response
+    Then the response should switch to async mode without waiting
+
+  Scenario: Commands that are always fast are waited for just long enough
+    Given echo commands of the client completed quickly 5 times
+    When I submit an echo command with auto async response that the client does not answer
+    Then the response should switch to async mode after a short wait
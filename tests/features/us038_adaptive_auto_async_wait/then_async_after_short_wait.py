@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the wait followed the fast echo latencies instead of the 5 second threshold"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.submit_response.status_code == 200
+    response_data = context.submit_response.json()
+    assert response_data["async_mode"] is True
+    assert 0 < response_data["wait_seconds"] < 1.0
+    assert context.submission_elapsed_seconds < 2.0
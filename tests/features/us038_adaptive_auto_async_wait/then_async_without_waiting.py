@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the request was not held open"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.submit_response.status_code == 200
+    response_data = context.submit_response.json()
+    assert response_data["async_mode"] is True
+    assert response_data["wait_seconds"] == 0
+    assert context.submission_elapsed_seconds < 1.0
@@ -0,0 +1,20 @@
+import time
+
+
+def execute(context):
+    """Submit an echo command through submit-auto-async; the client never answers it"""
+    from conftest import BDDPhase
+    from public_tunnel.dependencies.providers import get_auto_async_wait_seconds
+    from public_tunnel.main import app
+    
+    context.phase = BDDPhase.WHEN
+    
+    # A generous threshold, so a short wait can only come from the learned latencies
+    app.dependency_overrides[get_auto_async_wait_seconds] = lambda: 5.0
+    
+    submission_started = time.time()
+    context.submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit-auto-async",
+        json={"command_content": "echo unanswered", "target_client_id": context.client_id}
+    )
+    context.submission_elapsed_seconds = time.time() - submission_started
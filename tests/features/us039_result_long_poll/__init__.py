@@ -0,0 +1 @@
+# US-039: Result Long-Poll test package
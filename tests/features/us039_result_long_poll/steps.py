@@ -0,0 +1,30 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us039_result_long_poll import given_command_submitted_and_delivered
+from tests.features.us039_result_long_poll import when_query_result_while_client_reports
+from tests.features.us039_result_long_poll import when_query_result_without_report
+from tests.features.us039_result_long_poll import then_completed_result_before_wait_elapses
+from tests.features.us039_result_long_poll import then_pending_result_after_wait
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command has been submitted and delivered to the client')
+def step_given_command_submitted_and_delivered(context):
+    return given_command_submitted_and_delivered.execute(context)
+
+@when('I query its result with a 5 second wait while the client reports completion')
+def step_when_query_result_while_client_reports(context):
+    return when_query_result_while_client_reports.execute(context)
+
+@when('I query its result with a short wait and no result is reported')
+def step_when_query_result_without_report(context):
+    return when_query_result_without_report.execute(context)
+
+@then('the completed result should be returned before the wait elapses')
+def step_then_completed_result_before_wait_elapses(context):
+    return then_completed_result_before_wait_elapses.execute(context)
+
+@then('the pending result should be returned after the wait')
+def step_then_pending_result_after_wait(context):
+    return then_pending_result_after_wait.execute(context)
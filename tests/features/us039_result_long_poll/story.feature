@@ -0,0 +1,14 @@
+Feature: Result Long-Poll
+  As an AI caller
+  I want to wait on a result query until the command finishes
+  So that I do not have to busy-poll the result API
+
+  Scenario: Result query returns as soon as the client reports the result
+    Given a command has been submitted and delivered to the client
+    When I query its result with a 5 second wait while the client reports completion
+    Then the completed result should be returned before the wait elapses
+
+  Scenario: Result query returns the pending result when the wait elapses
+    Given a command has been submitted and delivered to the client
+    When I query its result with a short wait and no result is reported
+    Then the pending result should be returned after the wait
@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the query was woken by the reported result"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.query_response.status_code == 200
+    result = context.query_response.json()
+    assert result["execution_status"] == "completed"
+    assert result["result_content"] == "all passed"
+    assert context.query_elapsed_seconds < 3.0
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the query waited and then returned the unfinished result"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.query_response.status_code == 200
+    assert context.query_response.json()["execution_status"] == "pending"
+    assert 0.3 <= context.query_elapsed_seconds < 3.0
@@ -0,0 +1,26 @@
+import threading
+import time
+
+
+def execute(context):
+    """Long-poll the result while the client reports completion half a second later"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    def report_result():
+        time.sleep(0.5)
+        context.test_client.post(
+            f"/api/sessions/{context.session_id}/results",
+            json={"command_id": context.command_id, "execution_status": "completed", "result_content": "all passed"}
+        )
+    reporter = threading.Thread(target=report_result)
+    reporter.start()
+    
+    query_started = time.time()
+    context.query_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/results/{context.command_id}",
+        params={"wait_seconds": 5}
+    )
+    context.query_elapsed_seconds = time.time() - query_started
+    reporter.join()
@@ -0,0 +1,15 @@
+import time
+
+
+def execute(context):
+    """Long-poll the result of a command the client never reports"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    query_started = time.time()
+    context.query_response = context.test_client.get(
+        f"/api/sessions/{context.session_id}/results/{context.command_id}",
+        params={"wait_seconds": 0.3}
+    )
+    context.query_elapsed_seconds = time.time() - query_started
@@ -0,0 +1 @@
+# US-040: Indexed Result History test package
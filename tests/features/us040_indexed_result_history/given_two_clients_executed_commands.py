@@ -0,0 +1,29 @@
+import uuid
+
+
+def execute(context):
+    """Submit 2 commands to client A and 1 to client B, then complete A's first command"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-history-index-{uuid.uuid4().hex[:8]}"
+    context.command_ids = {"client-a": [], "client-b": []}
+    for client_id in context.command_ids:
+        context.test_client.post(f"/api/sessions/{context.session_id}/poll", json={"client_id": client_id})
+    
+    for client_id in ["client-a", "client-b", "client-a"]:
+        submit_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={"command_content": "uptime", "target_client_id": client_id}
+        )
+        assert submit_response.status_code == 200
+        context.command_ids[client_id].append(submit_response.json()["command_id"])
+    
+    context.test_client.get(f"/api/sessions/{context.session_id}/clients/client-a/commands/poll")
+    result_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/results",
+        json={"command_id": context.command_ids["client-a"][0], "execution_status": "completed", "result_content": "up 3 days"}
+    )
+    assert result_response.status_code == 200
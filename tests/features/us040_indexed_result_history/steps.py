@@ -0,0 +1,20 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us040_indexed_result_history import given_two_clients_executed_commands
+from tests.features.us040_indexed_result_history import when_query_history_with_filters
+from tests.features.us040_indexed_result_history import then_filters_list_matching_commands
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('two clients in a session have executed commands')
+def step_given_two_clients_executed_commands(context):
+    return given_two_clients_executed_commands.execute(context)
+
+@when('I query the command history filtered by client and by status')
+def step_when_query_history_with_filters(context):
+    return when_query_history_with_filters.execute(context)
+
+@then('each filter should list only the matching commands in creation order')
+def step_then_filters_list_matching_commands(context):
+    return then_filters_list_matching_commands.execute(context)
@@ -0,0 +1,9 @@
+Feature: Indexed Result History
+  As an AI assistant
+  I want to filter a session's command history by client and by status
+  So that I can find the commands I care about without listing everything
+
+  Scenario: Filter command history by client and status
+    Given two clients in a session have executed commands
+    When I query the command history filtered by client and by status
+    Then each filter should list only the matching commands in creation order
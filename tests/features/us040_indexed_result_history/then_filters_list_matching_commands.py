@@ -0,0 +1,20 @@
+def execute(context):
+    """Verify every filter returned exactly the matching command IDs"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    client_a_command_ids = context.command_ids["client-a"]
+    client_b_command_ids = context.command_ids["client-b"]
+    expected_command_ids = {
+        "client-a": client_a_command_ids,
+        "completed": [client_a_command_ids[0]],
+        "client-a pending": [client_a_command_ids[1]],
+        "all": [client_a_command_ids[0], client_b_command_ids[0], client_a_command_ids[1]]
+    }
+    
+    for filter_name, history_response in context.history_responses.items():
+        assert history_response.status_code == 200
+        history = history_response.json()
+        assert history["command_ids"] == expected_command_ids[filter_name], filter_name
+        assert history["total_commands"] == len(expected_command_ids[filter_name])
@@ -0,0 +1,13 @@
+def execute(context):
+    """Query the history once per filter combination"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    history_endpoint = f"/api/sessions/{context.session_id}/commands/history"
+    context.history_responses = {
+        "client-a": context.test_client.get(history_endpoint, params={"client_id": "client-a"}),
+        "completed": context.test_client.get(history_endpoint, params={"status": "completed"}),
+        "client-a pending": context.test_client.get(history_endpoint, params={"client_id": "client-a", "status": "pending"}),
+        "all": context.test_client.get(history_endpoint)
+    }
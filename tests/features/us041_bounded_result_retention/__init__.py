@@ -0,0 +1 @@
+# US-041: Bounded Result Retention test package
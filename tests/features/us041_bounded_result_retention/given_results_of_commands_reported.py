@@ -0,0 +1,12 @@
+def execute(context):
+    """Report completed results for commands 1 to 3"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    for command_number in range(1, 4):
+        result_response = context.test_client.post(
+            context.results_endpoint,
+            json={"command_id": f"retention-cmd-{command_number}", "execution_status": "completed", "result_content": "done"}
+        )
+        assert result_response.status_code == 200
@@ -0,0 +1,17 @@
+import uuid
+
+
+def execute(context):
+    """Override the result manager with one that keeps finished results for 0.2 seconds"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_execution_result_manager
+    from public_tunnel.services.execution_result_manager import InMemoryExecutionResultManager
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = f"test-session-retention-{uuid.uuid4().hex[:8]}"
+    context.results_endpoint = f"/api/sessions/{context.session_id}/results"
+    
+    result_manager = InMemoryExecutionResultManager(result_ttl_seconds=0.2)
+    app.dependency_overrides[get_execution_result_manager] = lambda: result_manager
@@ -0,0 +1,45 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us041_bounded_result_retention import given_server_retains_at_most_3_results
+from tests.features.us041_bounded_result_retention import given_results_of_commands_reported
+from tests.features.us041_bounded_result_retention import given_server_keeps_finished_results_briefly
+from tests.features.us041_bounded_result_retention import when_result_read_and_new_result_reported
+from tests.features.us041_bounded_result_retention import when_completed_and_pending_reported_and_ttl_passes
+from tests.features.us041_bounded_result_retention import then_least_recently_used_result_evicted
+from tests.features.us041_bounded_result_retention import then_retention_stats_report_eviction
+from tests.features.us041_bounded_result_retention import then_only_pending_result_retained
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('the server retains at most 3 results')
+def step_given_server_retains_at_most_3_results(context):
+    return given_server_retains_at_most_3_results.execute(context)
+
+@given('results of commands 1, 2 and 3 have been reported')
+def step_given_results_of_commands_reported(context):
+    return given_results_of_commands_reported.execute(context)
+
+@given('the server keeps finished results for 0.2 seconds')
+def step_given_server_keeps_finished_results_briefly(context):
+    return given_server_keeps_finished_results_briefly.execute(context)
+
+@when('the result of command 1 is read and the result of command 4 is reported')
+def step_when_result_read_and_new_result_reported(context):
+    return when_result_read_and_new_result_reported.execute(context)
+
+@when('a completed and a pending result are reported and the TTL passes')
+def step_when_completed_and_pending_reported_and_ttl_passes(context):
+    return when_completed_and_pending_reported_and_ttl_passes.execute(context)
+
+@then('the result of command 2 should be evicted')
+def step_then_least_recently_used_result_evicted(context):
+    return then_least_recently_used_result_evicted.execute(context)
+
+@then('the retention stats should report 3 results and 1 eviction')
+def step_then_retention_stats_report_eviction(context):
+    return then_retention_stats_report_eviction.execute(context)
+
+@then('only the pending result should be retained')
+def step_then_only_pending_result_retained(context):
+    return then_only_pending_result_retained.execute(context)
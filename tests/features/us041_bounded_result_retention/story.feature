@@ -0,0 +1,16 @@
+Feature: Bounded Result Retention
+  As a server operator
+  I want retained execution results bounded by count, memory and age
+  So that a long-running server does not grow until it runs out of memory
+
+  Scenario: Least recently used finished result is evicted beyond the count limit
+    Given the server retains at most 3 results
+    And results of commands 1, 2 and 3 have been reported
+    When the result of command 1 is read and the result of command 4 is reported
+    Then the result of command 2 should be evicted
+    And the retention stats should report 3 results and 1 eviction
+
+  Scenario: Finished results expire after the TTL while pending results are kept
+    Given the server keeps finished results for 0.2 seconds
+    When a completed and a pending result are reported and the TTL passes
+    Then only the pending result should be retained
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify command 2 was evicted while the read command 1 was kept"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.test_client.get(f"{context.results_endpoint}/retention-cmd-2").status_code == 404
+    for command_number in [1, 3, 4]:
+        assert context.test_client.get(f"{context.results_endpoint}/retention-cmd-{command_number}").status_code == 200
@@ -0,0 +1,17 @@
+def execute(context):
+    """Verify the completed result expired and the pending one is still queryable"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    stats = context.test_client.get(
+        "/api/admin/results",
+        headers={"Authorization": "default-admin-token"}
+    ).json()
+    assert stats["results"] == 1
+    assert stats["finished_results"] == 0
+    assert stats["expired_count"] == 1
+    
+    assert context.test_client.get(f"{context.results_endpoint}/ttl-cmd-completed").status_code == 404
+    pending_response = context.test_client.get(f"{context.results_endpoint}/ttl-cmd-pending")
+    assert pending_response.json()["execution_status"] == "pending"
@@ -0,0 +1,17 @@
+def execute(context):
+    """Verify the admin retention stats"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    stats_response = context.test_client.get(
+        "/api/admin/results",
+        headers={"Authorization": "default-admin-token"}
+    )
+    assert stats_response.status_code == 200
+    stats = stats_response.json()
+    assert stats["results"] == 3
+    assert stats["max_results"] == 3
+    assert stats["evicted_count"] == 1
+    assert stats["expired_count"] == 0
+    assert stats["held_bytes"] > 0
@@ -0,0 +1,17 @@
+import time
+
+
+def execute(context):
+    """Report one completed and one pending result, then wait past the TTL"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    for command_id, execution_status in [("ttl-cmd-completed", "completed"), ("ttl-cmd-pending", "pending")]:
+        result_response = context.test_client.post(
+            context.results_endpoint,
+            json={"command_id": command_id, "execution_status": execution_status}
+        )
+        assert result_response.status_code == 200
+    
+    time.sleep(0.3)
@@ -0,0 +1,12 @@
+def execute(context):
+    """Read command 1 so it becomes most recently used, then report a fourth result"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    assert context.test_client.get(f"{context.results_endpoint}/retention-cmd-1").status_code == 200
+    result_response = context.test_client.post(
+        context.results_endpoint,
+        json={"command_id": "retention-cmd-4", "execution_status": "completed", "result_content": "done"}
+    )
+    assert result_response.status_code == 200
@@ -0,0 +1 @@
+# US-042: Spill Large Result Content test package
@@ -0,0 +1,20 @@
+import uuid
+
+
+def execute(context):
+    """Override the result manager with one spilling bodies above 1 KB to a temporary directory"""
+    from conftest import BDDPhase
+    from public_tunnel.main import app
+    from public_tunnel.dependencies.providers import get_execution_result_manager
+    from public_tunnel.services.execution_result_manager import InMemoryExecutionResultManager
+    from public_tunnel.services.result_body_store import DiskResultBodyStore
+    
+    context.phase = BDDPhase.GIVEN
+    
+    context.session_id = f"test-session-spill-{uuid.uuid4().hex[:8]}"
+    context.results_endpoint = f"/api/sessions/{context.session_id}/results"
+    
+    context.result_manager = InMemoryExecutionResultManager(
+        result_body_store=DiskResultBodyStore(spill_threshold_bytes=1024, preview_bytes=100)
+    )
+    app.dependency_overrides[get_execution_result_manager] = lambda: context.result_manager
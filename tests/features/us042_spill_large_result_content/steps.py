@@ -0,0 +1,40 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us042_spill_large_result_content import given_server_spills_large_result_bodies
+from tests.features.us042_spill_large_result_content import when_client_reports_large_and_small_results
+from tests.features.us042_spill_large_result_content import when_large_result_reported_and_server_shuts_down
+from tests.features.us042_spill_large_result_content import then_spilled_bodies_deleted
+from tests.features.us042_spill_large_result_content import then_large_result_query_returns_preview
+from tests.features.us042_spill_large_result_content import then_download_returns_full_content
+from tests.features.us042_spill_large_result_content import then_small_result_returned_in_full
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('the server spills result bodies larger than 1 KB to disk')
+def step_given_server_spills_large_result_bodies(context):
+    return given_server_spills_large_result_bodies.execute(context)
+
+@when('a client reports a 50 KB result and a small result')
+def step_when_client_reports_large_and_small_results(context):
+    return when_client_reports_large_and_small_results.execute(context)
+
+@then('the large result query should return a truncated preview with a download URL')
+def step_then_large_result_query_returns_preview(context):
+    return then_large_result_query_returns_preview.execute(context)
+
+@then('downloading the URL should return the full 50 KB content')
+def step_then_download_returns_full_content(context):
+    return then_download_returns_full_content.execute(context)
+
+@then('the small result should be returned in full without a download URL')
+def step_then_small_result_returned_in_full(context):
+    return then_small_result_returned_in_full.execute(context)
+
+@when('a client reports a 50 KB result and the server shuts down')
+def step_when_large_result_reported_and_server_shuts_down(context):
+    return when_large_result_reported_and_server_shuts_down.execute(context)
+
+@then('the spilled body and its temporary directory should be deleted')
+def step_then_spilled_bodies_deleted(context):
+    return then_spilled_bodies_deleted.execute(context)
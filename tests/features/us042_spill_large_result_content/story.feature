@@ -0,0 +1,16 @@
+Feature: Spill Large Result Content
+  As an AI caller
+  I want large command output kept out of every result query
+  So that querying a result stays cheap while the full output remains downloadable
+
+  Scenario: Large result content is queried as a preview and downloaded in full
+    Given the server spills result bodies larger than 1 KB to disk
+    When a client reports a 50 KB result and a small result
+    Then the large result query should return a truncated preview with a download URL
+    And downloading the URL should return the full 50 KB content
+    And the small result should be returned in full without a download URL
+
+  Scenario: Spilled result bodies are deleted when the server shuts down
+    Given the server spills result bodies larger than 1 KB to disk
+    When a client reports a 50 KB result and the server shuts down
+    Then the spilled body and its temporary directory should be deleted
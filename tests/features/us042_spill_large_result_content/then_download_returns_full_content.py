@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify the content endpoint streams the whole body"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    download_response = context.test_client.get(f"{context.results_endpoint}/spill-cmd-large/content")
+    assert download_response.status_code == 200
+    assert download_response.headers["content-type"].startswith("text/plain")
+    assert download_response.text == context.large_content
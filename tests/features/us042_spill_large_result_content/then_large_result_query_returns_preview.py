@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the query carries only the first 100 bytes of the large body"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    result = context.test_client.get(f"{context.results_endpoint}/spill-cmd-large").json()
+    assert result["result_content_truncated"] is True
+    assert result["result_content"] == context.large_content[:100]
+    assert result["result_content_size"] == 50_000
+    assert result["result_content_url"] == f"{context.results_endpoint}/spill-cmd-large/content"
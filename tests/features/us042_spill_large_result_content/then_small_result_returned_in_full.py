@@ -0,0 +1,12 @@
+def execute(context):
+    """Verify results under the threshold stay in memory and are returned whole"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    result = context.test_client.get(f"{context.results_endpoint}/spill-cmd-small").json()
+    assert result["result_content"] == "ok"
+    assert result["result_content_truncated"] is False
+    assert result["result_content_url"] is None
+    
+    assert context.test_client.get(f"{context.results_endpoint}/spill-cmd-small/content").text == "ok"
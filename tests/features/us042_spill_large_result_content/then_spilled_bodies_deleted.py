@@ -0,0 +1,12 @@
+import os
+
+
+def execute(context):
+    """Verify nothing spilled by this process is left on disk"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert not os.path.exists(context.spilled_body_path)
+    assert not os.path.exists(context.spill_directory)
+    assert context.result_manager.result_body_store.get_stats()["spilled_results"] == 0
@@ -0,0 +1,13 @@
+def execute(context):
+    """Report a 50 KB log output and a one-line output"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.large_content = "".join(f"line {line_number:05d} of build output\n" for line_number in range(1, 2001))[:50_000]
+    for command_id, result_content in [("spill-cmd-large", context.large_content), ("spill-cmd-small", "ok")]:
+        result_response = context.test_client.post(
+            context.results_endpoint,
+            json={"command_id": command_id, "execution_status": "completed", "result_content": result_content}
+        )
+        assert result_response.status_code == 200
@@ -0,0 +1,20 @@
+import os
+
+
+def execute(context):
+    """Report a 50 KB result, check it was spilled, then close the result manager as shutdown does"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    result_response = context.test_client.post(
+        context.results_endpoint,
+        json={"command_id": "spill-cmd-shutdown", "execution_status": "completed", "result_content": "x" * 50_000}
+    )
+    assert result_response.status_code == 200
+    
+    context.spilled_body_path = context.result_manager.get_spilled_content_path("spill-cmd-shutdown")
+    assert context.spilled_body_path is not None and os.path.exists(context.spilled_body_path)
+    context.spill_directory = context.result_manager.result_body_store.directory
+    
+    context.result_manager.close()
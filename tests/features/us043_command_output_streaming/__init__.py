@@ -0,0 +1 @@
+# US-043: Command Output Streaming test package
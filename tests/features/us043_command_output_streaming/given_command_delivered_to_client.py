@@ -0,0 +1,23 @@
+import uuid
+
+
+def execute(context):
+    """Submit a command and let the client pick it up"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-output-{uuid.uuid4().hex[:8]}"
+    context.client_id = "client-output"
+    context.test_client.post(f"/api/sessions/{context.session_id}/poll", json={"client_id": context.client_id})
+    
+    submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit",
+        json={"command_content": "make build", "target_client_id": context.client_id}
+    )
+    assert submit_response.status_code == 200
+    context.command_id = submit_response.json()["command_id"]
+    context.test_client.get(f"/api/sessions/{context.session_id}/clients/{context.client_id}/commands/poll")
+    
+    context.output_endpoint = f"/api/sessions/{context.session_id}/commands/{context.command_id}/output"
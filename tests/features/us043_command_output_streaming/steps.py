@@ -0,0 +1,40 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us043_command_output_streaming import given_command_delivered_to_client
+from tests.features.us043_command_output_streaming import when_client_appends_chunks_and_reader_reads
+from tests.features.us043_command_output_streaming import when_client_appends_more_and_reader_reads_again
+from tests.features.us043_command_output_streaming import when_reader_waits_while_client_appends
+from tests.features.us043_command_output_streaming import then_each_read_returns_only_new_output
+from tests.features.us043_command_output_streaming import then_wait_returns_new_chunk
+from tests.features.us043_command_output_streaming import then_finished_output_closed_for_appends
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command has been delivered to the client')
+def step_given_command_delivered_to_client(context):
+    return given_command_delivered_to_client.execute(context)
+
+@when('the client appends two output chunks and the reader reads from offset 0')
+def step_when_client_appends_chunks_and_reader_reads(context):
+    return when_client_appends_chunks_and_reader_reads.execute(context)
+
+@when('the client appends another chunk and the reader reads from the returned offset')
+def step_when_client_appends_more_and_reader_reads_again(context):
+    return when_client_appends_more_and_reader_reads_again.execute(context)
+
+@when('the reader waits for output while the client appends a chunk')
+def step_when_reader_waits_while_client_appends(context):
+    return when_reader_waits_while_client_appends.execute(context)
+
+@then('each read should return only the new output of a running command')
+def step_then_each_read_returns_only_new_output(context):
+    return then_each_read_returns_only_new_output.execute(context)
+
+@then('the wait should return the new chunk before it elapses')
+def step_then_wait_returns_new_chunk(context):
+    return then_wait_returns_new_chunk.execute(context)
+
+@then('after the client reports completion the output should be finished and closed for appends')
+def step_then_finished_output_closed_for_appends(context):
+    return then_finished_output_closed_for_appends.execute(context)
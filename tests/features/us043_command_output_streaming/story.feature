@@ -0,0 +1,16 @@
+Feature: Command Output Streaming
+  As an AI caller
+  I want to read the output of a running command as it is produced
+  So that I can follow long-running commands without polling a RUNNING status blindly
+
+  Scenario: Reader fetches only output it does not have yet
+    Given a command has been delivered to the client
+    When the client appends two output chunks and the reader reads from offset 0
+    And the client appends another chunk and the reader reads from the returned offset
+    Then each read should return only the new output of a running command
+
+  Scenario: Reader long-polls for new output until the command finishes
+    Given a command has been delivered to the client
+    When the reader waits for output while the client appends a chunk
+    Then the wait should return the new chunk before it elapses
+    And after the client reports completion the output should be finished and closed for appends
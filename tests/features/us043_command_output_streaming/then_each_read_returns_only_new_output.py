@@ -0,0 +1,15 @@
+def execute(context):
+    """Verify both reads returned disjoint, consecutive output"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.first_read["data"] == "compiling\nlinking\n"
+    assert context.first_read["offset"] == 0
+    assert context.first_read["next_offset"] == len("compiling\nlinking\n")
+    assert context.first_read["execution_status"] == "running"
+    assert context.first_read["finished"] is False
+    
+    assert context.second_read["data"] == "done\n"
+    assert context.second_read["offset"] == context.first_read["next_offset"]
+    assert context.second_read["next_offset"] == len("compiling\nlinking\ndone\n")
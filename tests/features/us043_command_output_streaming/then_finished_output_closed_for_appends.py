@@ -0,0 +1,22 @@
+def execute(context):
+    """Complete the command, then verify readers see it finished and appends are rejected"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    result_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/results",
+        json={"command_id": context.command_id, "execution_status": "completed", "result_content": "build ok"}
+    )
+    assert result_response.status_code == 200
+    
+    final_read = context.test_client.get(
+        context.output_endpoint,
+        params={"offset": context.waited_read["next_offset"], "wait_seconds": 5}
+    ).json()
+    assert final_read["data"] == ""
+    assert final_read["finished"] is True
+    assert final_read["execution_status"] == "completed"
+    
+    late_append_response = context.test_client.post(context.output_endpoint, json={"data": "late\n"})
+    assert late_append_response.status_code == 409
@@ -0,0 +1,9 @@
+def execute(context):
+    """Verify the long-poll was woken by the appended chunk"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.waited_read["data"] == "50% done\n"
+    assert context.waited_read["next_offset"] == len("50% done\n")
+    assert context.read_elapsed_seconds < 3.0
@@ -0,0 +1,11 @@
+def execute(context):
+    """Append two chunks, then read everything from the start"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    for chunk in ["compiling\n", "linking\n"]:
+        append_response = context.test_client.post(context.output_endpoint, json={"data": chunk})
+        assert append_response.status_code == 200
+    
+    context.first_read = context.test_client.get(context.output_endpoint, params={"offset": 0}).json()
@@ -0,0 +1,13 @@
+def execute(context):
+    """Append a third chunk, then read from where the first read stopped"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    append_response = context.test_client.post(context.output_endpoint, json={"data": "done\n"})
+    assert append_response.json()["offset"] == context.first_read["next_offset"]
+    
+    context.second_read = context.test_client.get(
+        context.output_endpoint,
+        params={"offset": context.first_read["next_offset"]}
+    ).json()
@@ -0,0 +1,23 @@
+import threading
+import time
+
+
+def execute(context):
+    """Long-poll the output while the client appends a chunk half a second later"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    def append_chunk():
+        time.sleep(0.5)
+        context.test_client.post(context.output_endpoint, json={"data": "50% done\n"})
+    appender = threading.Thread(target=append_chunk)
+    appender.start()
+    
+    read_started = time.time()
+    context.waited_read = context.test_client.get(
+        context.output_endpoint,
+        params={"offset": 0, "wait_seconds": 5}
+    ).json()
+    context.read_elapsed_seconds = time.time() - read_started
+    appender.join()
@@ -0,0 +1 @@
+# US-044: Batch Result Query test package
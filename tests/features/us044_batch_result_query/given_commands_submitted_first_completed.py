@@ -0,0 +1,29 @@
+import uuid
+
+
+def execute(context):
+    """Fan out 3 commands to a client and complete the first one"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-batch-{uuid.uuid4().hex[:8]}"
+    context.client_id = "client-batch"
+    context.results_endpoint = f"/api/sessions/{context.session_id}/results"
+    context.test_client.post(f"/api/sessions/{context.session_id}/poll", json={"client_id": context.client_id})
+    
+    context.command_ids = []
+    for host_index in range(3):
+        submit_response = context.test_client.post(
+            f"/api/sessions/{context.session_id}/commands/submit",
+            json={"command_content": f"ping host-{host_index}", "target_client_id": context.client_id}
+        )
+        assert submit_response.status_code == 200
+        context.command_ids.append(submit_response.json()["command_id"])
+    
+    result_response = context.test_client.post(
+        context.results_endpoint,
+        json={"command_id": context.command_ids[0], "execution_status": "completed", "result_content": "pong"}
+    )
+    assert result_response.status_code == 200
@@ -0,0 +1,45 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us044_batch_result_query import given_commands_submitted_first_completed
+from tests.features.us044_batch_result_query import when_query_batch_with_unknown_id
+from tests.features.us044_batch_result_query import when_wait_for_any_while_second_completes
+from tests.features.us044_batch_result_query import when_wait_briefly_for_all
+from tests.features.us044_batch_result_query import then_results_in_request_order
+from tests.features.us044_batch_result_query import then_only_finished_filter_returns_completed
+from tests.features.us044_batch_result_query import then_batch_returns_when_second_completes
+from tests.features.us044_batch_result_query import then_batch_returns_after_wait_with_unfinished
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('3 commands have been submitted and the first one has completed')
+def step_given_commands_submitted_first_completed(context):
+    return given_commands_submitted_first_completed.execute(context)
+
+@when('I query the batch of results including an unknown command id')
+def step_when_query_batch_with_unknown_id(context):
+    return when_query_batch_with_unknown_id.execute(context)
+
+@when('I wait for any of the unfinished commands while the client completes the second one')
+def step_when_wait_for_any_while_second_completes(context):
+    return when_wait_for_any_while_second_completes.execute(context)
+
+@when('I wait briefly for all commands while none of the unfinished ones complete')
+def step_when_wait_briefly_for_all(context):
+    return when_wait_briefly_for_all.execute(context)
+
+@then('all known results should be returned in request order with the unknown id reported missing')
+def step_then_results_in_request_order(context):
+    return then_results_in_request_order.execute(context)
+
+@then('the only finished filter should return just the completed result')
+def step_then_only_finished_filter_returns_completed(context):
+    return then_only_finished_filter_returns_completed.execute(context)
+
+@then('the batch should return as soon as the second command completes')
+def step_then_batch_returns_when_second_completes(context):
+    return then_batch_returns_when_second_completes.execute(context)
+
+@then('the batch should return after the wait with 2 unfinished results')
+def step_then_batch_returns_after_wait_with_unfinished(context):
+    return then_batch_returns_after_wait_with_unfinished.execute(context)
@@ -0,0 +1,20 @@
+Feature: Batch Result Query
+  As an AI caller
+  I want to query and wait for the results of many commands in one request
+  So that a fan-out does not need one polling loop per command
+
+  Scenario: Batch query returns all results in request order
+    Given 3 commands have been submitted and the first one has completed
+    When I query the batch of results including an unknown command id
+    Then all known results should be returned in request order with the unknown id reported missing
+    And the only finished filter should return just the completed result
+
+  Scenario: Batch query waits until any result completes
+    Given 3 commands have been submitted and the first one has completed
+    When I wait for any of the unfinished commands while the client completes the second one
+    Then the batch should return as soon as the second command completes
+
+  Scenario: Batch query waiting for all results returns when the wait elapses
+    Given 3 commands have been submitted and the first one has completed
+    When I wait briefly for all commands while none of the unfinished ones complete
+    Then the batch should return after the wait with 2 unfinished results
@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify the all-wait held the request for the wait and then returned the current state"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.batch_response.status_code == 200
+    batch = context.batch_response.json()
+    assert batch["finished_count"] == 1
+    assert batch["unfinished_count"] == 2
+    assert 0.3 <= context.batch_elapsed_seconds < 3.0
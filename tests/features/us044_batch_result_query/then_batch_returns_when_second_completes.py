@@ -0,0 +1,12 @@
+def execute(context):
+    """Verify the any-wait was woken by the second command's result"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.batch_response.status_code == 200
+    batch = context.batch_response.json()
+    assert batch["finished_count"] == 1
+    assert batch["unfinished_count"] == 1
+    assert batch["results"][0]["execution_status"] == "completed"
+    assert context.batch_elapsed_seconds < 3.0
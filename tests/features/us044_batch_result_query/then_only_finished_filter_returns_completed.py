@@ -0,0 +1,10 @@
+def execute(context):
+    """Verify the filter drops pending results but keeps the counts"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    batch = context.finished_batch_response.json()
+    assert [result["command_id"] for result in batch["results"]] == [context.command_ids[0]]
+    assert batch["results"][0]["result_content"] == "pong"
+    assert batch["unfinished_count"] == 2
@@ -0,0 +1,13 @@
+def execute(context):
+    """Verify the batch carries every known result in request order"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.batch_response.status_code == 200
+    batch = context.batch_response.json()
+    assert [result["command_id"] for result in batch["results"]] == context.command_ids
+    assert [result["execution_status"] for result in batch["results"]] == ["completed", "pending", "pending"]
+    assert batch["missing_command_ids"] == ["unknown-command"]
+    assert batch["finished_count"] == 1
+    assert batch["unfinished_count"] == 2
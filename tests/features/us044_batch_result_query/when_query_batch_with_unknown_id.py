@@ -0,0 +1,15 @@
+def execute(context):
+    """Query all 3 results plus an unknown id, with and without the only finished filter"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    requested_command_ids = context.command_ids + ["unknown-command"]
+    context.batch_response = context.test_client.post(
+        f"{context.results_endpoint}/batch",
+        json={"command_ids": requested_command_ids}
+    )
+    context.finished_batch_response = context.test_client.post(
+        f"{context.results_endpoint}/batch",
+        json={"command_ids": requested_command_ids, "only_finished": True}
+    )
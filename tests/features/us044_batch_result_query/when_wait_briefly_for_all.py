@@ -0,0 +1,15 @@
+import time
+
+
+def execute(context):
+    """Wait for all 3 commands with a short wait"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    batch_started = time.time()
+    context.batch_response = context.test_client.post(
+        f"{context.results_endpoint}/batch",
+        json={"command_ids": context.command_ids, "wait_mode": "all", "wait_seconds": 0.3}
+    )
+    context.batch_elapsed_seconds = time.time() - batch_started
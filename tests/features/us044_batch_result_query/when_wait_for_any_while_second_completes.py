@@ -0,0 +1,26 @@
+import threading
+import time
+
+
+def execute(context):
+    """Wait for any of the unfinished commands while the second completes half a second later"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    def complete_second_command():
+        time.sleep(0.5)
+        context.test_client.post(
+            context.results_endpoint,
+            json={"command_id": context.command_ids[1], "execution_status": "completed", "result_content": "pong"}
+        )
+    completer = threading.Thread(target=complete_second_command)
+    completer.start()
+    
+    batch_started = time.time()
+    context.batch_response = context.test_client.post(
+        f"{context.results_endpoint}/batch",
+        json={"command_ids": context.command_ids[1:], "wait_mode": "any", "wait_seconds": 5}
+    )
+    context.batch_elapsed_seconds = time.time() - batch_started
+    completer.join()
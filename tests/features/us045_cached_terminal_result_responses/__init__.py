@@ -0,0 +1 @@
+# US-045: Cached Terminal Result Responses test package
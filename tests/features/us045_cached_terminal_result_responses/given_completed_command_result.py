@@ -0,0 +1,12 @@
+from tests.features.us045_cached_terminal_result_responses import given_pending_command_result
+
+
+def execute(context):
+    """Submit a command and complete its result"""
+    given_pending_command_result.execute(context)
+    
+    result_response = context.test_client.post(
+        context.results_endpoint,
+        json={"command_id": context.command_id, "execution_status": "completed", "result_content": "up 3 days"}
+    )
+    assert result_response.status_code == 200
@@ -0,0 +1,22 @@
+import uuid
+
+
+def execute(context):
+    """Submit a command whose result is still pending"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.GIVEN
+    
+    # Shared service singletons outlive a scenario, so every scenario uses its own session
+    context.session_id = f"test-session-etag-{uuid.uuid4().hex[:8]}"
+    context.client_id = "client-etag"
+    context.results_endpoint = f"/api/sessions/{context.session_id}/results"
+    context.test_client.post(f"/api/sessions/{context.session_id}/poll", json={"client_id": context.client_id})
+    
+    submit_response = context.test_client.post(
+        f"/api/sessions/{context.session_id}/commands/submit",
+        json={"command_content": "uptime", "target_client_id": context.client_id}
+    )
+    assert submit_response.status_code == 200
+    context.command_id = submit_response.json()["command_id"]
+    context.result_endpoint = f"{context.results_endpoint}/{context.command_id}"
@@ -0,0 +1,35 @@
+from pytest_bdd import scenarios, given, when, then
+# 遵循絕對 import 規則 - 不使用相對 import
+from tests.features.us045_cached_terminal_result_responses import given_completed_command_result
+from tests.features.us045_cached_terminal_result_responses import given_pending_command_result
+from tests.features.us045_cached_terminal_result_responses import when_query_result_twice_with_etag
+from tests.features.us045_cached_terminal_result_responses import when_remember_pending_etag_and_complete
+from tests.features.us045_cached_terminal_result_responses import then_repeat_query_not_modified
+from tests.features.us045_cached_terminal_result_responses import then_stale_etag_returns_completed_result
+
+# Load scenarios from feature file
+scenarios('story.feature')
+
+@given('a command has been submitted and its result has completed')
+def step_given_completed_command_result(context):
+    return given_completed_command_result.execute(context)
+
+@given('a command has been submitted and its result is still pending')
+def step_given_pending_command_result(context):
+    return given_pending_command_result.execute(context)
+
+@when('I query the result and then query it again with its ETag')
+def step_when_query_result_twice_with_etag(context):
+    return when_query_result_twice_with_etag.execute(context)
+
+@when('I remember the pending result ETag and the client completes the command')
+def step_when_remember_pending_etag_and_complete(context):
+    return when_remember_pending_etag_and_complete.execute(context)
+
+@then('the second query should return 304 without a body')
+def step_then_repeat_query_not_modified(context):
+    return then_repeat_query_not_modified.execute(context)
+
+@then('querying with the stale ETag should return the completed result with a new ETag')
+def step_then_stale_etag_returns_completed_result(context):
+    return then_stale_etag_returns_completed_result.execute(context)
@@ -0,0 +1,14 @@
+Feature: Cached Terminal Result Responses
+  As an AI caller polling finished commands
+  I want repeated result queries to be answered from a cache with an ETag
+  So that re-checking a result I already have costs almost nothing
+
+  Scenario: Repeated query of a finished result is answered with 304
+    Given a command has been submitted and its result has completed
+    When I query the result and then query it again with its ETag
+    Then the second query should return 304 without a body
+
+  Scenario: A stale ETag gets the updated result
+    Given a command has been submitted and its result is still pending
+    When I remember the pending result ETag and the client completes the command
+    Then querying with the stale ETag should return the completed result with a new ETag
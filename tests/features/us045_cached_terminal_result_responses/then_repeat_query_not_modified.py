@@ -0,0 +1,18 @@
+def execute(context):
+    """Verify the first query carries a strong ETag and the repeat gets 304"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.first_query_response.status_code == 200
+    first_result = context.first_query_response.json()
+    assert first_result["command_id"] == context.command_id
+    assert first_result["execution_status"] == "completed"
+    assert first_result["result_content"] == "up 3 days"
+    
+    etag = context.first_query_response.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    
+    assert context.repeat_query_response.status_code == 304
+    assert context.repeat_query_response.content == b""
+    assert context.repeat_query_response.headers["ETag"] == etag
@@ -0,0 +1,11 @@
+def execute(context):
+    """Verify a stale ETag is not treated as a match"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.THEN
+    
+    assert context.stale_etag_query_response.status_code == 200
+    completed_result = context.stale_etag_query_response.json()
+    assert completed_result["execution_status"] == "completed"
+    assert completed_result["result_content"] == "up 3 days"
+    assert context.stale_etag_query_response.headers["ETag"] != context.pending_etag
@@ -0,0 +1,11 @@
+def execute(context):
+    """Query the finished result, then query again sending its ETag"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    context.first_query_response = context.test_client.get(context.result_endpoint)
+    context.repeat_query_response = context.test_client.get(
+        context.result_endpoint,
+        headers={"If-None-Match": context.first_query_response.headers["ETag"]}
+    )
@@ -0,0 +1,20 @@
+def execute(context):
+    """Query the pending result, let the client complete it, then query with the old ETag"""
+    from conftest import BDDPhase
+    
+    context.phase = BDDPhase.WHEN
+    
+    pending_query_response = context.test_client.get(context.result_endpoint)
+    assert pending_query_response.json()["execution_status"] == "pending"
+    context.pending_etag = pending_query_response.headers["ETag"]
+    
+    result_response = context.test_client.post(
+        context.results_endpoint,
+        json={"command_id": context.command_id, "execution_status": "completed", "result_content": "up 3 days"}
+    )
+    assert result_response.status_code == 200
+    
+    context.stale_etag_query_response = context.test_client.get(
+        context.result_endpoint,
+        headers={"If-None-Match": context.pending_etag}
+    )